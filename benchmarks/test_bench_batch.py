@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+
+from resource_id import batch  # noqa: E402
+
+_rng = random.Random(62)
+RECORDS = np.frombuffer(_rng.randbytes(16 * 100_000), dtype=np.uint8).reshape(-1, 16)
+HI, LO = batch.split_records(RECORDS)
+ENCODED = batch.b62encode(HI, LO)
+
+
+def test_batch_b62encode(benchmark: BenchmarkFixture):
+    benchmark(batch.b62encode, HI, LO)
+
+
+def test_batch_b62decode(benchmark: BenchmarkFixture):
+    benchmark(batch.b62decode, ENCODED)
+
+
+def test_batch_shard(benchmark: BenchmarkFixture):
+    benchmark(batch.shard, HI, LO, 64)
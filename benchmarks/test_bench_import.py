@@ -0,0 +1,51 @@
+"""Import cost of resource_id in a fresh interpreter.
+
+Each round starts a new Python process, so the timings include interpreter
+start-up; the start-up-only benchmark in the same group is the baseline to
+subtract.  extra_info records the cumulative import time of the package as
+reported by ``python -X importtime``, which excludes start-up.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def _import_time_us(code: str, module: str) -> int:
+    """Return the cumulative -X importtime of module, in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and not name.startswith("  "):
+            return int(cumulative)
+    raise AssertionError(f"{module} not in -X importtime output")
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "pass",
+        "import resource_id",
+        "import resource_id, pydantic; pydantic.TypeAdapter(resource_id.ResourceId)",
+    ],
+    ids=["startup", "resource_id", "resource_id+pydantic"],
+)
+@pytest.mark.benchmark(group="import")
+def test_import(benchmark: BenchmarkFixture, code: str):
+    if code != "pass":
+        benchmark.extra_info["importtime_us"] = _import_time_us(code, "resource_id")
+    benchmark.pedantic(_run, args=(code,), rounds=10, warmup_rounds=1)
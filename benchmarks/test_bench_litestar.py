@@ -0,0 +1,63 @@
+"""Litestar routing of ResourceId path and query parameters."""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("litestar")
+
+from litestar import Litestar, get  # noqa: E402
+from litestar.testing import TestClient  # noqa: E402
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+
+from resource_id import ResourceId  # noqa: E402
+from resource_id.litestar import (  # noqa: E402
+    ResourceIdListQueryParameter,
+    ResourceIdPathParameter,
+)
+
+_rng = random.Random(62)
+IDS = [ResourceId(_rng.getrandbits(128)) for _ in range(100)]
+
+
+@get("/r/{rid:resourceid}")
+async def get_by_id(rid: ResourceIdPathParameter) -> None:
+    pass
+
+
+@get("/s/{rid:str}")
+async def get_by_str(rid: str) -> None:
+    pass
+
+
+@get("/batch")
+async def get_batch(ids: ResourceIdListQueryParameter) -> None:
+    pass
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(Litestar([get_by_id, get_by_str, get_batch])) as client:
+        yield client
+
+
+@pytest.mark.benchmark(group="litestar-path-param")
+def test_litestar_str_path_param(benchmark: BenchmarkFixture, client: TestClient):
+    # The same route with a plain str parameter: the routing baseline.
+    paths = [f"/s/{rid}" for rid in IDS]
+    benchmark(lambda: [client.get(path) for path in paths])
+
+
+@pytest.mark.benchmark(group="litestar-path-param")
+def test_litestar_resource_id_path_param(
+    benchmark: BenchmarkFixture, client: TestClient
+):
+    paths = [f"/r/{rid}" for rid in IDS]
+    benchmark(lambda: [client.get(path) for path in paths])
+
+
+@pytest.mark.benchmark(group="litestar-query-param")
+def test_litestar_id_list_query_param(benchmark: BenchmarkFixture, client: TestClient):
+    url = f"/batch?ids={','.join(map(str, IDS))}"
+    benchmark(client.get, url)
@@ -0,0 +1,43 @@
+"""A list-of-ids JSON response and request body, through pydantic and msgspec."""
+
+import json
+import random
+
+import pydantic
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+msgspec = pytest.importorskip("msgspec")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+
+from resource_id import ResourceId  # noqa: E402
+from resource_id.msgspec import dec_hook, enc_hook  # noqa: E402
+
+_rng = random.Random(62)
+IDS = [ResourceId(_rng.getrandbits(128)) for _ in range(1000)]
+JSON_LIST = json.dumps([str(rid) for rid in IDS]).encode()
+
+PYDANTIC_ADAPTER = pydantic.TypeAdapter(list[ResourceId])
+MSGSPEC_ENCODER = msgspec.json.Encoder(enc_hook=enc_hook)
+MSGSPEC_DECODER = msgspec.json.Decoder(list[ResourceId], dec_hook=dec_hook)
+
+
+@pytest.mark.benchmark(group="list-of-ids-encode")
+def test_encode_list_pydantic(benchmark: BenchmarkFixture):
+    benchmark(PYDANTIC_ADAPTER.dump_json, IDS)
+
+
+@pytest.mark.benchmark(group="list-of-ids-encode")
+def test_encode_list_msgspec(benchmark: BenchmarkFixture):
+    benchmark(MSGSPEC_ENCODER.encode, IDS)
+
+
+@pytest.mark.benchmark(group="list-of-ids-decode")
+def test_decode_list_pydantic(benchmark: BenchmarkFixture):
+    benchmark(PYDANTIC_ADAPTER.validate_json, JSON_LIST)
+
+
+@pytest.mark.benchmark(group="list-of-ids-decode")
+def test_decode_list_msgspec(benchmark: BenchmarkFixture):
+    benchmark(MSGSPEC_DECODER.decode, JSON_LIST)
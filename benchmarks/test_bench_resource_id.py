@@ -0,0 +1,300 @@
+"""Benchmarks for the ResourceId hot paths.
+
+Run with ``uv run pytest benchmarks``; ``pytest tests`` does not collect them.
+"""
+
+import json
+import random
+from uuid import UUID
+
+import pydantic
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+
+from resource_id import (  # noqa: E402
+    ResourceIdArray,
+    ResourceIdBloomFilter,
+    ResourceIdIndex,
+    ResourceIdList,
+    ResourceIdSet,
+)
+from resource_id import asyncpg as asyncpg_codec  # noqa: E402
+from resource_id import metrics  # noqa: E402
+from resource_id.resource_id import ResourceId, b62decode, b62encode  # noqa: E402
+
+_rng = random.Random(62)
+UUID_VALUES = [_rng.getrandbits(128) for _ in range(1000)]
+
+
+def test_b62encode_uuid_values(benchmark: BenchmarkFixture):
+    benchmark(lambda: [b62encode(value) for value in UUID_VALUES])
+
+
+BASE62_VALUES = [b62encode(value) for value in UUID_VALUES]
+# Scanner-style junk: the right length, but with a bad character at the end.
+INVALID_VALUES = [value[:-1] + "!" for value in BASE62_VALUES]
+
+
+def test_b62decode_uuid_values(benchmark: BenchmarkFixture):
+    benchmark(lambda: [b62decode(value) for value in BASE62_VALUES])
+
+
+def test_is_valid_rejects_invalid(benchmark: BenchmarkFixture):
+    benchmark(lambda: [ResourceId.is_valid(value) for value in INVALID_VALUES])
+
+
+def test_str_repeated(benchmark: BenchmarkFixture):
+    # The same id stringified several times, as in URL building and logging.
+    ids = [ResourceId(value) for value in UUID_VALUES]
+    benchmark(lambda: [(str(rid), str(rid), str(rid)) for rid in ids])
+
+
+def test_from_str_cached_hot_ids(benchmark: BenchmarkFixture):
+    # A few popular ids make up most lookups.
+    hot = BASE62_VALUES[:50] * 20
+    benchmark(lambda: [ResourceId.from_str_cached(value) for value in hot])
+
+
+def test_resource_id_array_contains_sorted(benchmark: BenchmarkFixture):
+    ids = ResourceIdArray(UUID_VALUES * 10)
+    ids.sort()
+    probes = [ResourceId(value) for value in UUID_VALUES[:100]]
+    benchmark(lambda: [probe in ids for probe in probes])
+
+
+# Construction from each accepted input type; a short base62 id is what a
+# small int encodes to, a long one what a random 128-bit id encodes to.
+CONSTRUCT_INPUTS = {
+    "base62-short": [b62encode(value >> 96) for value in UUID_VALUES],
+    "base62-long": BASE62_VALUES,
+    "uuid-str": [str(UUID(int=value)) for value in UUID_VALUES],
+    "uuid-hex": [UUID(int=value).hex for value in UUID_VALUES],
+    "uuid": [UUID(int=value) for value in UUID_VALUES],
+    "int": UUID_VALUES,
+    "bytes": [value.to_bytes(16, "big") for value in UUID_VALUES],
+    "resource-id": [ResourceId(value) for value in UUID_VALUES],
+}
+
+
+@pytest.mark.parametrize("kind", CONSTRUCT_INPUTS)
+@pytest.mark.benchmark(group="construct")
+def test_construct(benchmark: BenchmarkFixture, kind: str):
+    values = CONSTRUCT_INPUTS[kind]
+    benchmark(lambda: [ResourceId(value) for value in values])
+
+
+# The type-specialized constructors, on the same inputs as test_construct.
+SPECIALIZED_CONSTRUCTORS = {
+    "base62-short-from_base62": ("base62-short", ResourceId.from_base62),
+    "base62-long-from_base62": ("base62-long", ResourceId.from_base62),
+    "base62-long-from_str": ("base62-long", ResourceId.from_str),
+    "uuid-str-from_str": ("uuid-str", ResourceId.from_str),
+    "uuid-from_uuid": ("uuid", ResourceId.from_uuid),
+    "int-from_int": ("int", ResourceId.from_int),
+    "int-from_trusted_int": ("int", ResourceId.from_trusted_int),
+    "bytes-from_bytes": ("bytes", ResourceId.from_bytes),
+}
+
+
+@pytest.mark.parametrize("kind", SPECIALIZED_CONSTRUCTORS)
+@pytest.mark.benchmark(group="construct")
+def test_construct_specialized(benchmark: BenchmarkFixture, kind: str):
+    inputs, constructor = SPECIALIZED_CONSTRUCTORS[kind]
+    values = CONSTRUCT_INPUTS[inputs]
+    benchmark(lambda: [constructor(value) for value in values])
+
+
+@pytest.mark.parametrize("sample_every", [0, 100])
+@pytest.mark.benchmark(group="construct-metrics")
+def test_construct_with_metrics(benchmark: BenchmarkFixture, sample_every: int):
+    # Compare with construct[base62-long] for the cost of instrumentation.
+    values = CONSTRUCT_INPUTS["base62-long"]
+    metrics.enable(metrics.Counters(), sample_every=sample_every)
+    try:
+        benchmark(lambda: [ResourceId(value) for value in values])
+    finally:
+        metrics.disable()
+
+
+IDS = [ResourceId(value) for value in UUID_VALUES]
+OTHER_IDS = [ResourceId(value) for value in UUID_VALUES]
+
+
+@pytest.mark.benchmark(group="dunder")
+def test_str_first_use(benchmark: BenchmarkFixture):
+    # Fresh instances each round, so every str() encodes.
+    benchmark.pedantic(
+        lambda ids: [str(rid) for rid in ids],
+        setup=lambda: (([ResourceId(value) for value in UUID_VALUES],), {}),
+        rounds=200,
+    )
+
+
+@pytest.mark.benchmark(group="dunder")
+def test_hash(benchmark: BenchmarkFixture):
+    benchmark(lambda: [hash(rid) for rid in IDS])
+
+
+@pytest.mark.benchmark(group="dunder")
+def test_eq(benchmark: BenchmarkFixture):
+    benchmark(lambda: [a == b for a, b in zip(IDS, OTHER_IDS)])
+
+
+@pytest.mark.benchmark(group="dunder")
+def test_sort(benchmark: BenchmarkFixture):
+    benchmark(sorted, IDS)
+
+
+@pytest.mark.benchmark(group="dunder")
+def test_dict_lookup(benchmark: BenchmarkFixture):
+    table = dict.fromkeys(IDS)
+    benchmark(lambda: [rid in table for rid in OTHER_IDS])
+
+
+SCALAR_ADAPTER = pydantic.TypeAdapter(ResourceId)
+SCALAR_INPUTS = {
+    "str": BASE62_VALUES[0],
+    "int": UUID_VALUES[0],
+    "uuid": UUID(int=UUID_VALUES[0]),
+    "resource-id": IDS[0],
+}
+
+
+@pytest.mark.parametrize("kind", SCALAR_INPUTS)
+@pytest.mark.benchmark(group="pydantic-scalar")
+def test_pydantic_validate_python(benchmark: BenchmarkFixture, kind: str):
+    benchmark(SCALAR_ADAPTER.validate_python, SCALAR_INPUTS[kind])
+
+
+@pytest.mark.benchmark(group="pydantic-scalar")
+def test_pydantic_validate_json(benchmark: BenchmarkFixture):
+    benchmark(SCALAR_ADAPTER.validate_json, json.dumps(BASE62_VALUES[0]))
+
+
+@pytest.mark.benchmark(group="pydantic-scalar")
+def test_pydantic_dump_python(benchmark: BenchmarkFixture):
+    benchmark(SCALAR_ADAPTER.dump_python, IDS[0], mode="json")
+
+
+@pytest.mark.benchmark(group="pydantic-scalar")
+def test_pydantic_dump_json(benchmark: BenchmarkFixture):
+    benchmark(SCALAR_ADAPTER.dump_json, IDS[0])
+
+
+LIST_ADAPTER = pydantic.TypeAdapter(list[ResourceId])
+JSON_LIST = json.dumps(BASE62_VALUES).encode()
+
+
+def test_pydantic_validate_json_list(benchmark: BenchmarkFixture):
+    benchmark(LIST_ADAPTER.validate_json, JSON_LIST)
+
+
+def test_pydantic_validate_instances(benchmark: BenchmarkFixture):
+    ids = LIST_ADAPTER.validate_json(JSON_LIST)
+    benchmark(LIST_ADAPTER.validate_python, ids)
+
+
+def test_pydantic_dump_json_list(benchmark: BenchmarkFixture):
+    ids = [ResourceId(value) for value in UUID_VALUES]
+    benchmark(LIST_ADAPTER.dump_json, ids)
+
+
+LARGE_IDS = [ResourceId(_rng.getrandbits(128)) for _ in range(10_000)]
+LARGE_JSON_LIST = json.dumps([str(rid) for rid in LARGE_IDS]).encode()
+
+
+@pytest.mark.benchmark(group="pydantic-large-list")
+def test_pydantic_validate_json_large_list(benchmark: BenchmarkFixture):
+    benchmark(LIST_ADAPTER.validate_json, LARGE_JSON_LIST)
+
+
+@pytest.mark.benchmark(group="pydantic-large-list")
+def test_pydantic_dump_json_large_list(benchmark: BenchmarkFixture):
+    benchmark(LIST_ADAPTER.dump_json, LARGE_IDS)
+
+
+def test_generate_random(benchmark: BenchmarkFixture):
+    benchmark(lambda: [ResourceId() for _ in range(1000)])
+
+
+def test_generate_ordered(benchmark: BenchmarkFixture):
+    benchmark(lambda: [ResourceId.new_ordered() for _ in range(1000)])
+
+
+def test_generate_many(benchmark: BenchmarkFixture):
+    benchmark(ResourceId.generate_many, 1000)
+
+
+def test_generate_array(benchmark: BenchmarkFixture):
+    benchmark(ResourceIdArray.generate, 1000)
+
+
+# The asyncpg codec on a fetched result set: decode every row's uuid column.
+WIRE_VALUES = [value.to_bytes(16, "big") for value in UUID_VALUES]
+
+
+def test_asyncpg_decode_rows(benchmark: BenchmarkFixture):
+    benchmark(lambda: list(map(asyncpg_codec.decode, WIRE_VALUES)))
+
+
+def test_asyncpg_encode_args(benchmark: BenchmarkFixture):
+    ids = [ResourceId(value) for value in UUID_VALUES]
+    benchmark(lambda: list(map(asyncpg_codec.encode, ids)))
+
+
+ID_LIST = ",".join(BASE62_VALUES[:500])
+
+
+def test_id_list_parse(benchmark: BenchmarkFixture):
+    benchmark(ResourceIdList.parse, ID_LIST)
+
+
+def test_shard_many(benchmark: BenchmarkFixture):
+    ids = [ResourceId(value) for value in UUID_VALUES]
+    benchmark(ResourceId.shard_many, ids, 64)
+
+
+def test_resource_id_array_shards(benchmark: BenchmarkFixture):
+    benchmark(ResourceIdArray(UUID_VALUES).shards, 64)
+
+
+ID_SET = ResourceIdSet(UUID_VALUES * 10)
+PROBES = [ResourceId(value) for value in UUID_VALUES[:100]]
+
+
+def test_resource_id_set_build(benchmark: BenchmarkFixture):
+    benchmark(ResourceIdSet, UUID_VALUES)
+
+
+def test_resource_id_set_contains(benchmark: BenchmarkFixture):
+    benchmark(lambda: [probe in ID_SET for probe in PROBES])
+
+
+def test_resource_id_set_union(benchmark: BenchmarkFixture):
+    other = ResourceIdSet(_rng.getrandbits(128) for _ in range(1000))
+    benchmark(ID_SET.union, other)
+
+
+def test_bloom_filter_contains(benchmark: BenchmarkFixture):
+    bloom = ResourceIdBloomFilter(len(UUID_VALUES))
+    bloom.update(UUID_VALUES)
+    benchmark(lambda: [probe in bloom for probe in PROBES])
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("index") / "ids.ridx"
+    ResourceIdIndex.write(path, ID_SET)
+    return path
+
+
+def test_resource_id_index_open(benchmark: BenchmarkFixture, index_path):
+    benchmark(ResourceIdIndex, index_path)
+
+
+def test_resource_id_index_contains(benchmark: BenchmarkFixture, index_path):
+    index = ResourceIdIndex(index_path)
+    benchmark(lambda: [probe in index for probe in PROBES])
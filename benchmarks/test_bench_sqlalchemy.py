@@ -0,0 +1,83 @@
+"""SQLAlchemy on SQLite: ResourceIdType against a string round-trip type.
+
+StrUuid is the usual hand-written TypeDecorator, converting through
+``str(rid.uuid)`` on bind and ``ResourceId(UUID(s))`` on each row.
+"""
+
+import random
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("sqlalchemy")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+from sqlalchemy import (  # noqa: E402
+    CHAR,
+    Column,
+    Engine,
+    MetaData,
+    Table,
+    create_engine,
+    select,
+)
+from sqlalchemy.types import TypeDecorator  # noqa: E402
+
+from resource_id import ResourceId  # noqa: E402
+from resource_id.sqlalchemy import ResourceIdType  # noqa: E402
+
+ROWS = 100_000
+
+_rng = random.Random(62)
+IDS = [ResourceId(_rng.getrandbits(128)) for _ in range(ROWS)]
+PARAMS = [{"id": rid} for rid in IDS]
+
+
+class StrUuid(TypeDecorator[ResourceId]):
+    impl = CHAR(36)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> str | None:
+        return None if value is None else str(value.uuid)
+
+    def process_result_value(self, value: Any, dialect: Any) -> ResourceId | None:
+        return None if value is None else ResourceId(UUID(value))
+
+
+COLUMN_TYPES = {"resource-id-type": ResourceIdType, "str-uuid": StrUuid}
+
+
+def _table(column_type: Any) -> tuple[Engine, Table]:
+    engine = create_engine("sqlite://")
+    table = Table("widget", MetaData(), Column("id", column_type, primary_key=True))
+    table.metadata.create_all(engine)
+    return engine, table
+
+
+@pytest.mark.parametrize("kind", COLUMN_TYPES)
+@pytest.mark.benchmark(group="sqlalchemy-insert")
+def test_insert_many(benchmark: BenchmarkFixture, kind: str):
+    engine, table = _table(COLUMN_TYPES[kind])
+
+    def insert() -> None:
+        with engine.begin() as conn:
+            conn.execute(table.delete())
+            conn.execute(table.insert(), PARAMS)
+
+    benchmark.pedantic(insert, rounds=3)
+
+
+@pytest.mark.parametrize("kind", COLUMN_TYPES)
+@pytest.mark.benchmark(group="sqlalchemy-select")
+def test_select_all(benchmark: BenchmarkFixture, kind: str):
+    engine, table = _table(COLUMN_TYPES[kind])
+    with engine.begin() as conn:
+        conn.execute(table.insert(), PARAMS)
+
+    def fetch() -> list[ResourceId]:
+        with engine.connect() as conn:
+            return list(conn.execute(select(table.c.id)).scalars())
+
+    assert len(benchmark.pedantic(fetch, rounds=3)) == ROWS
@@ -0,0 +1,55 @@
+"""FastAPI path-parameter routing: pydantic after routing vs the convertor."""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+fastapi = pytest.importorskip("fastapi")
+
+from pytest_benchmark.fixture import BenchmarkFixture  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+import resource_id.starlette  # noqa: E402, F401
+from resource_id import ResourceId  # noqa: E402
+
+_rng = random.Random(62)
+PATHS = [f"/r/{ResourceId(_rng.getrandbits(128))}" for _ in range(100)]
+
+
+def _client(path: str) -> TestClient:
+    app = fastapi.FastAPI()
+
+    @app.get(path)
+    async def get_widget(rid: ResourceId) -> None:
+        pass
+
+    return TestClient(app)
+
+
+@pytest.mark.benchmark(group="fastapi-path-param")
+def test_fastapi_pydantic_path_param(benchmark: BenchmarkFixture):
+    with _client("/r/{rid}") as client:
+        benchmark(lambda: [client.get(path) for path in PATHS])
+
+
+@pytest.mark.benchmark(group="fastapi-path-param")
+def test_fastapi_convertor_path_param(benchmark: BenchmarkFixture):
+    with _client("/r/{rid:resourceid}") as client:
+        benchmark(lambda: [client.get(path) for path in PATHS])
+
+
+# Scanner-style junk: rejected by pydantic with a 422, or by the router with a 404.
+BAD_PATHS = [path[:-1] + "!" for path in PATHS]
+
+
+@pytest.mark.benchmark(group="fastapi-path-param-invalid")
+def test_fastapi_pydantic_path_param_invalid(benchmark: BenchmarkFixture):
+    with _client("/r/{rid}") as client:
+        benchmark(lambda: [client.get(path) for path in BAD_PATHS])
+
+
+@pytest.mark.benchmark(group="fastapi-path-param-invalid")
+def test_fastapi_convertor_path_param_invalid(benchmark: BenchmarkFixture):
+    with _client("/r/{rid:resourceid}") as client:
+        benchmark(lambda: [client.get(path) for path in BAD_PATHS])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Record benchmark baselines, and fail when a benchmark regresses against one.
+
+A thin wrapper around pytest-benchmark's storage and comparison options.
+Baselines are saved runs in ``benchmarks/baselines/``, filed by pytest-benchmark
+under a directory per machine id (platform, Python implementation and version,
+word size), so a run is only ever compared with a baseline from the same kind
+of machine.  Timings from different hardware are not comparable: record the
+baseline on the machine that runs the check.
+
+``check`` compares each benchmark's statistic (``min`` by default, the least
+noisy) with the latest baseline and exits non-zero if any is slower by more
+than the threshold.  It also fails if there is no baseline for this machine,
+rather than passing without comparing anything.
+
+Usage:
+    python scripts/bench.py save                  # record a baseline
+    python scripts/bench.py check                 # fail on a >15% regression
+    python scripts/bench.py check --threshold 25 --stat median -- -k pydantic
+
+Arguments after ``--`` are passed to pytest.
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest_benchmark.utils import get_machine_id
+
+ROOT = Path(__file__).resolve().parent.parent
+STORAGE = ROOT / "benchmarks" / "baselines"
+
+
+def _pytest(options: list[str], extra: list[str]) -> int:
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        str(ROOT / "benchmarks"),
+        "--benchmark-only",
+        f"--benchmark-storage=file://{STORAGE}",
+        *options,
+        *extra,
+    ]
+    return subprocess.run(command, cwd=ROOT, check=False).returncode
+
+
+def save(args: argparse.Namespace) -> int:
+    return _pytest([f"--benchmark-save={args.name}"], args.pytest_args)
+
+
+def check(args: argparse.Namespace) -> int:
+    baselines = sorted((STORAGE / get_machine_id()).glob("*.json"))
+    if not baselines:
+        print(
+            f"No baseline for {get_machine_id()} in {STORAGE}; "
+            "record one with 'python scripts/bench.py save'.",
+            file=sys.stderr,
+        )
+        return 2
+    return _pytest(
+        [
+            f"--benchmark-compare={baselines[-1].stem.split('_')[0]}",
+            f"--benchmark-compare-fail={args.stat}:{args.threshold:g}%",
+        ],
+        args.pytest_args,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save_parser = commands.add_parser("save", help="record a baseline")
+    save_parser.add_argument(
+        "--name", default="baseline", help="name of the saved run (default: baseline)"
+    )
+    save_parser.set_defaults(run=save)
+
+    check_parser = commands.add_parser("check", help="compare with the baseline")
+    check_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=15,
+        help="allowed slowdown, in percent (default: 15)",
+    )
+    check_parser.add_argument(
+        "--stat",
+        choices=["min", "max", "mean", "median", "stddev", "iqr"],
+        default="min",
+        help="statistic to compare (default: min)",
+    )
+    check_parser.set_defaults(run=check)
+
+    for subparser in (save_parser, check_parser):
+        subparser.add_argument("pytest_args", nargs="*", help="passed to pytest")
+
+    args = parser.parse_args()
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,33 @@
-from importlib.metadata import PackageNotFoundError, metadata
-
+from .idarray import ResourceIdArray
+from .idindex import ResourceIdIndex
+from .idlist import ResourceIdList, ResourceIdListError
+from .idset import ResourceIdBloomFilter, ResourceIdSet
 from .resource_id import ResourceId
+from .sortable import SortableResourceId
+
+__all__ = [
+    "ResourceId",
+    "ResourceIdArray",
+    "ResourceIdBloomFilter",
+    "ResourceIdIndex",
+    "ResourceIdList",
+    "ResourceIdListError",
+    "ResourceIdSet",
+    "SortableResourceId",
+]
 
-__all__ = ["ResourceId"]
 
+def __getattr__(name: str) -> str:
+    # __version__ is looked up on first use: importlib.metadata costs about as
+    # much to import as the rest of the package.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib.metadata import PackageNotFoundError, metadata
 
-try:
-    __version__: str = metadata(__name__)["version"]
-except PackageNotFoundError:  # pragma: no cover
-    # package is not installed
-    __version__ = ""
+    global __version__
+    try:
+        __version__ = metadata(__name__)["version"]
+    except PackageNotFoundError:  # pragma: no cover
+        # package is not installed
+        __version__ = ""
+    return __version__
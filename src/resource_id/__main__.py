@@ -0,0 +1,286 @@
+"""Convert ids between forms: ``python -m resource_id``.
+
+Reads ids, one per line, from files or stdin and writes them in another form,
+in input order::
+
+    python -m resource_id --to uuid ids.txt > uuids.txt
+    python -m resource_id --from uuid --to base62 < uuids.txt
+
+Input forms (``--from``): ``auto`` (the default: base62 or a UUID, as
+ResourceId accepts a str), ``base62``, ``uuid`` (dashed or not), ``int`` and
+``sortable`` (SortableResourceId's encoding).  Output forms (``--to``):
+``base62`` (the default), ``uuid``, ``hex``, ``int`` and ``sortable``.  An int
+is only read with ``--from int``, since a string of digits is also base62.
+Unlike ResourceId, a UUID line may not have a sign or underscores.
+
+Blank lines are skipped.  A malformed line is reported on stderr with its file
+name and line number and left out of the output, and a file that cannot be
+opened is reported and skipped; the exit status is 1 if there were any.
+Input is cut into chunks of whole lines, read from a memory map for regular
+files, and converted across a process pool (``--jobs``).
+"""
+
+import argparse
+import mmap
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import BinaryIO
+from uuid import UUID
+
+from .resource_id import (
+    _MAX_BASE62_ID_LEN,
+    UUID_BITS,
+    _ordered_str_to_int,
+    b62decode,
+    b62encode,
+    b62encode_ordered,
+)
+
+_CHUNK_BYTES = 1 << 20
+
+
+def _parse_int(text: str) -> int:
+    if not (text.isascii() and text.isdigit()):
+        raise ValueError(f"invalid int {text!r}")
+    return int(text)
+
+
+def _parse_uuid(text: str) -> int:
+    # Parsing dominates a single-process run, so the dashed and 32-digit hex
+    # forms skip building a UUID, which takes about three times as long.
+    # int() would also accept a sign, whitespace and underscores, which
+    # UUID() tolerates but a line of this tool does not.
+    if len(text) == 36 and text[8] == text[13] == text[18] == text[23] == "-":
+        digits = text.replace("-", "")
+    elif len(text) == 32:
+        digits = text
+    else:
+        return UUID(text).int
+    if len(digits) == 32 and digits.isascii() and digits.isalnum():
+        return int(digits, 16)
+    raise ValueError(f"invalid UUID {text!r}")
+
+
+def _parse_auto(text: str) -> int:
+    # As ResourceId accepts a str: no base62 id is longer than
+    # _MAX_BASE62_ID_LEN chars, so a longer line is tried as a UUID first.
+    if len(text) > _MAX_BASE62_ID_LEN:
+        try:
+            return _parse_uuid(text)
+        except ValueError:
+            pass
+    return b62decode(text)
+
+
+_PARSERS: dict[str, Callable[[str], int]] = {
+    "auto": _parse_auto,
+    "base62": b62decode,
+    "uuid": _parse_uuid,
+    "int": _parse_int,
+    "sortable": _ordered_str_to_int,
+}
+
+
+def _format_uuid(value: int) -> str:
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+_FORMATTERS: dict[str, Callable[[int], str]] = {
+    "base62": b62encode,
+    "uuid": _format_uuid,
+    "hex": lambda value: f"{value:032x}",
+    "int": str,
+    "sortable": b62encode_ordered,
+}
+
+
+def _convert_chunk(
+    chunk: bytes, first_line: int, source: str, target: str
+) -> tuple[bytes, list[tuple[int, str]]]:
+    """Convert the lines of chunk; return the output and the invalid lines.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+    """
+    parse = _PARSERS[source]
+    format_ = _FORMATTERS[target]
+    output: list[str] = []
+    errors: list[tuple[int, str]] = []
+    for line_number, line in enumerate(chunk.split(b"\n"), first_line):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            value = parse(text.decode("ascii"))
+            if value >> UUID_BITS:
+                raise ValueError("out of range")
+            output.append(format_(value))
+        except ValueError:
+            errors.append((line_number, text.decode("utf-8", "replace")))
+    if not output:
+        return b"", errors
+    return ("\n".join(output) + "\n").encode("ascii"), errors
+
+
+def _stream_chunks(file: BinaryIO) -> Iterator[bytes]:
+    """Yield chunks of whole lines from a buffered binary stream."""
+    rest = b""
+    while block := file.read(_CHUNK_BYTES):
+        block = rest + block
+        cut = block.rfind(b"\n") + 1
+        rest = block[cut:]
+        if cut:
+            yield block[:cut]
+    if rest:
+        yield rest
+
+
+def _mapped_chunks(view: mmap.mmap) -> Iterator[bytes]:
+    """Yield chunks of whole lines from a memory-mapped file."""
+    start, size = 0, len(view)
+    while start < size:
+        end = view.find(b"\n", min(start + _CHUNK_BYTES, size) - 1)
+        end = size if end < 0 else end + 1
+        yield view[start:end]
+        start = end
+
+
+def _read_chunks(path: str) -> Iterator[bytes]:
+    """Open path, or stdin for "-", and return its chunks of whole lines.
+
+    The file is opened before this returns, so a missing or unreadable file
+    raises OSError here rather than partway through the output.
+    """
+    if path == "-":
+        return _stream_chunks(sys.stdin.buffer)
+    return _file_chunks(open(path, "rb"))
+
+
+def _file_chunks(file: BinaryIO) -> Iterator[bytes]:
+    with file:
+        try:
+            view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and pipes cannot be mapped.
+            yield from _stream_chunks(file)
+            return
+        with view:
+            yield from _mapped_chunks(view)
+
+
+def _numbered(chunks: Iterable[bytes]) -> Iterator[tuple[bytes, int]]:
+    """Pair each chunk with the line number of its first line."""
+    line_number = 1
+    for chunk in chunks:
+        yield chunk, line_number
+        line_number += chunk.count(b"\n")
+
+
+def _map_ordered(
+    executor: Executor | None,
+    tasks: Iterable[tuple[bytes, int]],
+    source: str,
+    target: str,
+    window: int,
+) -> Iterator[tuple[bytes, list[tuple[int, str]]]]:
+    """Convert chunks, in order, keeping at most window chunks in flight."""
+    if executor is None:
+        for chunk, first_line in tasks:
+            yield _convert_chunk(chunk, first_line, source, target)
+        return
+    pending: deque[Future[tuple[bytes, list[tuple[int, str]]]]] = deque()
+    for chunk, first_line in tasks:
+        pending.append(
+            executor.submit(_convert_chunk, chunk, first_line, source, target)
+        )
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m resource_id",
+        description="Convert ids, one per line, between forms.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="input files; '-' or none reads stdin",
+    )
+    parser.add_argument(
+        "--from",
+        dest="source",
+        choices=_PARSERS,
+        default="auto",
+        help="input form (default: auto, base62 or UUID)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="target",
+        choices=_FORMATTERS,
+        default="base62",
+        help="output form (default: base62)",
+    )
+    parser.add_argument("-o", "--output", help="write to this file, not stdout")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes; 1 converts in this process (default: CPU count)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    paths = args.files or ["-"]
+
+    executor = ProcessPoolExecutor(args.jobs) if args.jobs > 1 else None
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    failed = False
+    try:
+        for path in paths:
+            name = "<stdin>" if path == "-" else path
+            try:
+                chunks = _read_chunks(path)
+            except OSError as error:
+                failed = True
+                print(f"{name}: {error.strerror or error}", file=sys.stderr)
+                continue
+            results = _map_ordered(
+                executor,
+                _numbered(chunks),
+                args.source,
+                args.target,
+                window=2 * args.jobs,
+            )
+            for converted, errors in results:
+                output.write(converted)
+                for line_number, text in errors:
+                    failed = True
+                    print(
+                        f"{name}:{line_number}: invalid id {text[:80]!r}",
+                        file=sys.stderr,
+                    )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
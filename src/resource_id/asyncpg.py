@@ -0,0 +1,92 @@
+"""asyncpg integration for :class:`ResourceId`.
+
+Registers a binary-format codec for PostgreSQL's ``uuid`` type, so ``uuid``
+columns are fetched as ``ResourceId`` instances and ``ResourceId`` values can be
+passed as query arguments.  The codec maps the 16-byte wire representation
+directly to and from ``ResourceId.value``, with no text round trip and no
+intermediate ``uuid.UUID``::
+
+    import asyncpg
+    from resource_id.asyncpg import register_codec
+
+    pool = await asyncpg.create_pool(dsn, init=register_codec)
+
+    row = await conn.fetchrow("SELECT id FROM widget WHERE id = $1", rid)
+    assert isinstance(row["id"], ResourceId)
+
+Once the codec is registered, ``copy_records_to_table`` (which uses the binary
+COPY format) also accepts ``ResourceId`` values; :func:`copy_ids_to_table`
+wraps it for the common single-column case.
+
+Requires the ``asyncpg`` extra: ``pip install resource-id[asyncpg]``.
+"""
+
+from collections.abc import AsyncIterable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .resource_id import ResourceId, ResourceIdValue
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+
+__all__ = ["copy_ids_to_table", "decode", "encode", "register_codec"]
+
+
+def encode(value: ResourceIdValue) -> bytes:
+    """Encode a value as the 16-byte binary wire form of a PostgreSQL uuid.
+
+    Any value ResourceId accepts may be passed, so plain ``uuid.UUID``
+    arguments keep working on a connection with the codec registered.
+    """
+    if not isinstance(value, ResourceId):
+        value = ResourceId(value)
+    return value.to_bytes()
+
+
+def decode(data: bytes) -> ResourceId:
+    """Decode the 16-byte binary wire form of a PostgreSQL uuid."""
+    return ResourceId.from_bytes(data)
+
+
+async def register_codec(
+    connection: "Connection[Any]", *, schema: str = "pg_catalog"
+) -> None:
+    """Register the binary ResourceId codec for the ``uuid`` type on connection.
+
+    Suitable as the ``init`` callback of ``asyncpg.create_pool``.
+    """
+    await connection.set_type_codec(
+        "uuid", schema=schema, encoder=encode, decoder=decode, format="binary"
+    )
+
+
+async def copy_ids_to_table(
+    connection: "Connection[Any]",
+    table_name: str,
+    ids: Iterable[ResourceIdValue] | AsyncIterable[ResourceIdValue],
+    *,
+    column: str,
+    schema_name: str | None = None,
+    timeout: float | None = None,
+) -> str:
+    """Bulk-load ids into one uuid column of a table with binary COPY.
+
+    The connection must have the codec registered.  Returns the COPY status
+    string, e.g. ``"COPY 1000"``.
+    """
+    if isinstance(ids, AsyncIterable):
+        records: Any = _async_records(ids)
+    else:
+        records = ((value,) for value in ids)
+    return await connection.copy_records_to_table(
+        table_name,
+        records=records,
+        columns=[column],
+        schema_name=schema_name,
+        timeout=timeout,
+    )
+
+
+async def _async_records(ids: AsyncIterable[ResourceIdValue]):
+    async for value in ids:
+        yield (value,)
@@ -0,0 +1,253 @@
+"""A memory-mapped, on-disk index of ResourceIds.
+
+An index file holds sorted, distinct ids as 16-byte big-endian records, each
+optionally followed by a fixed-width payload, such as the new id in a
+migration map.  :class:`ResourceIdIndex` memory-maps the file and binary
+searches the mapped records, so opening an index takes constant time however
+large it is, and processes that open the same file share one copy of it in
+the page cache rather than each parsing it into their own heap::
+
+    ResourceIdIndex.write("blocked.ridx", blocked_ids)
+    blocked = ResourceIdIndex("blocked.ridx")
+    if rid in blocked:
+        ...
+
+    ResourceIdIndex.write("moved.ridx", {old: new.to_bytes() ...}, payload_size=16)
+    moved = ResourceIdIndex("moved.ridx")
+    new = ResourceId.from_bytes(moved[old])
+
+The file is a 16-byte header (the magic ``b"RIDX"``, a format version and the
+payload size as big-endian unsigned shorts, and the record count as a
+big-endian unsigned 64-bit int) followed by the records.
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from collections.abc import ItemsView, Iterable, Iterator, Mapping
+from typing import Any
+
+from .idarray import RECORD_SIZE, _to_record
+from .idset import ResourceIdSet
+from .resource_id import ResourceId, ResourceIdValue
+
+__all__ = ["ResourceIdIndex"]
+
+_MAGIC = b"RIDX"
+_VERSION = 1
+_HEADER = struct.Struct(">4sHHQ")
+_MAX_PAYLOAD_SIZE = 0xFFFF
+# Lookups bisect a sample of at most _MAX_FENCES keys, about 200 KB per open
+# index, then scan windows of up to _SCAN_RECORDS entries.
+_MAX_FENCES = 4096
+_SCAN_RECORDS = 64
+
+_Entries = (
+    Iterable[ResourceIdValue]
+    | Mapping[ResourceIdValue, bytes]
+    | Iterable[tuple[ResourceIdValue, bytes]]
+)
+
+
+def _records(entries: Any, payload_size: int) -> tuple[int, Iterable[bytes]]:
+    """Return the count and the sorted records of entries for an index."""
+    if not payload_size:
+        ids = entries if isinstance(entries, ResourceIdSet) else ResourceIdSet(entries)
+        return len(ids), [ids.to_bytes()]
+    if isinstance(entries, Mapping):
+        entries = entries.items()
+    records: dict[bytes, bytes] = {}
+    for value, payload in entries:
+        if len(payload) != payload_size:
+            raise ValueError(f"payloads must be {payload_size} bytes.")
+        record = _to_record(value)
+        if record in records:
+            raise ValueError(f"duplicate id {ResourceId.from_bytes(record)}.")
+        records[record] = bytes(payload)
+    return len(records), (record + records[record] for record in sorted(records))
+
+
+class _ItemsView(ItemsView[ResourceId, bytes]):
+    def __iter__(self) -> Iterator[tuple[ResourceId, bytes]]:
+        return self._mapping._iter_items()  # type: ignore[attr-defined]
+
+
+class ResourceIdIndex(Mapping[ResourceId, bytes]):
+    """A read-only map of ResourceIds to payloads, read from a mapped file.
+
+    With a payload size of 0, the index is a set of ids and every value is
+    ``b""``.
+    """
+
+    __slots__ = [
+        "_count",
+        "_fence_step",
+        "_fences",
+        "_mmap",
+        "_stride",
+        "path",
+        "payload_size",
+    ]
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{self.path} is not a ResourceId index.")
+            magic, version, payload_size, count = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"{self.path} is not a ResourceId index.")
+            if version != _VERSION:
+                raise ValueError(f"unsupported index version {version}.")
+            stride = RECORD_SIZE + payload_size
+            if os.fstat(file.fileno()).st_size != _HEADER.size + count * stride:
+                raise ValueError(f"{self.path} is truncated or corrupt.")
+            # The mapping outlives the file object.
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_RANDOM"):
+            # Lookups touch a few scattered pages; reading ahead wastes I/O.
+            self._mmap.madvise(mmap.MADV_RANDOM)
+        self.payload_size = payload_size
+        self._count = count
+        self._stride = stride
+        self._fences: list[bytes] | None = None
+        self._fence_step = max(1, -(-count // _MAX_FENCES))
+
+    @classmethod
+    def write(
+        cls,
+        path: str | os.PathLike[str],
+        entries: _Entries,
+        *,
+        payload_size: int = 0,
+    ) -> "ResourceIdIndex":
+        """Write entries to an index file at path, and open it.
+
+        With payload_size 0, entries are ids, and repeats are dropped.
+        Otherwise entries are a mapping, or (id, payload) pairs, of ids to
+        payloads of payload_size bytes; a repeated id is a ValueError.
+
+        The file is written beside path and renamed over it, so on POSIX
+        systems a process with the old index open keeps reading the old file.
+        """
+        if not 0 <= payload_size <= _MAX_PAYLOAD_SIZE:
+            raise ValueError(f"payload_size must be between 0 and {_MAX_PAYLOAD_SIZE}.")
+        count, records = _records(entries, payload_size)
+        path = os.fspath(path)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, payload_size, count))
+                file.writelines(records)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return cls(path)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the file in bytes."""
+        return len(self._mmap)
+
+    def close(self) -> None:
+        """Unmap the file.  The index cannot be used afterwards."""
+        self._mmap.close()
+
+    def __enter__(self) -> "ResourceIdIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _find(self, record: bytes) -> int:
+        """Return the offset of record's entry in the file, or -1."""
+        # A bisect in C over a bounded sample of keys, read on first use,
+        # picks a block; a binary search narrows the block to a window of a
+        # few records, which bytes.find() scans, skipping matches that are
+        # not at the start of an entry.  The file is never read in full.
+        data, stride = self._mmap, self._stride
+        fences = self._fences
+        if fences is None:
+            fences = self._fences = [
+                data[offset : offset + RECORD_SIZE]
+                for offset in range(_HEADER.size, len(data), self._fence_step * stride)
+            ]
+        block = bisect_right(fences, record) - 1
+        if block < 0:
+            return -1
+        low = block * self._fence_step
+        high = min(low + self._fence_step, self._count)
+        while high - low > _SCAN_RECORDS:
+            middle = (low + high) // 2
+            offset = _HEADER.size + middle * stride
+            key = data[offset : offset + RECORD_SIZE]
+            if key < record:
+                low = middle + 1
+            elif key > record:
+                high = middle
+            else:
+                return offset
+        start = _HEADER.size + low * stride
+        window = data[start : _HEADER.size + high * stride]
+        offset = window.find(record)
+        while offset >= 0 and offset % stride:
+            offset = window.find(record, offset + 1)
+        return -1 if offset < 0 else start + offset
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            record = _to_record(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        return self._find(record) >= 0
+
+    def __getitem__(self, value: ResourceIdValue) -> bytes:
+        """Return the payload of value; KeyError if it is not in the index."""
+        try:
+            offset = self._find(_to_record(value))
+        except (TypeError, ValueError):
+            offset = -1
+        if offset < 0:
+            raise KeyError(value)
+        offset += RECORD_SIZE
+        return self._mmap[offset : offset + self.payload_size]
+
+    def __iter__(self) -> Iterator[ResourceId]:
+        """Yield the ids in ascending order."""
+        data, stride = self._mmap, self._stride
+        from_trusted_int = ResourceId.from_trusted_int
+        for offset in range(_HEADER.size, len(data), stride):
+            yield from_trusted_int(
+                int.from_bytes(data[offset : offset + RECORD_SIZE], "big")
+            )
+
+    def items(self) -> _ItemsView:
+        return _ItemsView(self)
+
+    def _iter_items(self) -> Iterator[tuple[ResourceId, bytes]]:
+        # One pass over the file, rather than a search per id.
+        data, stride = self._mmap, self._stride
+        from_trusted_int = ResourceId.from_trusted_int
+        for offset in range(_HEADER.size, len(data), stride):
+            end = offset + RECORD_SIZE
+            yield (
+                from_trusted_int(int.from_bytes(data[offset:end], "big")),
+                data[end : offset + stride],
+            )
+
+    def __reduce__(self):
+        # Reopen by path, so a process pool's workers share the page cache.
+        return (self.__class__, (self.path,))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.path!r}, len={self._count}, "
+            f"payload_size={self.payload_size})"
+        )
@@ -0,0 +1,196 @@
+"""Comma-separated lists of ResourceIds, for batch endpoints.
+
+:class:`ResourceIdList` is an immutable sequence of ids with a wire form of
+``"id,id,..."``, suitable for a query or path parameter such as
+``?ids=47,deadbeef``.  Subclass it to bound the number of ids or drop
+duplicates::
+
+    class BatchIds(ResourceIdList):
+        max_count = 500
+        dedupe = True
+
+    ids = BatchIds.parse("47,deadbeef,47")   # BatchIds([47, deadbeef])
+    str(ids)                                  # "47,deadbeef"
+
+The whole input is parsed before any error is raised, so an invalid list
+reports every bad position at once through :class:`ResourceIdListError`.
+As a pydantic field a ResourceIdList accepts the comma-separated str or a list
+of ids, and serializes to the str.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
+
+from .resource_id import ResourceId, ResourceIdValue
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
+    from pydantic_core import CoreSchema
+
+__all__ = ["ResourceIdList", "ResourceIdListError"]
+
+
+_ResourceIdListT = TypeVar("_ResourceIdListT", bound="ResourceIdList")
+
+
+class ResourceIdListError(ValueError):
+    """Raised when items of a ResourceIdList are invalid.
+
+    positions holds the zero-based position of every invalid item.
+    """
+
+    def __init__(self, positions: list[int], item_type: type[ResourceId]):
+        self.positions = positions
+        super().__init__(
+            f"Invalid {item_type.__name__} at positions "
+            f"{', '.join(map(str, positions))}."
+        )
+
+
+class ResourceIdList:
+    """An immutable sequence of ResourceIds, written as a comma-separated str."""
+
+    __slots__ = ["_ids"]
+
+    #: The type of the items; a ResourceId subclass may be substituted.
+    item_type: ClassVar[type[ResourceId]] = ResourceId
+    #: The largest number of items accepted, counted before any deduplication.
+    max_count: ClassVar[int | None] = None
+    #: If true, repeated ids are dropped, keeping the first occurrence.
+    dedupe: ClassVar[bool] = False
+
+    def __init__(self, values: Iterable[ResourceIdValue] = ()):
+        if isinstance(values, str):
+            # Iterating a str would take each character as an id.
+            raise TypeError(
+                f"values must not be a str; use {self.__class__.__name__}.parse()."
+            )
+        self._ids = self._parse_items(list(values))
+
+    @classmethod
+    def parse(cls: type[_ResourceIdListT], value: str) -> _ResourceIdListT:
+        """Parse a comma-separated str of ids; the empty str is the empty list."""
+        if not isinstance(value, str):
+            raise TypeError("value must be a str.")
+        if not value:
+            items = []
+        else:
+            # Check the count before splitting, so an oversized input is
+            # rejected without building the pieces.
+            cls._check_count(value.count(",") + 1)
+            items = value.split(",")
+        id_list = cls.__new__(cls)
+        id_list._ids = cls._parse_items(items)
+        return id_list
+
+    @classmethod
+    def _check_count(cls, count: int) -> None:
+        if cls.max_count is not None and count > cls.max_count:
+            raise ValueError(f"at most {cls.max_count} ids are allowed, got {count}.")
+
+    @classmethod
+    def _parse_items(cls, items: list[Any]) -> tuple[ResourceId, ...]:
+        cls._check_count(len(items))
+        item_type = cls.item_type
+        from_str = item_type.from_str
+        ids = []
+        invalid = []
+        for position, item in enumerate(items):
+            try:
+                if type(item) is str:
+                    ids.append(from_str(item))
+                elif isinstance(item, ResourceId):
+                    ids.append(item_type._from_instance(item))
+                else:
+                    ids.append(item_type(item))
+            except (TypeError, ValueError):
+                invalid.append(position)
+        if invalid:
+            raise ResourceIdListError(invalid, item_type)
+        if cls.dedupe:
+            return tuple(dict.fromkeys(ids))
+        return tuple(ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> ResourceId: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[ResourceId, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> ResourceId | tuple[ResourceId, ...]:
+        return self._ids[index]
+
+    def __iter__(self) -> Iterator[ResourceId]:
+        return iter(self._ids)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._ids
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ResourceIdList):
+            return self._ids == other._ids
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ids)
+
+    def __str__(self) -> str:
+        return ",".join(map(str, self._ids))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}([{', '.join(map(str, self._ids))}])"
+
+    @classmethod
+    def _validate(cls: type[_ResourceIdListT], value: Any) -> _ResourceIdListT:
+        if isinstance(value, cls):
+            return value
+        # Only called by pydantic, so pydantic is already imported.
+        from pydantic_core import PydanticCustomError
+
+        try:
+            if isinstance(value, str):
+                return cls.parse(value)
+            if isinstance(value, (list, tuple, ResourceIdList)):
+                return cls(value)
+        except ResourceIdListError as error:
+            # The message is rendered here so the positions read as a list of
+            # numbers; ctx keeps them as ints for clients.
+            raise PydanticCustomError(
+                "resource_id_list",
+                str(error).rstrip("."),
+                {"positions": error.positions},
+            ) from None
+        raise PydanticCustomError(
+            "resource_id_list_type",
+            "Input should be a comma-separated str or a list of ids",
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source_type: Any,
+        handler: "GetCoreSchemaHandler",
+    ) -> "CoreSchema":
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.to_string_ser_schema(when_used="always"),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls,
+        _core_schema: "CoreSchema",
+        handler: "GetJsonSchemaHandler",
+    ) -> "JsonSchemaValue":
+        return {
+            "title": cls.__name__,
+            "description": "A comma-separated list of opaque identifiers.",
+            "type": "string",
+            "format": "resource-id-list",
+        }
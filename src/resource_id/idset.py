@@ -0,0 +1,375 @@
+"""Memory-lean sets of ResourceIds.
+
+:class:`ResourceIdSet` is an immutable set stored as one sorted buffer of
+16-byte big-endian records: a million ids take 16 MB, plus about 1 MB for a
+lookup index, where a ``set[ResourceId]`` takes about 90 MB for an object, a
+bignum and a hash-table slot per id.  Membership is a binary search, and set
+operations merge the sorted buffers::
+
+    seen = ResourceIdSet(rows)          # any ResourceIdValues, in any order
+    if rid in seen:
+        ...
+    seen = seen | ResourceIdSet(batch)  # or seen.union(batch)
+    seen.nbytes
+
+:class:`ResourceIdBloomFilter` trades exactness for size: it answers
+membership with no false negatives and a configurable false-positive rate,
+in about 1.2 bytes per id at 1%.
+"""
+
+import math
+import operator
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Set
+from itertools import pairwise, starmap
+from typing import Any, ClassVar
+
+from .idarray import RECORD_SIZE, ResourceIdArray, _to_record
+from .resource_id import ResourceId, ResourceIdValue
+
+__all__ = ["ResourceIdBloomFilter", "ResourceIdSet"]
+
+# Membership tests search a sparse index of every _BLOCK_RECORDS-th record,
+# built on first use; it costs about one byte per id.
+_BLOCK_RECORDS = 64
+_BLOCK_BYTES = _BLOCK_RECORDS * RECORD_SIZE
+
+
+def _split(buf: Any) -> list[bytes]:
+    """Return the records of buf as a list of bytes."""
+    return [
+        bytes(buf[offset : offset + RECORD_SIZE])
+        for offset in range(0, len(buf), RECORD_SIZE)
+    ]
+
+
+def _merge(
+    a: list[bytes], b: list[bytes], left: bool, both: bool, right: bool
+) -> bytes:
+    """Merge sorted record lists, keeping those only in a, in both or only in b.
+
+    left, both and right choose which of the three kinds are kept, so one merge
+    serves union, intersection, difference and symmetric difference.
+    """
+    out: list[bytes] = []
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x < y:
+            if left:
+                out.append(x)
+            i += 1
+        elif y < x:
+            if right:
+                out.append(y)
+            j += 1
+        else:
+            if both:
+                out.append(x)
+            i += 1
+            j += 1
+    if left:
+        out.extend(a[i:])
+    if right:
+        out.extend(b[j:])
+    return b"".join(out)
+
+
+class ResourceIdSet(Set[ResourceId]):
+    """An immutable set of ResourceIds stored as sorted 16-byte records."""
+
+    __slots__ = ["_buf", "_fences"]
+
+    #: The type of the ids yielded; a ResourceId subclass may be substituted.
+    item_type: ClassVar[type[ResourceId]] = ResourceId
+
+    def __init__(self, values: Iterable[ResourceIdValue] = ()):
+        self._fences: list[bytes] | None = None
+        if isinstance(values, ResourceIdSet):
+            self._buf = values._buf
+            return
+        if isinstance(values, ResourceIdArray):
+            records = set(_split(values.view()))
+        else:
+            records = set(map(_to_record, values))
+        self._buf = b"".join(sorted(records))
+
+    @classmethod
+    def frombuffer(cls, buffer: Any) -> "ResourceIdSet":
+        """Wrap a buffer of sorted, distinct 16-byte records without copying it.
+
+        The buffer is checked for order in one pass; ValueError if it is not
+        strictly ascending.  The set reads from buffer, which must not change.
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) % RECORD_SIZE:
+            raise ValueError(f"buffer size must be a multiple of {RECORD_SIZE}.")
+        records = (
+            bytes(view[offset : offset + RECORD_SIZE])
+            for offset in range(0, len(view), RECORD_SIZE)
+        )
+        if not all(starmap(operator.lt, pairwise(records))):
+            raise ValueError("records must be sorted and distinct.")
+        id_set = cls.__new__(cls)
+        id_set._buf = view
+        id_set._fences = None
+        return id_set
+
+    @classmethod
+    def _from_records(cls, records: bytes) -> "ResourceIdSet":
+        id_set = cls.__new__(cls)
+        id_set._buf = records
+        id_set._fences = None
+        return id_set
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the record buffer in bytes."""
+        return len(self._buf)
+
+    def to_bytes(self) -> bytes:
+        """Return the records as bytes, suitable for frombuffer()."""
+        return bytes(self._buf)
+
+    def __len__(self) -> int:
+        return len(self._buf) // RECORD_SIZE
+
+    def __iter__(self) -> Iterator[ResourceId]:
+        """Yield the ids in ascending order."""
+        buf = self._buf
+        from_trusted_int = self.item_type.from_trusted_int
+        for offset in range(0, len(buf), RECORD_SIZE):
+            yield from_trusted_int(
+                int.from_bytes(buf[offset : offset + RECORD_SIZE], "big")
+            )
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            record = _to_record(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        return self._find(record)
+
+    def _find(self, record: bytes) -> bool:
+        # Binary search over the first record of every _BLOCK_RECORDS runs in
+        # C on a list of bytes, then the block is scanned with bytes.find(),
+        # skipping matches that straddle two records.  A search calling back
+        # into Python for each probe of the buffer is several times slower.
+        fences = self._fences
+        if fences is None:
+            buf = self._buf
+            fences = self._fences = [
+                bytes(buf[offset : offset + RECORD_SIZE])
+                for offset in range(0, len(buf), _BLOCK_BYTES)
+            ]
+        block = bisect_right(fences, record) - 1
+        if block < 0:
+            return False
+        start = block * _BLOCK_BYTES
+        data = bytes(self._buf[start : start + _BLOCK_BYTES])
+        offset = data.find(record)
+        while offset >= 0 and offset % RECORD_SIZE:
+            offset = data.find(record, offset + 1)
+        return offset >= 0
+
+    def _records(self) -> list[bytes]:
+        return _split(self._buf)
+
+    def _filter(self, other: "ResourceIdSet", keep: bool) -> bytes:
+        # Probe other for each of self's records, keeping those whose
+        # membership is keep: cheaper than a merge when other is much larger.
+        find = other._find
+        return b"".join(record for record in self._records() if find(record) is keep)
+
+    def _probe_is_cheaper(self, other: "ResourceIdSet") -> bool:
+        return len(self) * max(1, len(other)).bit_length() < len(other)
+
+    def union(self, *others: Iterable[ResourceIdValue]) -> "ResourceIdSet":
+        result = self
+        for other in others:
+            result = result | _as_set(other)
+        return result
+
+    def intersection(self, *others: Iterable[ResourceIdValue]) -> "ResourceIdSet":
+        result = self
+        for other in others:
+            result = result & _as_set(other)
+        return result
+
+    def difference(self, *others: Iterable[ResourceIdValue]) -> "ResourceIdSet":
+        result = self
+        for other in others:
+            result = result - _as_set(other)
+        return result
+
+    def symmetric_difference(self, other: Iterable[ResourceIdValue]) -> "ResourceIdSet":
+        return self ^ _as_set(other)
+
+    def issubset(self, other: Iterable[ResourceIdValue]) -> bool:
+        return self <= _as_set(other)
+
+    def issuperset(self, other: Iterable[ResourceIdValue]) -> bool:
+        return self >= _as_set(other)
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, ResourceIdSet):
+            return super().__or__(other)
+        if not other or other is self:
+            return self
+        if not self:
+            return other
+        return self._from_records(
+            _merge(self._records(), other._records(), True, True, True)
+        )
+
+    def __and__(self, other: Any) -> Any:
+        if not isinstance(other, ResourceIdSet):
+            return super().__and__(other)
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        if small._probe_is_cheaper(large):
+            return self._from_records(small._filter(large, True))
+        return self._from_records(
+            _merge(self._records(), other._records(), False, True, False)
+        )
+
+    def __sub__(self, other: Any) -> Any:
+        if not isinstance(other, ResourceIdSet):
+            return super().__sub__(other)
+        if self._probe_is_cheaper(other):
+            return self._from_records(self._filter(other, False))
+        return self._from_records(
+            _merge(self._records(), other._records(), True, False, False)
+        )
+
+    def __xor__(self, other: Any) -> Any:
+        if not isinstance(other, ResourceIdSet):
+            return super().__xor__(other)
+        return self._from_records(
+            _merge(self._records(), other._records(), True, False, True)
+        )
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ResourceIdSet):
+            return self._buf == other._buf
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        # The class carries item_type, so a subclass's ids unpickle as its own.
+        return (_unpickle, (self.__class__, self.to_bytes()))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({{{', '.join(map(str, self))}}})"
+
+    @classmethod
+    def _from_iterable(cls, values: Iterable[Any]) -> "ResourceIdSet":
+        # Used by the Set mixin operators for operands of other set types.
+        return cls(values)
+
+    def bloom_filter(self, error_rate: float = 0.01) -> "ResourceIdBloomFilter":
+        """Return a bloom filter of these ids, sized for this set."""
+        bloom = ResourceIdBloomFilter(max(len(self), 1), error_rate)
+        bloom._add_records(self._records())
+        return bloom
+
+
+def _unpickle(cls: type[ResourceIdSet], records: bytes) -> ResourceIdSet:
+    return cls._from_records(records)
+
+
+def _as_set(values: Iterable[ResourceIdValue]) -> ResourceIdSet:
+    if isinstance(values, ResourceIdSet):
+        return values
+    return ResourceIdSet(values)
+
+
+class ResourceIdBloomFilter:
+    """An approximate set of ResourceIds with no false negatives.
+
+    Sized for capacity ids at a false-positive rate of error_rate; adding
+    more ids than capacity raises the rate.  Ids are hashed with BLAKE2b, so
+    sequential ids spread as well as random ones, and a filter built in one
+    process gives the same answers in another.
+    """
+
+    __slots__ = [
+        "_bits",
+        "_blake2b",
+        "capacity",
+        "count",
+        "error_rate",
+        "num_bits",
+        "num_hashes",
+    ]
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        #: The number of ids added, counting repeats.
+        self.count = 0
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        # Imported here rather than at module level: hashlib (which loads
+        # OpenSSL) would otherwise add to the import time of resource_id.
+        from hashlib import blake2b
+
+        self._blake2b = blake2b
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def _positions(self, record: bytes) -> Iterator[int]:
+        # Double hashing (Kirsch and Mitzenmacher): k positions from two
+        # 64-bit hashes.
+        digest = self._blake2b(record, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def _add_records(self, records: Iterable[bytes]) -> None:
+        bits = self._bits
+        count = 0
+        for record in records:
+            for position in self._positions(record):
+                bits[position >> 3] |= 1 << (position & 7)
+            count += 1
+        self.count += count
+
+    def add(self, value: ResourceIdValue) -> None:
+        self._add_records([_to_record(value)])
+
+    def update(self, values: Iterable[ResourceIdValue]) -> None:
+        self._add_records(map(_to_record, values))
+
+    def __contains__(self, value: object) -> bool:
+        """Return False if value was never added; True if it probably was."""
+        try:
+            record = _to_record(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        bits = self._bits
+        return all(
+            bits[position >> 3] >> (position & 7) & 1
+            for position in self._positions(record)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self.capacity}, "
+            f"error_rate={self.error_rate}, count={self.count})"
+        )
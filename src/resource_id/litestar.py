@@ -16,7 +16,10 @@ Litestar has no public API for custom path-parameter types
 same internal maps litestar's own built-in types (``int``, ``uuid``, ...) use.
 
 This module also exposes :class:`ResourceIdSchemaPlugin`, which teaches
-litestar's OpenAPI generator to render ``ResourceId`` fields as strings, and
+litestar's OpenAPI generator to render ``ResourceId`` fields as strings,
+:class:`ResourceIdMsgspecPlugin`, which registers msgspec type encoders and
+decoders so ``ResourceId`` values serialize and validate without pydantic
+(e.g. in ``msgspec.Struct`` models or a ``list[ResourceId]`` response), and
 :data:`ResourceIdPathParameter`, a convenience annotated path-parameter type.
 
 Requires the ``litestar`` extra: ``pip install resource-id[litestar]``.
@@ -25,23 +28,39 @@ Requires the ``litestar`` extra: ``pip install resource-id[litestar]``.
 from typing import Annotated, Any
 
 import litestar.routes.base as litestar_base
+from litestar.config.app import AppConfig
 from litestar.openapi.spec import OpenAPIType, Schema
-from litestar.params import PathParameter
-from litestar.plugins import OpenAPISchemaPlugin
+from litestar.params import PathParameter, QueryParameter
+from litestar.plugins import InitPlugin, OpenAPISchemaPlugin
+from litestar.types import TypeDecodersSequence, TypeEncodersMap
 
+from .idlist import ResourceIdList
+from .msgspec import dec_hook, is_resource_id_list_type, is_resource_id_type
 from .resource_id import ResourceId
 
-__all__ = ["ResourceIdPathParameter", "ResourceIdSchemaPlugin"]
+__all__ = [
+    "TYPE_DECODERS",
+    "TYPE_ENCODERS",
+    "ResourceIdListPathParameter",
+    "ResourceIdListQueryParameter",
+    "ResourceIdMsgspecPlugin",
+    "ResourceIdPathParameter",
+    "ResourceIdSchemaPlugin",
+]
 
 
 # Register ResourceId as the "resourceid" path-parameter type. litestar parses a
-# matched segment by calling the mapped type, i.e. ResourceId(segment).
+# matched segment, always a str, with the mapped parser: from_str() skips the
+# constructor's type dispatch.
 litestar_base.param_type_map["resourceid"] = ResourceId  # pyright: ignore[reportUnknownMemberType]
-litestar_base.parsers_map[ResourceId] = ResourceId
+litestar_base.parsers_map[ResourceId] = ResourceId.from_str
+# Likewise "resourceidlist", for a comma-separated ResourceIdList segment.
+litestar_base.param_type_map["resourceidlist"] = ResourceIdList  # pyright: ignore[reportUnknownMemberType]
+litestar_base.parsers_map[ResourceIdList] = ResourceIdList.parse
 
 
 class ResourceIdSchemaPlugin(OpenAPISchemaPlugin):
-    """Render ``ResourceId`` fields as strings in litestar's OpenAPI output.
+    """Render ``ResourceId`` (and ``ResourceIdList``) fields as strings in OpenAPI.
 
     Litestar builds OpenAPI schemas with its own plugin system rather than
     pydantic's ``__get_pydantic_json_schema__``. ``ResourceId`` is a plain class
@@ -53,12 +72,22 @@ class ResourceIdSchemaPlugin(OpenAPISchemaPlugin):
 
     @staticmethod
     def is_plugin_supported_type(value: Any) -> bool:
-        return isinstance(value, type) and issubclass(value, ResourceId)
+        return isinstance(value, type) and issubclass(
+            value, (ResourceId, ResourceIdList)
+        )
 
     def to_openapi_schema(self, field_definition: Any, schema_creator: Any) -> Schema:
-        # Mirrors ResourceId._json_schema(); built field-wise so the static
-        # types check (litestar types `format` as a standard-formats enum, which
-        # has no "resource-id" member, but OpenAPI `format` is an open string).
+        # Mirrors the classes' pydantic JSON schemas; built field-wise so the
+        # static types check (litestar types `format` as a standard-formats
+        # enum, which has no "resource-id" member, but OpenAPI `format` is an
+        # open string).
+        if is_resource_id_list_type(field_definition.annotation):
+            return Schema(
+                type=OpenAPIType.STRING,
+                format="resource-id-list",  # pyright: ignore[reportArgumentType]
+                title="ResourceIdList",
+                description="A comma-separated list of opaque identifiers.",
+            )
         return Schema(
             type=OpenAPIType.STRING,
             format="resource-id",  # pyright: ignore[reportArgumentType]
@@ -67,7 +96,44 @@ class ResourceIdSchemaPlugin(OpenAPISchemaPlugin):
         )
 
 
+#: msgspec type encoders and decoders for ``ResourceId``, in the form litestar's
+#: ``type_encoders`` and ``type_decoders`` options (at any layer) take.
+TYPE_ENCODERS: TypeEncodersMap = {ResourceId: str, ResourceIdList: str}
+TYPE_DECODERS: TypeDecodersSequence = [
+    (is_resource_id_type, dec_hook),
+    (is_resource_id_list_type, dec_hook),
+]
+
+
+class ResourceIdMsgspecPlugin(InitPlugin):
+    """Let litestar's msgspec serialization handle ``ResourceId``.
+
+    Without it, returning a ``ResourceId`` outside a pydantic model fails with
+    a 500, and a ``ResourceId`` field in a ``msgspec.Struct`` request body is
+    rejected. Add it to the app:
+    ``Litestar(..., plugins=[ResourceIdMsgspecPlugin()])``.
+    """
+
+    __slots__ = ()
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        # Encoders and decoders the app already sets take precedence.
+        app_config.type_encoders = {**TYPE_ENCODERS, **(app_config.type_encoders or {})}
+        app_config.type_decoders = [*(app_config.type_decoders or []), *TYPE_DECODERS]
+        return app_config
+
+
 #: ``ResourceId`` annotated as a litestar path parameter. ``PathParameter`` pins
 #: the parameter type so a dependency like ``id: ResourceIdPathParameter`` resolves
 #: to the route's ``{id:resourceid}`` path param without query/path ambiguity.
 ResourceIdPathParameter = Annotated[ResourceId, PathParameter()]
+
+#: ``ResourceIdList`` annotated as a litestar path parameter, for routes declared
+#: with ``{ids:resourceidlist}``.
+ResourceIdListPathParameter = Annotated[ResourceIdList, PathParameter()]
+
+#: ``ResourceIdList`` annotated as a litestar query parameter (``?ids=a,b,c``).
+#: A subclass with limits is annotated the same way:
+#: ``Annotated[BatchIds, QueryParameter()]``. Query parameters are decoded by
+#: litestar's msgspec layer, so the app needs ``ResourceIdMsgspecPlugin``.
+ResourceIdListQueryParameter = Annotated[ResourceIdList, QueryParameter()]
@@ -0,0 +1,201 @@
+"""Opt-in counters and timings for ResourceId parsing and encoding.
+
+Instrumentation is off by default, and costs each parse or encode one check of
+a module global while off.  Turn it on with a sink that receives the events::
+
+    from resource_id import metrics
+
+    counts = metrics.Counters()
+    metrics.enable(counts, sample_every=100)
+    ...
+    counts.parsed_counts    # Counter({'base62': 9120, 'uuid_str': 880})
+    counts.invalid_counts   # Counter({'charset': 12, 'range': 3})
+    metrics.disable()
+
+What is observed:
+
+* ``ResourceId(value)``, the ``from_str``, ``from_base62``, ``from_int`` and
+  ``from_uuid`` constructors, and pydantic validation of a ResourceId field
+  report each parsed input by kind: ``base62``, ``uuid_str``, ``int``, ``uuid``,
+  ``bytes`` or ``resource_id``; and each rejected input by reason: ``type``
+  (an unsupported type), ``empty``, ``charset`` (a character outside base62
+  and not a UUID), ``range`` (a value of 2**128 or more, or negative) or
+  ``length`` (bytes not 16 long, or a SortableResourceId str not 22 long).  pydantic-core rejects out-of-range ints and
+  unsupported types without calling ResourceId, so under pydantic only str
+  input reports invalid reasons.
+* Encoding an id's string form (the first ``str()`` of an instance) reports
+  an encode.
+* With ``sample_every=n``, one in every n parses and encodes is also timed,
+  and reported in seconds as operation ``parse`` or ``encode``.  Only
+  ``ResourceId(value)`` and string parses are timed; the int and UUID
+  constructors do too little to be worth timing.
+
+ResourceId() with no argument generates an id; that is not a parse and is not
+reported.  Neither are ``from_trusted_int``, ``from_bytes`` or direct calls to
+``b62encode``/``b62decode``.
+
+A sink is any object with the methods of :class:`MetricsSink`.  To export to
+Prometheus, forward the events to ``prometheus_client`` metrics::
+
+    from prometheus_client import Counter, Histogram
+
+    class PrometheusSink:
+        def __init__(self):
+            self._parsed = Counter("resource_id_parsed", "Ids parsed", ["kind"])
+            self._invalid = Counter("resource_id_invalid", "Ids rejected", ["reason"])
+            self._encoded = Counter("resource_id_encoded", "Ids encoded")
+            self._seconds = Histogram("resource_id_seconds", "Sampled", ["operation"])
+
+        def parsed(self, kind): self._parsed.labels(kind).inc()
+        def invalid(self, reason): self._invalid.labels(reason).inc()
+        def encoded(self): self._encoded.inc()
+        def timed(self, operation, seconds):
+            self._seconds.labels(operation).observe(seconds)
+
+Sink methods are called on the thread doing the work, synchronously; they
+should be cheap and must not raise.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable
+from time import perf_counter
+from typing import Protocol
+from uuid import UUID
+
+from . import resource_id as _resource_id
+from .resource_id import _MAX_BASE62_ID_LEN, ResourceId, _is_base62, _is_uuid_str
+from .sortable import SortableResourceId
+
+__all__ = ["Counters", "MetricsSink", "disable", "enable"]
+
+
+class MetricsSink(Protocol):
+    """The events reported while instrumentation is enabled."""
+
+    def parsed(self, kind: str) -> None: ...
+
+    def invalid(self, reason: str) -> None: ...
+
+    def encoded(self) -> None: ...
+
+    def timed(self, operation: str, seconds: float) -> None: ...
+
+
+class Counters:
+    """A sink that keeps running totals, safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        #: Parsed inputs by kind.
+        self.parsed_counts: Counter[str] = Counter()
+        #: Rejected inputs by reason.
+        self.invalid_counts: Counter[str] = Counter()
+        #: Number of ids encoded.
+        self.encoded_count = 0
+        #: Number of sampled timings, and their total in seconds, by operation.
+        self.timed_counts: Counter[str] = Counter()
+        self.timed_seconds: Counter[str] = Counter()
+
+    def parsed(self, kind: str) -> None:
+        with self._lock:
+            self.parsed_counts[kind] += 1
+
+    def invalid(self, reason: str) -> None:
+        with self._lock:
+            self.invalid_counts[reason] += 1
+
+    def encoded(self) -> None:
+        with self._lock:
+            self.encoded_count += 1
+
+    def timed(self, operation: str, seconds: float) -> None:
+        with self._lock:
+            self.timed_counts[operation] += 1
+            self.timed_seconds[operation] += seconds
+
+
+def _kind(value: object) -> str:
+    if isinstance(value, str):
+        if len(value) > _MAX_BASE62_ID_LEN and _is_uuid_str(value):
+            return "uuid_str"
+        return "base62"
+    if isinstance(value, ResourceId):
+        return "resource_id"
+    if isinstance(value, UUID):
+        return "uuid"
+    if isinstance(value, int):
+        return "int"
+    return "bytes"
+
+
+def _reason(cls: type[ResourceId], value: object, error: Exception) -> str:
+    if isinstance(error, TypeError):
+        return "type"
+    if isinstance(value, str):
+        if not value:
+            return "empty"
+        if not _is_base62(value):
+            return "charset"
+        # A sortable id's encoding is fixed-width, so a str of another width
+        # is the wrong length, whatever its value.
+        if issubclass(cls, SortableResourceId) and len(value) != _MAX_BASE62_ID_LEN:
+            return "length"
+        return "range"
+    if isinstance(value, int):
+        return "range"
+    return "length"
+
+
+class _Observer:
+    """Reports events to a sink; ResourceId calls it while enabled."""
+
+    __slots__ = ["_countdown", "sample_every", "sink"]
+
+    def __init__(self, sink: MetricsSink, sample_every: int):
+        self.sink = sink
+        self.sample_every = sample_every
+        self._countdown = sample_every
+
+    def start(self) -> float | None:
+        """Return the start time if this operation is to be timed, else None."""
+        if not self.sample_every:
+            return None
+        # Unsynchronized: under threads a sample may be skipped or doubled.
+        self._countdown -= 1
+        if self._countdown > 0:
+            return None
+        self._countdown = self.sample_every
+        return perf_counter()
+
+    def parsed(self, value: object, started: float | None) -> None:
+        if started is not None:
+            self.sink.timed("parse", perf_counter() - started)
+        self.sink.parsed(_kind(value))
+
+    def invalid(self, cls: type[ResourceId], value: object, error: Exception) -> None:
+        self.sink.invalid(_reason(cls, value, error))
+
+    def encode(self, encode: Callable[[int], str], value: int) -> str:
+        started = self.start()
+        encoded = encode(value)
+        if started is not None:
+            self.sink.timed("encode", perf_counter() - started)
+        self.sink.encoded()
+        return encoded
+
+
+def enable(sink: MetricsSink, *, sample_every: int = 0) -> None:
+    """Report parse and encode events to sink, replacing any previous sink.
+
+    With sample_every > 0, one in every sample_every parses and encodes is
+    also timed; 0 (the default) times nothing.
+    """
+    if sample_every < 0:
+        raise ValueError("sample_every must be non-negative.")
+    _resource_id._observer = _Observer(sink, sample_every)
+
+
+def disable() -> None:
+    """Stop reporting events."""
+    _resource_id._observer = None
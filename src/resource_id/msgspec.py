@@ -0,0 +1,75 @@
+"""msgspec integration for :class:`ResourceId`.
+
+msgspec does not know ``ResourceId``; pass these hooks to an encoder and a
+decoder so ``msgspec.Struct`` models (and any other msgspec-typed data) may
+hold ``ResourceId`` fields::
+
+    import msgspec
+    from resource_id import ResourceId
+    from resource_id.msgspec import dec_hook, enc_hook
+
+    class Widget(msgspec.Struct):
+        id: ResourceId
+        name: str
+
+    encoder = msgspec.json.Encoder(enc_hook=enc_hook)
+    decoder = msgspec.json.Decoder(Widget, dec_hook=dec_hook)
+
+    widget = decoder.decode(b'{"id": "2N9", "name": "sprocket"}')
+    assert encoder.encode(widget) == b'{"id":"2N9","name":"sprocket"}'
+
+Ids encode as their base62 string.  Decoding accepts what the JSON form of
+the pydantic schema accepts: a base62 or UUID string, or an int in range;
+from MessagePack, 16 big-endian bytes are accepted as well.  An invalid id
+fails with ``msgspec.ValidationError`` naming the offending field.
+
+:class:`~resource_id.idlist.ResourceIdList` fields are handled too: they encode
+as the comma-separated str and decode from it or from a list of ids.
+
+The hooks do not import msgspec themselves; ``resource_id.litestar`` registers
+them with litestar (see ``ResourceIdMsgspecPlugin``).
+"""
+
+from typing import Any
+
+from .idlist import ResourceIdList
+from .resource_id import ResourceId
+
+__all__ = ["dec_hook", "enc_hook", "is_resource_id_list_type", "is_resource_id_type"]
+
+
+def is_resource_id_type(type_: Any) -> bool:
+    """Return whether type_ is ResourceId or a subclass of it."""
+    return isinstance(type_, type) and issubclass(type_, ResourceId)
+
+
+def is_resource_id_list_type(type_: Any) -> bool:
+    """Return whether type_ is ResourceIdList or a subclass of it."""
+    return isinstance(type_, type) and issubclass(type_, ResourceIdList)
+
+
+def enc_hook(value: Any) -> Any:
+    """Encode a ResourceId as its base62 string, a ResourceIdList as its str."""
+    if isinstance(value, (ResourceId, ResourceIdList)):
+        return str(value)
+    raise NotImplementedError(f"Objects of type {type(value)!r} are not supported")
+
+
+def dec_hook(type_: Any, value: Any) -> Any:
+    """Decode a str, int or (MessagePack) bytes value into a ResourceId type.
+
+    A ResourceIdList type is decoded from a comma-separated str or a list.
+    """
+    if is_resource_id_list_type(type_):
+        if isinstance(value, str):
+            return type_.parse(value)
+        if isinstance(value, (list, ResourceIdList)):
+            return type_(value)
+        raise TypeError(f"Expected `str`, got `{type(value).__name__}`")
+    if not is_resource_id_type(type_):
+        raise NotImplementedError(f"Type {type_!r} is not supported")
+    if isinstance(value, str):
+        return type_.from_str(value)
+    if isinstance(value, (int, bytes)) and not isinstance(value, bool):
+        return type_(value)
+    raise TypeError(f"Expected `str`, got `{type(value).__name__}`")
@@ -1,11 +1,23 @@
 """ResourceId implements base62-encoded identifiers, suitable for URLs and URIs."""
 
-from typing import Any, TypeAlias, Union
+import math
+import operator
+import os
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, Union
 from uuid import UUID, uuid4
 
-from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import CoreSchema, core_schema
+from .uuid7 import _uuid7_int
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+
+    from .metrics import _Observer
+    from pydantic.json_schema import JsonSchemaValue
+    from pydantic_core import CoreSchema
 
 
 __all__ = ["ResourceId"]
@@ -13,9 +25,31 @@ __all__ = ["ResourceId"]
 ALPHABET = tuple("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
 DECODE_MAP = {x: idx for idx, x in enumerate(ALPHABET)}
 UUID_BITS = 128
+_UUID_BYTES = UUID_BITS // 8
+_RANGE_ERROR = f"value must fit in a UUID (< 2**{UUID_BITS})."
+
+
+ResourceIdValue: TypeAlias = Union[
+    str, int, UUID, bytes, bytearray, memoryview, "ResourceId"
+]
+_ResourceIdT = TypeVar("_ResourceIdT", bound="ResourceId")
 
 
-ResourceIdValue: TypeAlias = Union[str, int, UUID, "ResourceId"]
+# b62encode works in limbs of _LIMB_DIGITS base62 digits: one bignum divmod per
+# limb, after which the limb (< 62**10 < 2**60) is expanded two digits at a time
+# through _PAIRS, a table of every two-character base62 string.
+_PAIRS = tuple(a + b for a in ALPHABET for b in ALPHABET)
+_LIMB_DIGITS = 10
+_LIMB = 62**_LIMB_DIGITS
+
+
+def _encode_limb(limb: int, pairs: tuple[str, ...] = _PAIRS) -> str:
+    """Encode 0 <= limb < 62**10 as exactly ten base62 digits, zero-padded."""
+    return (
+        f"{pairs[limb // 62**8]}{pairs[limb // 62**6 % 62**2]}"
+        f"{pairs[limb // 62**4 % 62**2]}{pairs[limb // 62**2 % 62**2]}"
+        f"{pairs[limb % 62**2]}"
+    )
 
 
 def b62encode(value: Union[int, UUID]):
@@ -23,14 +57,36 @@ def b62encode(value: Union[int, UUID]):
     value = int(value)
     if 0 > value:
         raise ValueError("value must convert to a non-negative integer.")
-    x = value
-    b62_repr: str = ""
-    while x:
-        x, b62_repr = (
-            x // 62,
-            ALPHABET[x % 62] + b62_repr,
+    if not value >> UUID_BITS:
+        # Every id takes this path: 2**UUID_BITS < 62**22, so the value splits
+        # into two full limbs plus a top part small enough to index _PAIRS.
+        # The limb expansion is inlined here to save two calls per id.
+        pairs = _PAIRS
+        value, lo = divmod(value, _LIMB)
+        top, hi = divmod(value, _LIMB)
+        b62_repr = (
+            f"{pairs[top]}"
+            f"{pairs[hi // 62**8]}{pairs[hi // 62**6 % 62**2]}"
+            f"{pairs[hi // 62**4 % 62**2]}{pairs[hi // 62**2 % 62**2]}"
+            f"{pairs[hi % 62**2]}"
+            f"{pairs[lo // 62**8]}{pairs[lo // 62**6 % 62**2]}"
+            f"{pairs[lo // 62**4 % 62**2]}{pairs[lo // 62**2 % 62**2]}"
+            f"{pairs[lo % 62**2]}"
         )
-    return b62_repr if b62_repr else "0"
+    else:
+        limbs: list[str] = []
+        while value:
+            value, limb = divmod(value, _LIMB)
+            limbs.append(_encode_limb(limb))
+        limbs.reverse()
+        b62_repr = "".join(limbs)
+    return b62_repr.lstrip("0") or "0"
+
+
+def _int_from_bytes(data: bytes | bytearray | memoryview) -> int:
+    if memoryview(data).nbytes != _UUID_BYTES:
+        raise ValueError(f"bytes value must be {_UUID_BYTES} bytes long.")
+    return int.from_bytes(data, "big")
 
 
 # The base62 encoding of any in-range id (value < 2**UUID_BITS) is at most this
@@ -38,46 +94,591 @@ def b62encode(value: Union[int, UUID]):
 _MAX_BASE62_ID_LEN = len(b62encode((1 << UUID_BITS) - 1))
 
 
+# bytes.translate table taking an ASCII base62 character to its digit value.
+# Only meaningful for validated input; every other byte maps to 0.
+_DECODE_TABLE = bytes(DECODE_MAP.get(chr(byte), 0) for byte in range(256))
+
+
+def _is_base62(value: str) -> bool:
+    # str.isalnum() alone accepts any Unicode letter or digit; restricted to
+    # ASCII it is exactly [0-9a-zA-Z].  Both are single C-level scans.
+    return value.isascii() and value.isalnum()
+
+
 def b62decode(value: str):
     """Decode a base62-encoded str.  Returns int.  Raises ValueError if value is invalid."""
 
     if value == "":
         raise ValueError("invalid literal for b62decode: ''")
+    # Validate the whole string before doing any arithmetic, so garbage is
+    # rejected without a partial decode or a KeyError per call.
+    if not _is_base62(value):
+        raise ValueError(f"Invalid base62 value '{value}'.")
 
     x = 0
-    for digit in value:
-        try:
-            x = x * 62 + DECODE_MAP[digit]
-        except KeyError as exc:
-            raise ValueError(f"Invalid base62 value '{value}'.") from exc
+    for digit in value.encode("ascii").translate(_DECODE_TABLE):
+        x = x * 62 + digit
     return x
 
 
+#: Base62 digits in ASCII order, so that equal-length strings compare like the
+#: numbers they encode.  Used by b62encode_ordered(), and to range-check an id
+#: string without decoding it.
+ORDERED_ALPHABET = tuple(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+_ASCII_ORDERED = str.maketrans("".join(ALPHABET), "".join(ORDERED_ALPHABET))
+_FROM_ASCII_ORDERED = str.maketrans("".join(ORDERED_ALPHABET), "".join(ALPHABET))
+_MAX_BASE62_ID = b62encode((1 << UUID_BITS) - 1).translate(_ASCII_ORDERED)
+
+
+def _is_base62_id(value: str) -> bool:
+    """Return True if value is a base62 string encoding a value < 2**UUID_BITS."""
+    if not _is_base62(value):
+        return False
+    digits = value.lstrip("0")
+    return len(digits) < _MAX_BASE62_ID_LEN or (
+        len(digits) == _MAX_BASE62_ID_LEN
+        and digits.translate(_ASCII_ORDERED) <= _MAX_BASE62_ID
+    )
+
+
+def b62encode_ordered(value: Union[int, UUID]) -> str:
+    """Encode a value below 2**128 as exactly 22 digits of ORDERED_ALPHABET.
+
+    Unlike b62encode(), the result is zero-padded to a fixed width in an
+    alphabet that follows ASCII order, so encodings compare as strings (or
+    bytes) the way the values they encode compare as numbers.
+    """
+    value = int(value)
+    if value >> UUID_BITS > 0:
+        raise ValueError(_RANGE_ERROR)
+    # Both alphabets start with 0-9, so padding before translating is safe.
+    return b62encode(value).rjust(_MAX_BASE62_ID_LEN, "0").translate(_ASCII_ORDERED)
+
+
+def b62decode_ordered(value: str) -> int:
+    """Decode a str made by b62encode_ordered().  Returns int.
+
+    Raises ValueError unless value is exactly 22 base62 digits; the result may
+    be 2**128 or more.
+    """
+    if len(value) != _MAX_BASE62_ID_LEN or not _is_base62(value):
+        raise ValueError(f"Invalid ordered base62 value '{value}'.")
+    return b62decode(value.translate(_FROM_ASCII_ORDERED))
+
+
+def _is_ordered_id(value: str) -> bool:
+    """Return True if value is an ordered encoding of a value < 2**UUID_BITS."""
+    return (
+        len(value) == _MAX_BASE62_ID_LEN
+        and _is_base62(value)
+        and value <= _MAX_BASE62_ID
+    )
+
+
+# bytes.translate tables that set the version 4 nibble (byte 6) and the RFC
+# 9562 variant bits (byte 8) of a record, leaving the other bits random.
+_V4_VERSION = bytes(byte & 0x0F | 0x40 for byte in range(256))
+_V4_VARIANT = bytes(byte & 0x3F | 0x80 for byte in range(256))
+_GENERATE_BLOCK = 4096
+
+
+def _random_v4_blocks(count: int | None) -> Iterator[bytearray]:
+    """Yield blocks of random version 4 UUIDs as 16-byte big-endian records."""
+    if count is not None and count < 0:
+        raise ValueError("count must be non-negative.")
+    remaining = count
+    while remaining is None or remaining > 0:
+        block = (
+            _GENERATE_BLOCK if remaining is None else min(remaining, _GENERATE_BLOCK)
+        )
+        records = bytearray(os.urandom(block * _UUID_BYTES))
+        records[6::_UUID_BYTES] = records[6::_UUID_BYTES].translate(_V4_VERSION)
+        records[8::_UUID_BYTES] = records[8::_UUID_BYTES].translate(_V4_VARIANT)
+        yield records
+        if remaining is not None:
+            remaining -= block
+
+
+# Time-ordered UUIDs (RFC 9562 versions 6 and 7) put the timestamp in the top
+# bits, so ids sort by creation time first.  Version 6 counts 100 ns intervals
+# since the Gregorian epoch, split 48/12 around the version nibble; version 7
+# counts milliseconds since the Unix epoch in the top 48 bits.
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_GREGORIAN_EPOCH = datetime(1582, 10, 15, tzinfo=timezone.utc)
+_VERSION_SHIFT = 76
+_VARIANT = 0b10 << 62
+_VARIANT_MASK = 0b11 << 62
+_TIME_RESOLUTION = {6: 10_000_000, 7: 1000}  # ticks per second
+_TIME_BITS = {6: 60, 7: 48}
+
+
+def _ticks(ts: datetime | float, epoch: datetime, per_second: int) -> int:
+    """Return the number of whole ticks from epoch to ts, rounding down."""
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            raise ValueError("datetime must be timezone-aware.")
+        # Exact integer arithmetic; a timedelta's seconds and microseconds are
+        # never negative, so flooring the microseconds floors the total.
+        delta = ts - epoch
+        seconds = delta.days * 86400 + delta.seconds
+        return seconds * per_second + delta.microseconds * per_second // 1_000_000
+    if isinstance(ts, int):
+        ticks = ts * per_second
+    else:
+        # Scale the float's shortest repr, the value it was written as: the
+        # binary value of 1.001 is just below it, and times 1000 floors to 1000.
+        ticks = math.floor(Decimal(repr(ts)) * per_second)
+    return ticks + _ticks(_UNIX_EPOCH, epoch, per_second)
+
+
+def _time_bounds(ts: datetime | float, version: int) -> tuple[int, int]:
+    """Return the least and greatest id values of a UUID version for ts's tick."""
+    if version not in _TIME_RESOLUTION:
+        raise ValueError("version must be 6 or 7.")
+    if version == 6 and isinstance(ts, float):
+        # A float of POSIX seconds today holds about 0.2 us, so its 100 ns
+        # tick is often wrong.
+        raise TypeError("version 6 needs ts as a datetime or int, not a float.")
+    epoch = _UNIX_EPOCH if version == 7 else _GREGORIAN_EPOCH
+    ticks = _ticks(ts, epoch, _TIME_RESOLUTION[version])
+    if not 0 <= ticks < 1 << _TIME_BITS[version]:
+        raise ValueError(f"time is outside the range of version {version} UUIDs.")
+    if version == 7:
+        # Everything below the timestamp is counter or random, bar the
+        # version and variant.
+        low = ticks << 80
+        fill = 0xFFF << 64
+    else:
+        low = (ticks >> 12) << 80 | (ticks & 0xFFF) << 64
+        fill = 0
+    low |= version << _VERSION_SHIFT | _VARIANT
+    return low, low | fill | (1 << 62) - 1
+
+
+# Shard assignment is Lamping and Veach's jump consistent hash ("A Fast,
+# Minimal Memory, Consistent Hash Algorithm", 2014), keyed on the id folded to
+# 64 bits.  Going from n to n + 1 shards moves only the 1/(n + 1) of ids that
+# land in the new shard, and the result depends on nothing but the id and n,
+# so it is the same in every process and matches other implementations of the
+# algorithm given the same key.
+_MASK64 = (1 << 64) - 1
+_JUMP_MULTIPLIER = 2862933555777941757
+_MAX_SHARDS = (1 << 31) - 1
+
+
+def _shard_key(value: int) -> int:
+    """Fold a 128-bit id value to the 64-bit jump hash key: high XOR low."""
+    return (value >> 64) ^ (value & _MASK64)
+
+
+def _check_shards(n: int) -> None:
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("n must be an int.")
+    if not 1 <= n <= _MAX_SHARDS:
+        raise ValueError(f"n must be between 1 and {_MAX_SHARDS}.")
+
+
+def jump_hash(key: int, n: int) -> int:
+    """Return the bucket in range(n) for a 64-bit key, by jump consistent hash.
+
+    The float arithmetic follows the reference implementation exactly, so
+    results agree with it for the same key.
+    """
+    bucket, jump = -1, 0
+    while jump < n:
+        bucket = jump
+        key = (key * _JUMP_MULTIPLIER + 1) & _MASK64
+        jump = int((bucket + 1) * (2147483648.0 / ((key >> 33) + 1)))
+    return bucket
+
+
+def _str_to_int(value: str) -> int:
+    # Base62 is the canonical form, but our encoding of any in-range id is at
+    # most _MAX_BASE62_ID_LEN chars; a longer string can only be a UUID (36-char
+    # dashed or 32-char dashless hex).  Parse those as a UUID first so e.g.
+    # uuid.hex round-trips instead of silently mis-decoding as a base62 value.
+    # No string this short is ever a valid UUID, so shorter input takes the
+    # base62 path directly.
+    if len(value) > _MAX_BASE62_ID_LEN:
+        try:
+            return UUID(value).int
+        except ValueError:
+            pass
+    return b62decode(value)
+
+
+def _is_uuid_str(value: str) -> bool:
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _ordered_str_to_int(value: str) -> int:
+    # As _str_to_int(), for the fixed-width ordered encoding: every encoding
+    # is exactly _MAX_BASE62_ID_LEN chars, so a longer string is a UUID.
+    if len(value) > _MAX_BASE62_ID_LEN:
+        try:
+            return UUID(value).int
+        except ValueError:
+            pass
+    return b62decode_ordered(value)
+
+
+# The observer installed by resource_id.metrics.enable(), or None.  While it
+# is None, instrumentation costs each parse and encode one global lookup.
+_observer: "_Observer | None" = None
+
+
 class ResourceId:
-    __slots__ = ["value"]
+    # _str memoizes the base62 encoding; it is None until first needed.
+    __slots__ = ["value", "_str"]
     uuid_gen = staticmethod(uuid4)
+    # The string codec: _encode(int) -> str and _decode(str) -> int, where
+    # _decode also accepts UUID strings and _decode_base62 accepts only the
+    # encoding.  Subclasses with another encoding (see SortableResourceId)
+    # replace all three, along with _canonical_str() and is_valid().
+    _encode = staticmethod(b62encode)
+    _decode = staticmethod(_str_to_int)
+    _decode_base62 = staticmethod(b62decode)
 
     def __init__(self, value: ResourceIdValue | None = None):
         if value is None:
             value = self.uuid_gen()
-        int_value = self._to_int(value)
-        # A ResourceId must fit in a UUID, so .uuid is always valid: reject
-        # out-of-range values at construction rather than deferring the failure.
-        if int_value < 0:
-            raise ValueError("value must be non-negative.")
-        if int_value >> UUID_BITS:
-            raise ValueError(f"value must fit in a UUID (< 2**{UUID_BITS}).")
+            observer = None
+        else:
+            observer = _observer
+            if observer is not None:
+                started = observer.start()
+        try:
+            int_value = self._to_int(value)
+            # A ResourceId must fit in a UUID, so .uuid is always valid: reject
+            # out-of-range values at construction rather than deferring the
+            # failure.
+            if int_value < 0:
+                raise ValueError("value must be non-negative.")
+            if int_value >> UUID_BITS:
+                raise ValueError(_RANGE_ERROR)
+        except (TypeError, ValueError) as error:
+            if observer is not None:
+                observer.invalid(type(self), value, error)
+            raise
         self.value = int_value
+        self._str = self._canonical_str(value)
+        if observer is not None:
+            observer.parsed(value, started)
+
+    @classmethod
+    def generate_many(cls: type[_ResourceIdT], count: int) -> list[_ResourceIdT]:
+        """Generate count random (version 4 UUID) ids.
+
+        Equivalent to calling ResourceId() count times with the default
+        uuid_gen, but randomness is read in blocks and no UUID objects are
+        built.  See also ResourceIdArray.generate().
+        """
+        ids: list[_ResourceIdT] = []
+        from_trusted_int = cls.from_trusted_int
+        for records in _random_v4_blocks(count):
+            ids.extend(
+                from_trusted_int(
+                    int.from_bytes(records[offset : offset + _UUID_BYTES], "big")
+                )
+                for offset in range(0, len(records), _UUID_BYTES)
+            )
+        return ids
+
+    @classmethod
+    def iter_generate(
+        cls: type[_ResourceIdT], count: int | None = None
+    ) -> Iterator[_ResourceIdT]:
+        """Yield count random ids, or random ids indefinitely if count is None."""
+        from_trusted_int = cls.from_trusted_int
+        for records in _random_v4_blocks(count):
+            for offset in range(0, len(records), _UUID_BYTES):
+                yield from_trusted_int(
+                    int.from_bytes(records[offset : offset + _UUID_BYTES], "big")
+                )
+
+    @classmethod
+    def new_ordered(cls: type[_ResourceIdT]) -> _ResourceIdT:
+        """Generate a time-ordered id (an RFC 9562 version 7 UUID).
+
+        Ids generated later in a process compare greater, which keeps inserts
+        into a B-tree index local.  To make ResourceId() generate these, set
+        ``uuid_gen = staticmethod(resource_id.uuid7.uuid7)`` on a subclass.
+        """
+        return cls.from_trusted_int(_uuid7_int())
+
+    @classmethod
+    def min_for_time(
+        cls: type[_ResourceIdT], ts: datetime | float, version: int = 7
+    ) -> _ResourceIdT:
+        """Return the least time-ordered id with the timestamp of ts.
+
+        ts is a timezone-aware datetime or POSIX seconds; version is the RFC
+        9562 UUID version, 7 (the default, as made by new_ordered()) or 6.
+        Version 6 ticks are finer than a float holds, so with version 6, ts
+        must be a datetime or whole seconds as an int; a float is a TypeError.
+        Bounds cover the whole tick containing ts, a millisecond for version 7
+        and 100 ns for version 6, so ``id >= min_for_time(start)`` selects
+        the ids of that version created in start's tick or later.
+        """
+        return cls.from_trusted_int(_time_bounds(ts, version)[0])
+
+    @classmethod
+    def max_for_time(
+        cls: type[_ResourceIdT], ts: datetime | float, version: int = 7
+    ) -> _ResourceIdT:
+        """Return the greatest time-ordered id with the timestamp of ts.
+
+        The counterpart of min_for_time(): ``id <= max_for_time(end)`` selects
+        the ids of that version created in end's tick or earlier, and
+        ``id < min_for_time(end)`` those created before end's tick.
+        """
+        return cls.from_trusted_int(_time_bounds(ts, version)[1])
+
+    @classmethod
+    def from_trusted_int(cls: type[_ResourceIdT], value: int) -> _ResourceIdT:
+        """Build an id from an int, without checking it.
+
+        The fastest constructor, for ints from a trusted source such as
+        another id's value.  value must be an int in range(2**128), or the id
+        is invalid: its str() and uuid are wrong or raise.
+        """
+        rid = cls.__new__(cls)
+        rid.value = value
+        rid._str = None
+        return rid
+
+    @classmethod
+    def from_int(cls: type[_ResourceIdT], value: int) -> _ResourceIdT:
+        """Build an id from an int in range(2**128).
+
+        ResourceId(value) without its type dispatch: ValueError if value is
+        out of range.
+        """
+        observer = _observer
+        try:
+            if type(value) is not int:
+                # As the constructor: bool, float and other number types are
+                # not ids, and an int subclass is stored as a plain int.
+                if isinstance(value, bool) or not isinstance(value, int):
+                    raise TypeError("value must be an int.")
+                value = operator.index(value)
+            if value < 0:
+                raise ValueError("value must be non-negative.")
+            if value >> UUID_BITS:
+                raise ValueError(_RANGE_ERROR)
+        except (TypeError, ValueError) as error:
+            if observer is not None:
+                observer.invalid(cls, value, error)
+            raise
+        if observer is not None:
+            observer.parsed(value, None)
+        return cls.from_trusted_int(value)
+
+    @classmethod
+    def from_uuid(cls: type[_ResourceIdT], value: UUID) -> _ResourceIdT:
+        """Build an id from a UUID: ResourceId(value) without its type dispatch."""
+        observer = _observer
+        try:
+            int_value = value.int
+        except AttributeError:
+            error = TypeError("value must be a UUID.")
+            if observer is not None:
+                observer.invalid(cls, value, error)
+            raise error from None
+        if observer is not None:
+            observer.parsed(value, None)
+        return cls.from_trusted_int(int_value)
+
+    @classmethod
+    def from_str(cls: type[_ResourceIdT], value: str) -> _ResourceIdT:
+        """Parse a str: ResourceId(value) without its type dispatch.
+
+        Accepts the id's encoding or a UUID string, as the constructor does;
+        ValueError if value is neither.
+        """
+        return cls._from_decoded(value, cls._decode)
+
+    @classmethod
+    def from_base62(cls: type[_ResourceIdT], value: str) -> _ResourceIdT:
+        """Parse the id's encoding, as made by str(), and nothing else.
+
+        Like from_str(), but a UUID string is a ValueError rather than
+        another way of writing the id.
+        """
+        return cls._from_decoded(value, cls._decode_base62)
+
+    @classmethod
+    def _from_instance(cls: type[_ResourceIdT], value: "ResourceId") -> _ResourceIdT:
+        """Return value as an instance of cls, passing it through if it is one.
+
+        An instance of a subclass with another encoding (a SortableResourceId
+        where a ResourceId is expected, or the reverse) is converted: passed
+        through, it would serialize as a string that cls decodes to another
+        value.
+        """
+        if type(value)._encode is cls._encode and isinstance(value, cls):
+            return value
+        return cls.from_trusted_int(value.value)
+
+    @classmethod
+    def _from_decoded(
+        cls: type[_ResourceIdT], value: str, decode: Callable[[str], int]
+    ) -> _ResourceIdT:
+        observer = _observer
+        if observer is not None:
+            started = observer.start()
+        try:
+            if type(value) is not str:
+                raise TypeError("value must be a str.")
+            int_value = decode(value)
+            if int_value >> UUID_BITS:
+                raise ValueError(_RANGE_ERROR)
+        except (TypeError, ValueError) as error:
+            if observer is not None:
+                observer.invalid(cls, value, error)
+            raise
+        rid = cls.from_trusted_int(int_value)
+        rid._str = cls._canonical_str(value)
+        if observer is not None:
+            observer.parsed(value, started)
+        return rid
+
+    @classmethod
+    def _canonical_str(cls, value: object) -> str | None:
+        """Return the base62 encoding of a just-validated input, if it is free.
+
+        A str of base62 length without leading zeros is already the canonical
+        encoding; another ResourceId with the same encoding may have one
+        cached.
+        """
+        if type(value) is str:
+            if len(value) <= _MAX_BASE62_ID_LEN and (value[0] != "0" or value == "0"):
+                return value
+            return None
+        if isinstance(value, ResourceId) and type(value)._encode is cls._encode:
+            return value._str
+        return None
+
+    @classmethod
+    def from_str_cached(cls: type[_ResourceIdT], value: str) -> _ResourceIdT:
+        """Parse value through the process-wide parse cache.
+
+        Repeated calls with the same string return the same shared instance
+        instead of parsing again.  The cache is a bounded LRU; see
+        set_parse_cache_size() and parse_cache_info().
+        """
+        if type(value) is not str:
+            raise TypeError("value must be a str.")
+        return _parse_cached(cls, value)
+
+    @staticmethod
+    def set_parse_cache_size(maxsize: int) -> None:
+        """Replace the parse cache with an empty one holding at most maxsize ids.
+
+        A maxsize of 0 disables caching: from_str_cached() then parses every
+        call, though misses are still counted.
+        """
+        global _parse_cached
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative.")
+        _parse_cached = lru_cache(maxsize=maxsize)(_parse)
+
+    @staticmethod
+    def parse_cache_info():
+        """Return the parse cache's (hits, misses, maxsize, currsize)."""
+        return _parse_cached.cache_info()
+
+    @classmethod
+    def is_valid(cls, value: object) -> bool:
+        """Return True if value is a str that ResourceId accepts.
+
+        Unlike ``ResourceId(value)``, this never raises, and for base62 input
+        it checks the characters and range without decoding the value.
+        """
+        if not isinstance(value, str):
+            return False
+        if len(value) > _MAX_BASE62_ID_LEN and _is_uuid_str(value):
+            return True
+        return _is_base62_id(value)
 
     @property
     def uuid(self) -> UUID:
         return UUID(int=self.value)
 
+    @property
+    def timestamp(self) -> datetime | None:
+        """The creation time of a version 1, 6 or 7 UUID id, in UTC.
+
+        None for other ids, including random (version 4) ones, and for
+        timestamps past datetime.max.  Version 7 timestamps have millisecond
+        resolution; versions 1 and 6 are truncated to microseconds.
+        """
+        value = self.value
+        if value & _VARIANT_MASK != _VARIANT:
+            return None
+        version = value >> _VERSION_SHIFT & 0xF
+        try:
+            if version == 7:
+                return _UNIX_EPOCH + timedelta(milliseconds=value >> 80)
+            if version == 6:
+                ticks = (value >> 80) << 12 | value >> 64 & 0xFFF
+            elif version == 1:
+                # time_low, time_mid, version, time_hi: the low bits first.
+                ticks = (
+                    (value >> 64 & 0xFFF) << 48
+                    | (value >> 80 & 0xFFFF) << 32
+                    | value >> 96
+                )
+            else:
+                return None
+            return _GREGORIAN_EPOCH + timedelta(microseconds=ticks // 10)
+        except OverflowError:
+            return None
+
+    def shard(self, n: int) -> int:
+        """Return the shard, in range(n), that this id belongs to.
+
+        Uses jump consistent hash on the id's high and low 64 bits XORed
+        together: the assignment is stable across processes and machines, and
+        changing n from m to m + 1 moves only about 1/(m + 1) of ids, all of
+        them to the new shard.  n is at most 2**31 - 1.
+        """
+        _check_shards(n)
+        return jump_hash(_shard_key(self.value), n)
+
+    @classmethod
+    def shard_many(cls, values: Iterable[ResourceIdValue], n: int) -> list[int]:
+        """Return the shard of each of values, as shard() would.
+
+        values may hold anything ResourceId accepts.  For a ResourceIdArray,
+        its shards() method skips building ResourceId objects.
+        """
+        _check_shards(n)
+        shards = []
+        for value in values:
+            if not isinstance(value, ResourceId):
+                value = cls(value)
+            shards.append(jump_hash(_shard_key(value.value), n))
+        return shards
+
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({b62encode(self.value)})"
+        return f"{self.__class__.__name__}({self})"
 
     def __str__(self) -> str:
-        return b62encode(self.value)
+        encoded = self._str
+        if encoded is None:
+            observer = _observer
+            if observer is None:
+                encoded = self._str = self._encode(self.value)
+            else:
+                encoded = self._str = observer.encode(self._encode, self.value)
+        return encoded
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
@@ -121,26 +722,36 @@ class ResourceId:
     def __int__(self):
         return self.value
 
-    @staticmethod
-    def _to_int(value: object):
+    def to_bytes(self) -> bytes:
+        """Return the value as 16 big-endian bytes, the layout of UUID.bytes."""
+        return self.value.to_bytes(_UUID_BYTES, "big")
+
+    @classmethod
+    def from_bytes(
+        cls: type[_ResourceIdT], data: bytes | bytearray | memoryview
+    ) -> _ResourceIdT:
+        """Build a ResourceId from 16 big-endian bytes, as made by to_bytes()."""
+        return cls.from_trusted_int(_int_from_bytes(data))
+
+    # Ids are immutable, so copies may share the original.  A pickle carries
+    # just the class and the int value, and unpickling skips re-validation.
+    def __reduce__(self):
+        return (_unpickle, (self.__class__, self.value))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]):
+        return self
+
+    @classmethod
+    def _to_int(cls, value: object):
         # value is typed `object`, not ResourceIdValue: __init__ enforces the
         # accepted types at type-check time, but this validator must also defend
         # against untyped callers (pydantic, dynamic code) at runtime.
         match value:
             case str():
-                # Base62 is the canonical form, but our encoding of any in-range
-                # id is at most _MAX_BASE62_ID_LEN chars; a longer string can
-                # only be a UUID (36-char dashed or 32-char dashless hex).
-                # Parse those as a UUID first so e.g. uuid.hex round-trips
-                # instead of silently mis-decoding as a base62 value.  No string
-                # this short is ever a valid UUID, so shorter input takes the
-                # base62 path directly.
-                if len(value) > _MAX_BASE62_ID_LEN:
-                    try:
-                        return UUID(value).int
-                    except ValueError:
-                        pass
-                return b62decode(value)
+                return cls._decode(value)
             case ResourceId():
                 # idempotent/copy construction; pydantic re-validates by calling
                 # ResourceId(value) even when value is already a ResourceId.
@@ -155,8 +766,11 @@ class ResourceId:
                 # them at type-check time; this rejects them at runtime via the
                 # default case.  __init__ enforces the value range.
                 return value
+            case bytes() | bytearray() | memoryview():
+                # A fixed-width big-endian value, the layout of UUID.bytes.
+                return _int_from_bytes(value)
             case _:
-                raise TypeError("value must be a str, int, or UUID.")
+                raise TypeError("value must be a str, int, UUID, or bytes.")
 
     @classmethod
     def _json_schema(cls):
@@ -171,19 +785,93 @@ class ResourceId:
     def __get_pydantic_core_schema__(
         cls,
         source_type: Any,
-        handler: GetCoreSchemaHandler,
-    ) -> CoreSchema:  # type: ignore
-        return core_schema.no_info_plain_validator_function(
-            cls,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                str, return_schema=core_schema.str_schema()
+        handler: "GetCoreSchemaHandler",
+    ) -> "CoreSchema":
+        # pydantic is imported here, when pydantic asks for the schema, so
+        # that importing resource_id does not import it.
+        from pydantic_core import core_schema
+
+        # Type dispatch and range checks run in pydantic-core: an int is
+        # bounds-checked before a validation-free constructor, and only str
+        # (and, from Python, bytes) input calls back into a parser.  An
+        # instance goes through _from_instance(), which passes it through
+        # unless its encoding differs.  The serializer has pydantic-core call
+        # str(), which returns the memoized encoding.
+        from_instance = core_schema.chain_schema(
+            [
+                core_schema.is_instance_schema(ResourceId),
+                core_schema.no_info_plain_validator_function(cls._from_instance),
+            ]
+        )
+        from_str = core_schema.chain_schema(
+            [
+                core_schema.str_schema(strict=True),
+                core_schema.no_info_plain_validator_function(cls.from_str),
+            ]
+        )
+        from_int = core_schema.chain_schema(
+            [
+                core_schema.int_schema(strict=True, ge=0, lt=1 << UUID_BITS),
+                core_schema.no_info_plain_validator_function(cls.from_int),
+            ]
+        )
+        from_uuid = core_schema.chain_schema(
+            [
+                core_schema.is_instance_schema(UUID),
+                core_schema.no_info_plain_validator_function(cls.from_uuid),
+            ]
+        )
+        from_bytes = core_schema.chain_schema(
+            [
+                core_schema.bytes_schema(strict=True, min_length=16, max_length=16),
+                core_schema.no_info_plain_validator_function(cls.from_bytes),
+            ]
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=cls._union_schema([from_str, from_int]),
+            python_schema=cls._union_schema(
+                [
+                    from_instance,
+                    from_str,
+                    from_int,
+                    from_uuid,
+                    from_bytes,
+                ]
             ),
-        )  # type: ignore
+            serialization=core_schema.to_string_ser_schema(when_used="always"),
+        )
+
+    @classmethod
+    def _union_schema(cls, choices: list["CoreSchema"]) -> "CoreSchema":
+        from pydantic_core import core_schema
+
+        # One error for the whole union, rather than one per branch.
+        return core_schema.union_schema(
+            choices,
+            mode="left_to_right",
+            custom_error_type="resource_id",
+            custom_error_message=f"Input should be a valid {cls.__name__}",
+        )
 
     @classmethod
     def __get_pydantic_json_schema__(
         cls,
-        _core_schema: core_schema.CoreSchema,
-        handler: GetJsonSchemaHandler,
-    ) -> JsonSchemaValue:
+        _core_schema: "CoreSchema",
+        handler: "GetJsonSchemaHandler",
+    ) -> "JsonSchemaValue":
         return cls._json_schema()
+
+
+def _unpickle(cls: type[_ResourceIdT], value: int) -> _ResourceIdT:
+    return cls.from_trusted_int(value)
+
+
+def _parse(cls: type[_ResourceIdT], value: str) -> _ResourceIdT:
+    return cls(value)
+
+
+# The parse cache behind ResourceId.from_str_cached.  lru_cache is thread-safe;
+# keying on cls keeps subclasses from receiving each other's instances.
+# Invalid input raises and so is never cached.
+_DEFAULT_PARSE_CACHE_SIZE = 4096
+_parse_cached = lru_cache(maxsize=_DEFAULT_PARSE_CACHE_SIZE)(_parse)
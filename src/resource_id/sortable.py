@@ -0,0 +1,66 @@
+"""ResourceIds whose string form sorts like the id.
+
+The default encoding is short but does not preserve order: it is variable
+width, and its alphabet (``0-9a-zA-Z``) puts lowercase before uppercase, the
+reverse of ASCII.  :class:`SortableResourceId` is written as exactly 22 digits
+of ``0-9A-Za-z`` instead, so comparing two encodings as strings or bytes gives
+the same answer as comparing the ids::
+
+    from resource_id import ResourceId, SortableResourceId
+
+    str(ResourceId(1000))                # 'g8'
+    str(SortableResourceId(1000))        # '00000000000000000000G8'
+    sorted(map(str, ids)) == [str(i) for i in sorted(ids)]
+
+That makes the encoding suitable as a key in sorted string stores and object
+store prefixes, where a range scan over keys is a range scan over ids.  It
+decodes only its own form, plus the UUID forms every ResourceId accepts: a
+default-encoded string is rejected rather than misread, since the same
+characters mean different values in the two alphabets.
+"""
+
+from .resource_id import (
+    _MAX_BASE62_ID_LEN,
+    ResourceId,
+    _is_ordered_id,
+    _is_uuid_str,
+    _ordered_str_to_int,
+    b62decode_ordered,
+    b62encode_ordered,
+)
+
+__all__ = ["SortableResourceId"]
+
+
+class SortableResourceId(ResourceId):
+    """A ResourceId encoded as 22 ASCII-ordered base62 digits."""
+
+    __slots__ = []
+    _encode = staticmethod(b62encode_ordered)
+    _decode = staticmethod(_ordered_str_to_int)
+    _decode_base62 = staticmethod(b62decode_ordered)
+
+    @classmethod
+    def _canonical_str(cls, value: object) -> str | None:
+        # Every accepted str of this width is the (unique) encoding itself.
+        if type(value) is str:
+            return value if len(value) == _MAX_BASE62_ID_LEN else None
+        return super()._canonical_str(value)
+
+    @classmethod
+    def is_valid(cls, value: object) -> bool:
+        """Return True if value is a str that SortableResourceId accepts."""
+        if not isinstance(value, str):
+            return False
+        if len(value) == _MAX_BASE62_ID_LEN:
+            return _is_ordered_id(value)
+        return len(value) > _MAX_BASE62_ID_LEN and _is_uuid_str(value)
+
+    @classmethod
+    def _json_schema(cls):
+        return {
+            "title": cls.__name__,
+            "description": "An opaque identifier whose string form sorts like the id.",
+            "type": "string",
+            "format": "sortable-resource-id",
+        }
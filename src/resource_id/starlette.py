@@ -0,0 +1,92 @@
+"""Starlette (and FastAPI) integration for :class:`ResourceId`.
+
+Importing this module registers ``ResourceId`` as a Starlette path convertor,
+so routes may be declared with ``{id:resourceid}``::
+
+    import resource_id.starlette  # registers the path convertor (side effect)
+
+    @app.get("/widgets/{widget_id:resourceid}")
+    async def get_widget(widget_id: ResourceId): ...
+
+The convertor's regex matches only base62 ids in range and UUIDs (dashed or
+32 hex digits), so any other segment fails at the router with a 404 and never
+reaches the endpoint.  A matched segment is parsed once, by the convertor;
+FastAPI's pydantic validation of the resulting ``ResourceId`` is an instance
+check inside pydantic-core, with no Python callback.
+
+Register the convertor before defining routes that use it: Starlette compiles
+a route's pattern when the route is created.
+
+Requires the ``starlette`` extra: ``pip install resource-id[starlette]``.
+"""
+
+from starlette.convertors import Convertor, register_url_convertor
+
+from .resource_id import (
+    _MAX_BASE62_ID_LEN,
+    ALPHABET,
+    UUID_BITS,
+    ResourceId,
+    ResourceIdValue,
+    b62encode,
+)
+
+__all__ = ["ResourceIdConvertor"]
+
+
+def _char_class(digits: int) -> str:
+    """Return a regex character class matching the base62 digits below digits."""
+    chars = ALPHABET[:digits]
+    ranges = []
+    start = previous = chars[0]
+    for char in chars[1:]:
+        if ord(char) != ord(previous) + 1:
+            ranges.append(f"{start}-{previous}" if start != previous else start)
+            start = char
+        previous = char
+    ranges.append(f"{start}-{previous}" if start != previous else start)
+    return f"[{''.join(ranges)}]"
+
+
+def _base62_id_regex() -> str:
+    """Return a regex for base62 strings of at most 22 digits encoding < 2**128.
+
+    Strings shorter than the maximum are always in range.  At full length,
+    the regex walks the digits of the maximum id: at each position a smaller
+    digit may be followed by anything, an equal one must be followed by a
+    string in range for the remaining positions.
+    """
+    digit = "[0-9a-zA-Z]"
+    maximum = b62encode((1 << UUID_BITS) - 1)
+    width = _MAX_BASE62_ID_LEN
+    pattern = _char_class(ALPHABET.index(maximum[-1]) + 1)
+    for position in range(width - 2, -1, -1):
+        limit = ALPHABET.index(maximum[position])
+        rest = width - 1 - position
+        equal = f"{maximum[position]}{pattern}"
+        pattern = (
+            f"(?:{_char_class(limit)}{digit}{{{rest}}}|{equal})" if limit else equal
+        )
+    return f"{digit}{{1,{width - 1}}}|{pattern}"
+
+
+_UUID_REGEX = (
+    "[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+)
+
+
+class ResourceIdConvertor(Convertor[ResourceId]):
+    """Starlette path convertor for base62 and UUID forms of a ResourceId."""
+
+    regex = f"(?:{_UUID_REGEX}|{_base62_id_regex()})"
+
+    def convert(self, value: str) -> ResourceId:
+        return ResourceId.from_str(value)
+
+    def to_string(self, value: ResourceIdValue) -> str:
+        if not isinstance(value, ResourceId):
+            value = ResourceId(value)
+        return str(value)
+
+
+register_url_convertor("resourceid", ResourceIdConvertor())
@@ -0,0 +1,123 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from resource_id import ResourceId
+from resource_id.asyncpg import copy_ids_to_table, decode, encode, register_codec
+
+
+class FakeConnection:
+    """Records the calls the module makes on an asyncpg connection."""
+
+    def __init__(self) -> None:
+        self.codecs: dict[str, dict[str, Any]] = {}
+        self.copied: list[tuple[Any, ...]] = []
+        self.copy_kwargs: dict[str, Any] = {}
+
+    async def set_type_codec(self, typename: str, **kwargs: Any) -> None:
+        self.codecs[typename] = kwargs
+
+    async def copy_records_to_table(self, table_name: str, **kwargs: Any) -> str:
+        records = kwargs.pop("records")
+        if hasattr(records, "__aiter__"):
+            self.copied = [record async for record in records]
+        else:
+            self.copied = list(records)
+        # Encode each value as asyncpg would for a uuid column.
+        encoder = self.codecs["uuid"]["encoder"]
+        for (value,) in self.copied:
+            assert len(encoder(value)) == 16
+        self.copy_kwargs = {"table_name": table_name, **kwargs}
+        return f"COPY {len(self.copied)}"
+
+
+def test_encode_is_uuid_wire_format():
+    value = uuid4()
+    assert encode(ResourceId(value)) == value.bytes
+    assert encode(ResourceId(0)) == bytes(16)
+    assert encode(ResourceId((1 << 128) - 1)) == b"\xff" * 16
+
+
+def test_encode_coerces_other_values():
+    value = uuid4()
+    assert encode(value) == value.bytes
+    assert encode(value.int) == value.bytes
+    assert encode(str(ResourceId(value))) == value.bytes
+
+
+def test_encode_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        encode(-1)
+    with pytest.raises(TypeError):
+        encode(1.5)  # type: ignore[arg-type]
+
+
+def test_decode():
+    value = uuid4()
+    decoded = decode(value.bytes)
+    assert type(decoded) is ResourceId
+    assert decoded == ResourceId(value)
+    assert decoded.uuid == value
+
+
+def test_decode_rejects_wrong_length():
+    with pytest.raises(ValueError):
+        decode(b"\x00" * 15)
+
+
+def test_register_codec():
+    connection = FakeConnection()
+    asyncio.run(register_codec(connection))  # type: ignore[arg-type]
+    assert connection.codecs == {
+        "uuid": {
+            "schema": "pg_catalog",
+            "encoder": encode,
+            "decoder": decode,
+            "format": "binary",
+        }
+    }
+
+
+def test_copy_ids_to_table():
+    connection = FakeConnection()
+    asyncio.run(register_codec(connection))  # type: ignore[arg-type]
+    ids = [ResourceId(uuid4()), UUID(int=1), "47"]
+    status = asyncio.run(
+        copy_ids_to_table(connection, "widget", ids, column="id")  # type: ignore[arg-type]
+    )
+    assert status == "COPY 3"
+    assert connection.copied == [(value,) for value in ids]
+    assert connection.copy_kwargs == {
+        "table_name": "widget",
+        "columns": ["id"],
+        "schema_name": None,
+        "timeout": None,
+    }
+
+
+def test_copy_ids_to_table_from_async_iterable():
+    connection = FakeConnection()
+    asyncio.run(register_codec(connection))  # type: ignore[arg-type]
+    ids = [ResourceId(n) for n in range(5)]
+
+    async def source() -> AsyncIterator[ResourceId]:
+        for value in ids:
+            yield value
+
+    status = asyncio.run(
+        copy_ids_to_table(
+            connection,  # type: ignore[arg-type]
+            "widget",
+            source(),
+            column="id",
+            schema_name="app",
+            timeout=5.0,
+        )
+    )
+    assert status == "COPY 5"
+    assert connection.copied == [(value,) for value in ids]
+    assert connection.copy_kwargs["schema_name"] == "app"
+    assert connection.copy_kwargs["timeout"] == 5.0
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from resource_id import ResourceId, batch  # noqa: E402
+from resource_id.resource_id import b62encode  # noqa: E402
+
+_rng = random.Random(5)
+VALUES = [0, 1, 61, 62, (1 << 64) - 1, 1 << 64, (1 << 128) - 1] + [
+    _rng.getrandbits(128) for _ in range(500)
+]
+HI = np.array([value >> 64 for value in VALUES], dtype=np.uint64)
+LO = np.array([value & ((1 << 64) - 1) for value in VALUES], dtype=np.uint64)
+
+
+def test_b62encode_matches_scalar():
+    encoded = batch.b62encode(HI, LO)
+    assert encoded.dtype == np.dtype("S22")
+    assert [row.decode().lstrip("0") or "0" for row in encoded] == [
+        b62encode(value) for value in VALUES
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["S", "U"])
+def test_b62decode_round_trips_scalar_encoding(dtype: str):
+    # Scalar encodings vary in length, so most rows are NUL-padded.
+    values = np.array([b62encode(value) for value in VALUES]).astype(dtype)
+    hi, lo, valid = batch.b62decode(values)
+    assert valid.all()
+    assert (hi == HI).all() and (lo == LO).all()
+
+
+def test_b62decode_round_trips_batch_encoding():
+    hi, lo, valid = batch.b62decode(batch.b62encode(HI, LO))
+    assert valid.all()
+    assert (hi == HI).all() and (lo == LO).all()
+
+
+def test_b62decode_masks_invalid_rows():
+    values = np.array(
+        [
+            "",
+            "a!",
+            "a\x00b",
+            "é",
+            b62encode(1 << 128),
+            "0" * 30 + "1",
+            "zz",
+        ]
+    )
+    hi, lo, valid = batch.b62decode(values)
+    assert valid.tolist() == [False, False, False, False, False, True, True]
+    assert hi.tolist() == [0] * 7
+    assert lo.tolist() == [0, 0, 0, 0, 0, 1, 35 * 62 + 35]
+
+
+def test_b62decode_rejects_non_string_arrays():
+    with pytest.raises(TypeError):
+        batch.b62decode(np.arange(3))
+
+
+def test_records_round_trip():
+    records = batch.join_records(HI, LO)
+    assert records.shape == (len(VALUES), 16)
+    assert bytes(records[-1]) == VALUES[-1].to_bytes(16, "big")
+    hi, lo = batch.split_records(records)
+    assert (hi == HI).all() and (lo == LO).all()
+
+
+def test_split_records_checks_shape():
+    with pytest.raises(ValueError):
+        batch.split_records(np.zeros((2, 8), dtype=np.uint8))
+
+
+def test_mismatched_words():
+    with pytest.raises(ValueError):
+        batch.b62encode(HI, LO[:-1])
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 1000, (1 << 31) - 1])
+def test_shard_matches_scalar(n: int):
+    shards = batch.shard(HI, LO, n)
+    assert shards.dtype == np.int64
+    assert shards.tolist() == [ResourceId(value).shard(n) for value in VALUES]
+
+
+def test_shard_empty():
+    assert batch.shard([], [], 3).tolist() == []
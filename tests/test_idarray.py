@@ -0,0 +1,165 @@
+import pickle
+from uuid import UUID
+
+import pytest
+
+import resource_id.idarray as idarray
+from resource_id import ResourceId, ResourceIdArray
+from resource_id.idarray import RECORD_SIZE
+
+
+def test_init_accepts_any_resource_id_value():
+    ids = ResourceIdArray([1, "11", UUID(int=7), ResourceId(9)])
+    assert list(ids) == [ResourceId(1), ResourceId(63), ResourceId(7), ResourceId(9)]
+    assert len(ids) == 4
+    assert ids.nbytes == 64
+
+
+def test_init_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        ResourceIdArray(["oops!"])
+
+
+def test_generate():
+    ids = ResourceIdArray.generate(5000)
+    assert len(ids) == len(set(ids)) == 5000
+    assert {rid.uuid.version for rid in ids} == {4}
+
+
+def test_indexing():
+    ids = ResourceIdArray([1, 2, 3])
+    assert ids[0] == ResourceId(1)
+    assert ids[-1] == ResourceId(3)
+    assert isinstance(ids[1], ResourceId)
+    with pytest.raises(IndexError):
+        ids[3]
+
+
+def test_slicing():
+    ids = ResourceIdArray([1, 2, 3, 4])
+    assert ids[1:3] == ResourceIdArray([2, 3])
+    assert ids[::-1] == ResourceIdArray([4, 3, 2, 1])
+
+
+def test_append_and_extend():
+    ids = ResourceIdArray()
+    ids.append(2)
+    ids.extend([ResourceId(3), 1])
+    ids.extend(ResourceIdArray([4]))
+    assert [rid.value for rid in ids] == [2, 3, 1, 4]
+
+
+def test_sort():
+    ids = ResourceIdArray([3, 1 << 127, 1, 2])
+    ids.sort()
+    assert [rid.value for rid in ids] == [1, 2, 3, 1 << 127]
+
+
+@pytest.mark.parametrize("sort", [False, True])
+def test_contains(sort: bool):
+    ids = ResourceIdArray([5, 1 << 100, 3, 256])
+    if sort:
+        ids.sort()
+    assert ResourceId(3) in ids
+    assert 256 in ids
+    assert str(ResourceId(1 << 100)) in ids
+    assert 4 not in ids
+    assert (1 << 100) + 1 not in ids
+    assert "oops!" not in ids
+    assert 1.5 not in ids
+
+
+def test_contains_ignores_matches_across_records():
+    # The record of 1 << 64 occurs in the buffer, straddling the records of
+    # 1 and 0.
+    ids = ResourceIdArray([1, 0])
+    assert (1 << 64).to_bytes(16, "big") in ids.to_bytes()
+    assert (1 << 64) not in ids
+
+
+def test_append_tracks_order():
+    ids = ResourceIdArray()
+    for value in (1, 2, 3):
+        ids.append(value)
+    assert 2 in ids
+    ids.append(0)
+    assert 0 in ids
+
+
+def test_bytes_round_trip():
+    ids = ResourceIdArray([1, (1 << 128) - 1])
+    data = ids.to_bytes()
+    assert data == (1).to_bytes(16, "big") + b"\xff" * 16
+    assert ResourceIdArray.frombuffer(data) == ids
+
+
+def test_frombuffer_does_not_copy():
+    data = bytearray(32)
+    ids = ResourceIdArray.frombuffer(data)
+    data[15] = 1
+    assert ids[0] == ResourceId(1)
+
+
+def test_frombuffer_copies_on_write():
+    data = bytes(16)
+    ids = ResourceIdArray.frombuffer(data)
+    ids.append(1)
+    assert list(ids) == [ResourceId(0), ResourceId(1)]
+    assert data == bytes(16)
+
+
+def test_frombuffer_checks_size():
+    with pytest.raises(ValueError):
+        ResourceIdArray.frombuffer(bytes(17))
+
+
+def test_contains_unsorted_buffer_across_windows(monkeypatch):
+    monkeypatch.setattr(idarray, "_SCAN_BYTES", 2 * RECORD_SIZE)
+    values = [7, 3, 9, 1, 5]
+    ids = ResourceIdArray.frombuffer(ResourceIdArray(values).to_bytes())
+    assert all(value in ids for value in values)
+    assert 4 not in ids
+    # A record made of the tail of one record and the head of the next.
+    straddle = ResourceId(7).to_bytes()[8:] + ResourceId(3).to_bytes()[:8]
+    assert ResourceId.from_bytes(straddle) not in ids
+
+
+@pytest.mark.parametrize("sort", [False, True])
+def test_pickle(sort: bool):
+    ids = ResourceIdArray.frombuffer(ResourceIdArray([3, 1, 2]).to_bytes())
+    if sort:
+        ids.sort()
+    data = pickle.dumps(ids)
+    assert len(data) < 48 + ids.nbytes + 100
+    restored = pickle.loads(data)
+    assert restored == ids
+    assert (2 in restored) and (4 not in restored)
+
+
+def test_view_is_read_only():
+    view = ResourceIdArray([1]).view()
+    assert view.readonly
+    assert view.tobytes() == (1).to_bytes(16, "big")
+
+
+@pytest.mark.parametrize("n", [1, 3, 1000])
+def test_shards(n: int):
+    ids = ResourceIdArray.generate(200)
+    ids.extend([0, (1 << 128) - 1])
+    assert ids.shards(n) == [rid.shard(n) for rid in ids]
+    assert ResourceIdArray.frombuffer(ids.to_bytes()).shards(n) == ids.shards(n)
+
+
+def test_repr():
+    assert repr(ResourceIdArray([1, 62])) == "ResourceIdArray([1, 10])"
+
+
+def test_unhashable():
+    with pytest.raises(TypeError):
+        hash(ResourceIdArray())
+
+
+def test_memory_footprint():
+    values = range(1 << 100, (1 << 100) + 1000)
+    ids = ResourceIdArray(values)
+    assert ids.nbytes == 16 * 1000
@@ -0,0 +1,149 @@
+import pickle
+import random
+import struct
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+import resource_id.idindex as idindex
+from resource_id import ResourceId, ResourceIdArray, ResourceIdIndex, ResourceIdSet
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "ids.ridx"
+
+
+def test_write_and_open(path):
+    index = ResourceIdIndex.write(path, [3, "1", ResourceId(2), 3])
+    assert list(index) == [ResourceId(1), ResourceId(2), ResourceId(3)]
+    assert len(index) == 3
+    assert index.payload_size == 0
+    assert index.nbytes == 16 + 3 * 16
+    reopened = ResourceIdIndex(path)
+    assert list(reopened) == list(index)
+    assert 2 in reopened and 4 not in reopened
+
+
+def test_write_from_set_and_array(path):
+    ids = ResourceIdArray.generate(100)
+    assert list(ResourceIdIndex.write(path, ids)) == sorted(ids)
+    assert list(ResourceIdIndex.write(path, ResourceIdSet(ids))) == sorted(ids)
+
+
+def test_empty(path):
+    index = ResourceIdIndex.write(path, [])
+    assert len(index) == 0
+    assert list(index) == []
+    assert 1 not in index
+
+
+@settings(max_examples=50)
+@given(st.lists(st.integers(min_value=0, max_value=400), max_size=300))
+def test_contains(tmp_path_factory, values: list[int]):
+    path = tmp_path_factory.mktemp("index") / "ids.ridx"
+    index = ResourceIdIndex.write(path, values)
+    for probe in range(0, 402):
+        assert (probe in index) == (probe in values)
+
+
+def test_contains_large(path, monkeypatch):
+    # A small fence sample makes blocks large enough to be binary searched.
+    monkeypatch.setattr(idindex, "_MAX_FENCES", 8)
+    rng = random.Random(24)
+    values = [rng.getrandbits(128) for _ in range(4000)]
+    index = ResourceIdIndex.write(path, values[:2000])
+    assert all(value in index for value in values[:2000])
+    assert not any(value in index for value in values[2000:])
+    assert 0 not in index and (1 << 128) - 1 not in index
+
+
+def test_contains_rejects_non_ids(path):
+    index = ResourceIdIndex.write(path, [1])
+    assert "oops!" not in index
+    assert None not in index
+
+
+def test_payloads(path):
+    moves = {ResourceId(value): ResourceId(value * 7).to_bytes() for value in range(50)}
+    index = ResourceIdIndex.write(path, moves, payload_size=16)
+    assert index.payload_size == 16
+    assert len(index) == 50
+    assert ResourceId.from_bytes(index[ResourceId(3)]) == ResourceId(21)
+    assert index[str(ResourceId(4))] == moves[ResourceId(4)]
+    assert index.get(50) is None
+    assert dict(index.items()) == moves
+    assert list(index.keys()) == sorted(moves)
+    with pytest.raises(KeyError):
+        index[99]
+    with pytest.raises(KeyError):
+        index["oops!"]
+
+
+def test_payload_matching_an_id_is_skipped(path):
+    # Entry 1's payload holds the record of id 5, which is not in the index.
+    entries = [(1, ResourceId(5).to_bytes()), (9, bytes(16))]
+    index = ResourceIdIndex.write(path, entries, payload_size=16)
+    assert 5 not in index
+    assert 9 in index
+
+
+def test_pairs_and_set_values(path):
+    index = ResourceIdIndex.write(path, [(2, b"b"), (1, b"a")], payload_size=1)
+    assert list(index.items()) == [(ResourceId(1), b"a"), (ResourceId(2), b"b")]
+    ids = ResourceIdIndex.write(path, [1])
+    assert ids[1] == b""
+
+
+def test_write_rejects_bad_payloads(path):
+    with pytest.raises(ValueError):
+        ResourceIdIndex.write(path, [(1, b"ab")], payload_size=1)
+    with pytest.raises(ValueError):
+        ResourceIdIndex.write(path, [(1, b"a"), ("1", b"b")], payload_size=1)
+    with pytest.raises(ValueError):
+        ResourceIdIndex.write(path, [], payload_size=1 << 16)
+    assert not path.exists()
+    assert list(path.parent.iterdir()) == []
+
+
+def test_write_replaces_file(path):
+    old = ResourceIdIndex.write(path, [1, 2])
+    new = ResourceIdIndex.write(path, [3])
+    assert list(new) == [ResourceId(3)]
+    # The old mapping still reads the file it opened.
+    assert list(old) == [ResourceId(1), ResourceId(2)]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"RIDX",
+        struct.pack(">4sHHQ", b"NOPE", 1, 0, 0),
+        struct.pack(">4sHHQ", b"RIDX", 2, 0, 0),
+        struct.pack(">4sHHQ", b"RIDX", 1, 0, 2) + bytes(16),
+    ],
+)
+def test_open_rejects_bad_files(path, data: bytes):
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ResourceIdIndex(path)
+
+
+def test_pickles_as_path(path):
+    index = ResourceIdIndex.write(path, [1, 2])
+    assert len(pickle.dumps(index)) < 200
+    assert list(pickle.loads(pickle.dumps(index))) == list(index)
+
+
+def test_close(path):
+    with ResourceIdIndex.write(path, [1]) as index:
+        assert 1 in index
+    with pytest.raises(ValueError):
+        1 in index
+
+
+def test_repr(path):
+    index = ResourceIdIndex.write(path, [1], payload_size=0)
+    assert repr(index) == f"ResourceIdIndex({str(path)!r}, len=1, payload_size=0)"
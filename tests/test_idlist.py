@@ -0,0 +1,178 @@
+import pickle
+from uuid import uuid4
+
+import pydantic
+import pytest
+
+from resource_id import (
+    ResourceId,
+    ResourceIdList,
+    ResourceIdListError,
+    SortableResourceId,
+)
+
+
+class BatchIds(ResourceIdList):
+    max_count = 3
+    dedupe = True
+
+
+class SubId(ResourceId): ...
+
+
+class SubIdList(ResourceIdList):
+    item_type = SubId
+
+
+def test_parse():
+    value = uuid4()
+    ids = ResourceIdList.parse(f"47,{value},{value.hex},0")
+    assert list(ids) == [
+        ResourceId(255),
+        ResourceId(value),
+        ResourceId(value),
+        ResourceId(0),
+    ]
+    assert len(ids) == 4
+    assert ids[0] == ResourceId(255)
+    assert ids[-1] == ResourceId(0)
+    assert ids[1:3] == (ResourceId(value), ResourceId(value))
+    assert ResourceId(255) in ids
+
+
+def test_parse_empty():
+    assert len(ResourceIdList.parse("")) == 0
+    assert str(ResourceIdList.parse("")) == ""
+
+
+def test_str_is_canonical():
+    value = uuid4()
+    ids = ResourceIdList.parse(f"47,{value}")
+    assert str(ids) == f"47,{ResourceId(value)}"
+    assert ResourceIdList.parse(str(ids)) == ids
+
+
+def test_repr():
+    assert repr(BatchIds.parse("47,1")) == "BatchIds([47, 1])"
+
+
+def test_construct_from_values():
+    value = uuid4()
+    ids = ResourceIdList([255, value, "1", ResourceId(2)])
+    assert list(ids) == [
+        ResourceId(255),
+        ResourceId(value),
+        ResourceId(1),
+        ResourceId(2),
+    ]
+
+
+def test_construct_rejects_str():
+    with pytest.raises(TypeError, match=r"ResourceIdList\.parse\(\)"):
+        ResourceIdList("abc")
+    with pytest.raises(TypeError, match=r"BatchIds\.parse\(\)"):
+        BatchIds("1,2")
+
+
+def test_every_invalid_position_is_reported():
+    with pytest.raises(ResourceIdListError) as info:
+        ResourceIdList.parse("47,oops!,,deadbeef," + "Z" * 22)
+    assert info.value.positions == [1, 2, 4]
+    assert str(info.value) == "Invalid ResourceId at positions 1, 2, 4."
+    assert isinstance(info.value, ValueError)
+
+
+def test_invalid_values():
+    with pytest.raises(ResourceIdListError) as info:
+        ResourceIdList([1, -1, 1.5, "2"])  # type: ignore[list-item]
+    assert info.value.positions == [1, 2]
+
+
+def test_max_count():
+    assert len(BatchIds.parse("1,2,3")) == 3
+    with pytest.raises(ValueError, match="at most 3 ids"):
+        BatchIds.parse("1,2,3,4")
+    with pytest.raises(ValueError, match="at most 3 ids"):
+        BatchIds([1, 2, 3, 4])
+    # The count is of input items, before deduplication.
+    with pytest.raises(ValueError, match="at most 3 ids"):
+        BatchIds.parse("1,1,1,1")
+
+
+def test_dedupe_keeps_first_occurrence():
+    value = uuid4()
+    ids = BatchIds.parse(f"{value},47,{value.hex}")
+    assert list(ids) == [ResourceId(value), ResourceId(255)]
+    assert list(ResourceIdList.parse("1,1")) == [ResourceId(1), ResourceId(1)]
+
+
+def test_item_type():
+    ids = SubIdList.parse("1,2")
+    assert all(type(rid) is SubId for rid in ids)
+    with pytest.raises(ResourceIdListError, match="Invalid SubId at positions 0"):
+        SubIdList.parse("!")
+
+
+def test_items_of_other_encodings_are_converted():
+    rid = ResourceId(10)
+    ids = ResourceIdList([SortableResourceId(10), rid])
+    assert [type(item) for item in ids] == [ResourceId, ResourceId]
+    assert ids[1] is rid
+    assert ResourceIdList.parse(str(ids)) == ResourceIdList([10, 10])
+
+
+def test_parse_rejects_non_str():
+    with pytest.raises(TypeError):
+        ResourceIdList.parse(["1"])  # type: ignore[arg-type]
+
+
+def test_equality_and_hash():
+    assert ResourceIdList.parse("1,2") == ResourceIdList([1, 2])
+    assert ResourceIdList.parse("1,2") != ResourceIdList.parse("2,1")
+    assert ResourceIdList.parse("1,2") != "1,2"
+    assert hash(ResourceIdList.parse("1,2")) == hash(ResourceIdList([1, 2]))
+
+
+def test_pickle():
+    ids = BatchIds.parse("1,2")
+    restored = pickle.loads(pickle.dumps(ids))
+    assert restored == ids
+    assert type(restored) is BatchIds
+
+
+class Model(pydantic.BaseModel):
+    ids: BatchIds
+
+
+def test_pydantic_validate_and_serialize():
+    model = Model(ids="47,1,47")  # type: ignore[arg-type]
+    assert model.ids == BatchIds([255, 1])
+    assert model.model_dump() == {"ids": "47,1"}
+    assert model.model_dump_json() == '{"ids":"47,1"}'
+    assert Model.model_validate_json('{"ids": "47,1"}') == model
+    assert Model.model_validate_json('{"ids": ["47", "1"]}') == model
+    assert Model(ids=model.ids).ids is model.ids
+
+
+def test_pydantic_error_lists_positions():
+    with pytest.raises(pydantic.ValidationError) as info:
+        Model(ids="1,!,?")  # type: ignore[arg-type]
+    (error,) = info.value.errors()
+    assert error["type"] == "resource_id_list"
+    assert error["msg"] == "Invalid ResourceId at positions 1, 2"
+    assert error["ctx"] == {"positions": [1, 2]}
+
+
+@pytest.mark.parametrize("value", ["1,2,3,4", 42, None])
+def test_pydantic_rejects(value: object):
+    with pytest.raises(pydantic.ValidationError):
+        Model(ids=value)  # type: ignore[arg-type]
+
+
+def test_pydantic_json_schema():
+    assert Model.model_json_schema()["properties"]["ids"] == {
+        "title": "BatchIds",
+        "description": "A comma-separated list of opaque identifiers.",
+        "type": "string",
+        "format": "resource-id-list",
+    }
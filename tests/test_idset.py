@@ -0,0 +1,200 @@
+import pickle
+import random
+from uuid import UUID
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from resource_id import (
+    ResourceId,
+    ResourceIdArray,
+    ResourceIdBloomFilter,
+    ResourceIdSet,
+    SortableResourceId,
+)
+
+
+class SortableIdSet(ResourceIdSet):
+    item_type = SortableResourceId
+
+
+small_ids = st.lists(st.integers(min_value=0, max_value=300), max_size=60)
+
+
+def _ids(values: list[int]) -> set[ResourceId]:
+    return {ResourceId(value) for value in values}
+
+
+def test_init_sorts_and_dedupes():
+    ids = ResourceIdSet([3, "1", UUID(int=2), ResourceId(3), (1 << 127)])
+    assert [rid.value for rid in ids] == [1, 2, 3, 1 << 127]
+    assert len(ids) == 4
+    assert ids.nbytes == 64
+
+
+def test_init_from_array_and_set():
+    array = ResourceIdArray([5, 1, 5])
+    ids = ResourceIdSet(array)
+    assert [rid.value for rid in ids] == [1, 5]
+    assert ResourceIdSet(ids) == ids
+
+
+def test_init_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        ResourceIdSet(["oops!"])
+
+
+@given(small_ids, st.integers(min_value=0, max_value=300))
+def test_contains(values: list[int], probe: int):
+    ids = ResourceIdSet(values)
+    assert (probe in ids) == (probe in values)
+    assert (ResourceId(probe) in ids) == (probe in values)
+
+
+def test_contains_across_blocks():
+    rng = random.Random(20)
+    values = [rng.getrandbits(128) for _ in range(1000)]
+    ids = ResourceIdSet(values[:500])
+    assert all(value in ids for value in values[:500])
+    assert not any(value in ids for value in values[500:])
+    assert 0 not in ids and (1 << 128) - 1 not in ids
+
+
+def test_contains_ignores_matches_across_records():
+    # The record of (5 << 64) | 7 occurs in the buffer, straddling the
+    # records of 5 and 7 << 64.
+    ids = ResourceIdSet([5, 7 << 64])
+    assert ((5 << 64) | 7).to_bytes(16, "big") in ids.to_bytes()
+    assert (5 << 64) | 7 not in ids
+
+
+def test_contains_rejects_non_ids():
+    ids = ResourceIdSet([1])
+    assert "oops!" not in ids
+    assert None not in ids
+
+
+@pytest.mark.parametrize(
+    "operation", ["__or__", "__and__", "__sub__", "__xor__", "__le__", "__ge__"]
+)
+@given(small_ids, small_ids)
+def test_operators_match_set(operation: str, a: list[int], b: list[int]):
+    result = getattr(ResourceIdSet(a), operation)(ResourceIdSet(b))
+    expected = getattr(_ids(a), operation)(_ids(b))
+    if isinstance(expected, bool):
+        assert result is expected
+    else:
+        assert isinstance(result, ResourceIdSet)
+        assert set(result) == expected
+        assert list(result) == sorted(expected)
+
+
+@pytest.mark.parametrize("operation", ["__and__", "__sub__"])
+def test_probing_a_much_larger_set(operation: str):
+    # A small set against a large one probes instead of merging.
+    rng = random.Random(20)
+    large_values = [rng.getrandbits(128) for _ in range(5000)]
+    small_values = large_values[:5] + [rng.getrandbits(128) for _ in range(5)]
+    small, large = ResourceIdSet(small_values), ResourceIdSet(large_values)
+    assert small._probe_is_cheaper(large)
+    expected = getattr(_ids(small_values), operation)(_ids(large_values))
+    assert set(getattr(small, operation)(large)) == expected
+    if operation == "__and__":
+        assert set(large & small) == expected
+
+
+def test_operators_with_other_sets():
+    ids = ResourceIdSet([1, 2, 3])
+    other = {ResourceId(2), ResourceId(4)}
+    assert ids & other == ResourceIdSet([2])
+    assert other & ids == ResourceIdSet([2])
+    assert ids | other == ResourceIdSet([1, 2, 3, 4])
+    assert ids - other == ResourceIdSet([1, 3])
+    assert ids == {ResourceId(1), ResourceId(2), ResourceId(3)}
+
+
+def test_methods_accept_iterables():
+    ids = ResourceIdSet([1, 2, 3])
+    assert ids.union([4], ["5"]) == ResourceIdSet([1, 2, 3, 4, 5])
+    assert ids.intersection([2, 3, 9], [3]) == ResourceIdSet([3])
+    assert ids.difference([1], [2]) == ResourceIdSet([3])
+    assert ids.symmetric_difference([3, 4]) == ResourceIdSet([1, 2, 4])
+    assert ids.issubset(range(10))
+    assert ids.issuperset([1, 3])
+    assert ids.isdisjoint([7, 8])
+
+
+def test_bytes_round_trip():
+    ids = ResourceIdSet([9, 1, 5])
+    data = ids.to_bytes()
+    assert len(data) == ids.nbytes
+    assert ResourceIdSet.frombuffer(data) == ids
+    assert ResourceIdSet.frombuffer(bytearray(data)) == ids
+
+
+@pytest.mark.parametrize("values", [[2, 1], [1, 1]])
+def test_frombuffer_requires_sorted_distinct_records(values: list[int]):
+    with pytest.raises(ValueError):
+        ResourceIdSet.frombuffer(ResourceIdArray(values).to_bytes())
+
+
+def test_frombuffer_checks_size():
+    with pytest.raises(ValueError):
+        ResourceIdSet.frombuffer(b"\x00" * 17)
+
+
+def test_pickle():
+    ids = ResourceIdSet([1, 2, 3])
+    assert pickle.loads(pickle.dumps(ids)) == ids
+
+
+def test_item_type():
+    ids = SortableIdSet([2, 1])
+    assert [type(rid) for rid in ids] == [SortableResourceId, SortableResourceId]
+    assert type(ids | ResourceIdSet([3])) is SortableIdSet
+    restored = pickle.loads(pickle.dumps(ids))
+    assert type(restored) is SortableIdSet
+    assert list(restored) == [SortableResourceId(1), SortableResourceId(2)]
+
+
+def test_unhashable():
+    with pytest.raises(TypeError):
+        hash(ResourceIdSet())
+
+
+def test_repr():
+    assert repr(ResourceIdSet([62, 1])) == "ResourceIdSet({1, 10})"
+
+
+def test_bloom_filter_has_no_false_negatives():
+    ids = ResourceId.generate_many(2000)
+    bloom = ResourceIdBloomFilter(2000, 0.01)
+    bloom.update(ids[:1000])
+    for rid in ids[1000:]:
+        bloom.add(rid)
+    assert all(rid in bloom for rid in ids)
+    assert bloom.count == 2000
+
+
+def test_bloom_filter_false_positive_rate():
+    # Sequential ids must spread as well as random ones.
+    bloom = ResourceIdSet(range(10_000)).bloom_filter(0.01)
+    false_positives = sum(value in bloom for value in range(10_000, 30_000))
+    assert false_positives / 20_000 < 0.02
+
+
+def test_bloom_filter_size():
+    bloom = ResourceIdBloomFilter(1_000_000, 0.01)
+    assert bloom.num_bits == 9_585_059
+    assert bloom.num_hashes == 7
+    assert bloom.nbytes == 1_198_133
+    assert "oops!" not in bloom
+
+
+@pytest.mark.parametrize(
+    "capacity, error_rate", [(0, 0.01), (10, 0.0), (10, 1.0), (10, -1.0)]
+)
+def test_bloom_filter_rejects_bad_parameters(capacity: int, error_rate: float):
+    with pytest.raises(ValueError):
+        ResourceIdBloomFilter(capacity, error_rate)
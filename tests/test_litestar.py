@@ -1,15 +1,23 @@
-from typing import Any
+from typing import Annotated, Any
 
 import pytest
 
 pytest.importorskip("litestar")
 
-from litestar import Litestar, get  # noqa: E402
+import msgspec  # noqa: E402
+from litestar import Litestar, get, post  # noqa: E402
+from litestar.params import QueryParameter  # noqa: E402
 from litestar.testing import TestClient  # noqa: E402
 from pydantic import BaseModel  # noqa: E402
 
-from resource_id import ResourceId  # noqa: E402
-from resource_id.litestar import ResourceIdPathParameter, ResourceIdSchemaPlugin  # noqa: E402
+from resource_id import ResourceId, ResourceIdList  # noqa: E402
+from resource_id.litestar import (  # noqa: E402
+    ResourceIdListPathParameter,
+    ResourceIdListQueryParameter,
+    ResourceIdMsgspecPlugin,
+    ResourceIdPathParameter,
+    ResourceIdSchemaPlugin,
+)
 
 
 def test_path_param_routing():
@@ -81,3 +89,107 @@ def test_schema_plugin_supports_subclasses():
     assert ResourceIdSchemaPlugin.is_plugin_supported_type(Sub)
     assert not ResourceIdSchemaPlugin.is_plugin_supported_type(int)
     assert not ResourceIdSchemaPlugin.is_plugin_supported_type("not a type")
+
+
+class Widget(msgspec.Struct):
+    id: ResourceId
+    name: str
+
+
+def _msgspec_app(**kwargs: Any) -> Litestar:
+    @get("/ids")
+    async def list_ids() -> list[ResourceId]:
+        return [ResourceId(1), ResourceId(255)]
+
+    @post("/widgets")
+    async def create_widget(data: Widget) -> Widget:
+        assert isinstance(data.id, ResourceId)
+        return data
+
+    return Litestar([list_ids, create_widget], **kwargs)
+
+
+def test_msgspec_plugin_serializes_and_validates():
+    app = _msgspec_app(plugins=[ResourceIdMsgspecPlugin()])
+    with TestClient(app) as client:
+        assert client.get("/ids").json() == ["1", "47"]
+        response = client.post("/widgets", json={"id": "47", "name": "sprocket"})
+        assert response.status_code == 201
+        assert response.json() == {"id": "47", "name": "sprocket"}
+
+
+def test_msgspec_plugin_rejects_invalid_ids():
+    app = _msgspec_app(plugins=[ResourceIdMsgspecPlugin()])
+    with TestClient(app) as client:
+        response = client.post("/widgets", json={"id": "oops!", "name": ""})
+        assert response.status_code == 400
+        assert response.json()["extra"][0]["key"] == "id"
+
+
+def test_msgspec_without_plugin_fails():
+    # Documents why the plugin is needed.
+    app = _msgspec_app()
+    with TestClient(app) as client:
+        assert client.get("/ids").status_code == 500
+        response = client.post("/widgets", json={"id": "47", "name": ""})
+        assert response.status_code == 400
+
+
+def test_msgspec_plugin_keeps_app_encoders():
+    app = _msgspec_app(
+        plugins=[ResourceIdMsgspecPlugin()],
+        type_encoders={ResourceId: lambda rid: rid.uuid.hex},
+    )
+    with TestClient(app) as client:
+        assert client.get("/ids").json() == [f"{1:032x}", f"{255:032x}"]
+
+
+class BatchIds(ResourceIdList):
+    max_count = 3
+    dedupe = True
+
+
+def _id_list_app() -> Litestar:
+    @get("/all")
+    async def all_ids(ids: ResourceIdListQueryParameter) -> int:
+        return len(ids)
+
+    @get("/q")
+    async def by_query(ids: Annotated[BatchIds, QueryParameter()]) -> BatchIds:
+        assert type(ids) is BatchIds
+        return ids
+
+    @get("/p/{ids:resourceidlist}")
+    async def by_path(ids: ResourceIdListPathParameter) -> str:
+        assert type(ids) is ResourceIdList
+        return repr(ids)
+
+    return Litestar(
+        [all_ids, by_query, by_path],
+        plugins=[ResourceIdMsgspecPlugin(), ResourceIdSchemaPlugin()],
+    )
+
+
+def test_id_list_query_param():
+    with TestClient(_id_list_app()) as client:
+        assert client.get("/q?ids=47,1,47").json() == "47,1"
+        assert client.get("/all?ids=1,2,3,4,4").json() == 5
+        response = client.get("/q?ids=1,!,?")
+        assert response.status_code == 400
+        assert "positions 1, 2" in response.json()["extra"][0]["message"]
+        response = client.get("/q?ids=1,2,3,4")
+        assert response.status_code == 400
+        assert "at most 3 ids" in response.json()["extra"][0]["message"]
+
+
+def test_id_list_path_param():
+    with TestClient(_id_list_app()) as client:
+        assert client.get("/p/47,1,47").text == "ResourceIdList([47, 1, 47])"
+        assert client.get("/p/47,!").status_code >= 400
+
+
+def test_id_list_query_param_schema():
+    app = _id_list_app()
+    (param,) = app.openapi_schema.to_schema()["paths"]["/q"]["get"]["parameters"]
+    assert param["schema"]["type"] == "string"
+    assert param["schema"]["format"] == "resource-id-list"
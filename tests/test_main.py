@@ -0,0 +1,144 @@
+import subprocess
+import sys
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from resource_id import ResourceId, SortableResourceId
+from resource_id import __main__ as cli
+
+VALUES = [0, 1, 1000, 0xDEADBEEF, (1 << 128) - 1]
+
+
+def _write(path: Path, lines: list[str]) -> str:
+    path.write_text("".join(f"{line}\n" for line in lines))
+    return str(path)
+
+
+def _forms(value: int) -> dict[str, str]:
+    return {
+        "base62": str(ResourceId(value)),
+        "uuid": str(UUID(int=value)),
+        "hex": f"{value:032x}",
+        "int": str(value),
+        "sortable": str(SortableResourceId(value)),
+    }
+
+
+@pytest.mark.parametrize("source", ["base62", "uuid", "int", "sortable"])
+@pytest.mark.parametrize("target", ["base62", "uuid", "hex", "int", "sortable"])
+def test_convert(tmp_path, capsysbinary, source: str, target: str):
+    path = _write(tmp_path / "ids.txt", [_forms(v)[source] for v in VALUES])
+    assert cli.main(["--from", source, "--to", target, "-j", "1", path]) == 0
+    out, err = capsysbinary.readouterr()
+    assert out.decode().splitlines() == [_forms(v)[target] for v in VALUES]
+    assert err == b""
+
+
+def test_auto_accepts_base62_and_uuid_forms(tmp_path, capsys):
+    value = UUID(int=0xDEADBEEF)
+    lines = [str(ResourceId(value)), str(value), value.hex, str(value).upper()]
+    path = _write(tmp_path / "ids.txt", lines)
+    assert cli.main(["--to", "uuid", "-j", "1", path]) == 0
+    assert capsys.readouterr().out.splitlines() == [str(value)] * 4
+
+
+def test_invalid_lines_are_reported(tmp_path, capsysbinary):
+    lines = ["47", "oops!", "", "  deadbeef  ", "1" + "0" * 22, "xé"]
+    path = _write(tmp_path / "ids.txt", lines)
+    assert cli.main(["--to", "int", "-j", "1", path]) == 1
+    out, err = capsysbinary.readouterr()
+    assert out.decode().splitlines() == [
+        str(ResourceId("47").value),
+        str(ResourceId("deadbeef").value),
+    ]
+    assert err.decode().splitlines() == [
+        f"{path}:2: invalid id 'oops!'",
+        f"{path}:5: invalid id '{'1' + '0' * 22}'",
+        f"{path}:6: invalid id 'xé'",
+    ]
+
+
+def test_uuid_rejects_int_syntax(tmp_path, capsys):
+    # uuid.UUID() parses hex with int(), which tolerates a sign and
+    # underscores; the fast path for the common forms does not.
+    lines = ["+" + "f" * 31, "f" * 16 + "_" + "f" * 15, "f" * 32]
+    path = _write(tmp_path / "ids.txt", lines)
+    assert cli.main(["--from", "uuid", "--to", "int", "-j", "1", path]) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [str((1 << 128) - 1)]
+    assert len(err.splitlines()) == 2
+
+
+def test_int_is_read_only_with_from_int(tmp_path, capsys):
+    path = _write(tmp_path / "ids.txt", ["10", "abc"])
+    assert cli.main(["--from", "int", "--to", "hex", "-j", "1", path]) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [f"{10:032x}"]
+    assert ":2: invalid id 'abc'" in err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_chunks_keep_order_and_line_numbers(tmp_path, capsys, monkeypatch, jobs):
+    # Small chunks make every few lines a separate task; in a pool, tasks
+    # finish out of order but must be written in order.
+    monkeypatch.setattr(cli, "_CHUNK_BYTES", 64)
+    values = list(range(0, 1 << 20, 997))
+    lines = [str(ResourceId(v)) for v in values]
+    lines[500] = "bad-id"
+    path = _write(tmp_path / "ids.txt", lines)
+    assert cli.main(["--to", "int", "-j", jobs, path]) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [str(v) for i, v in enumerate(values) if i != 500]
+    assert err.splitlines() == [f"{path}:501: invalid id 'bad-id'"]
+
+
+def test_multiple_files_and_output_file(tmp_path, capsys):
+    first = _write(tmp_path / "a.txt", ["1", "2"])
+    second = _write(tmp_path / "b.txt", ["3"])
+    output = tmp_path / "out.txt"
+    assert cli.main(["--to", "int", "-j", "1", "-o", str(output), first, second]) == 0
+    assert output.read_text().splitlines() == ["1", "2", "3"]
+    assert capsys.readouterr().out == ""
+
+
+def test_unreadable_files_are_reported(tmp_path, capsys):
+    missing = str(tmp_path / "missing.txt")
+    good = _write(tmp_path / "ids.txt", ["1", "2"])
+    args = ["--to", "int", "-j", "1", missing, str(tmp_path), good]
+    assert cli.main(args) == 1
+    out, err = capsys.readouterr()
+    assert out.splitlines() == ["1", "2"]
+    missing_error, directory_error = err.splitlines()
+    assert missing_error == f"{missing}: No such file or directory"
+    # The reason for a directory differs between platforms.
+    assert directory_error.startswith(f"{tmp_path}: ")
+
+
+def test_empty_file_and_missing_final_newline(tmp_path, capsys):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    unterminated = tmp_path / "ids.txt"
+    unterminated.write_bytes(b"1\r\n2")
+    assert cli.main(["--to", "int", "-j", "1", str(empty), str(unterminated)]) == 0
+    assert capsys.readouterr().out.splitlines() == ["1", "2"]
+
+
+def test_jobs_must_be_positive(capsys):
+    with pytest.raises(SystemExit):
+        cli.main(["-j", "0"])
+    assert "--jobs must be at least 1" in capsys.readouterr().err
+
+
+def test_stdin():
+    value = UUID(int=0xDEADBEEF)
+    result = subprocess.run(
+        [sys.executable, "-m", "resource_id", "--from", "uuid", "-j", "1"],
+        input=f"{value}\nnope\n".encode(),
+        capture_output=True,
+        check=False,
+    )
+    assert result.returncode == 1
+    assert result.stdout.decode().splitlines() == [str(ResourceId(value))]
+    assert result.stderr.decode().splitlines() == ["<stdin>:2: invalid id 'nope'"]
@@ -0,0 +1,161 @@
+from collections import Counter
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from resource_id import ResourceId, SortableResourceId, metrics
+
+
+@pytest.fixture
+def counts():
+    counts = metrics.Counters()
+    metrics.enable(counts)
+    yield counts
+    metrics.disable()
+
+
+class Model(BaseModel):
+    id: ResourceId
+
+
+VALUE = 0xDEADBEEF
+BASE62 = str(ResourceId(VALUE))
+
+
+@pytest.mark.parametrize(
+    "value, kind",
+    [
+        (BASE62, "base62"),
+        (str(UUID(int=VALUE)), "uuid_str"),
+        (UUID(int=VALUE).hex, "uuid_str"),
+        (VALUE, "int"),
+        (UUID(int=VALUE), "uuid"),
+        (VALUE.to_bytes(16, "big"), "bytes"),
+        (ResourceId(VALUE), "resource_id"),
+    ],
+)
+def test_parsed_kinds(counts, value, kind: str):
+    ResourceId(value)
+    assert counts.parsed_counts == Counter({kind: 1})
+    assert counts.invalid_counts == Counter()
+
+
+@pytest.mark.parametrize(
+    "value, reason",
+    [
+        (1.5, "type"),
+        ("", "empty"),
+        ("oops!", "charset"),
+        ("1" + "0" * 22, "range"),
+        (-1, "range"),
+        (1 << 128, "range"),
+        (b"\x00" * 15, "length"),
+    ],
+)
+def test_invalid_reasons(counts, value, reason: str):
+    with pytest.raises((TypeError, ValueError)):
+        ResourceId(value)
+    assert counts.invalid_counts == Counter({reason: 1})
+    assert counts.parsed_counts == Counter()
+
+
+@pytest.mark.parametrize(
+    "value, reason",
+    [
+        ("deadbeef", "length"),
+        ("0" * 23, "length"),
+        ("z" * 22, "range"),
+        ("oops!", "charset"),
+    ],
+)
+def test_invalid_sortable_reasons(counts, value: str, reason: str):
+    with pytest.raises(ValueError):
+        SortableResourceId(value)
+    with pytest.raises(ValueError):
+        SortableResourceId.from_base62(value)
+    assert counts.invalid_counts == Counter({reason: 2})
+
+
+def test_specialized_constructors(counts):
+    ResourceId.from_str(BASE62)
+    ResourceId.from_base62(BASE62)
+    ResourceId.from_int(VALUE)
+    ResourceId.from_uuid(UUID(int=VALUE))
+    ResourceId.from_trusted_int(VALUE)
+    for constructor, value in [
+        (ResourceId.from_base62, str(UUID(int=VALUE))),
+        (ResourceId.from_int, -1),
+        (ResourceId.from_uuid, VALUE),
+    ]:
+        with pytest.raises((TypeError, ValueError)):
+            constructor(value)
+    assert counts.parsed_counts == Counter({"base62": 2, "int": 1, "uuid": 1})
+    assert counts.invalid_counts == Counter({"charset": 1, "range": 1, "type": 1})
+
+
+def test_generation_is_not_reported(counts):
+    ResourceId()
+    SortableResourceId()
+    assert counts.parsed_counts == Counter()
+
+
+def test_encode_is_reported_once(counts):
+    rid = ResourceId.from_trusted_int(VALUE)
+    assert str(rid) == str(rid) == ResourceId(VALUE).__str__()
+    assert counts.encoded_count == 2
+    # An id parsed from its string form keeps it, so is never encoded.
+    str(ResourceId(str(rid)))
+    assert counts.encoded_count == 2
+
+
+def test_pydantic_inputs(counts):
+    Model(id=BASE62)
+    Model.model_validate_json(f'{{"id": "{UUID(int=VALUE)}"}}')
+    Model(id=VALUE)
+    Model(id=UUID(int=VALUE))
+    with pytest.raises(ValidationError):
+        Model(id="oops!")
+    assert counts.parsed_counts == Counter(
+        {"base62": 1, "uuid_str": 1, "int": 1, "uuid": 1}
+    )
+    assert counts.invalid_counts == Counter({"charset": 1})
+
+
+def test_sampled_timing():
+    counts = metrics.Counters()
+    metrics.enable(counts, sample_every=4)
+    try:
+        for value in range(8):
+            ResourceId(value)
+        rids = [ResourceId.from_trusted_int(value) for value in range(4)]
+        for rid in rids:
+            str(rid)
+    finally:
+        metrics.disable()
+    assert counts.timed_counts == Counter({"parse": 2, "encode": 1})
+    assert counts.timed_seconds["parse"] > 0
+    assert counts.encoded_count == 4
+
+
+def test_disable_stops_reporting():
+    counts = metrics.Counters()
+    metrics.enable(counts)
+    metrics.disable()
+    ResourceId(VALUE)
+    str(ResourceId.from_trusted_int(VALUE))
+    assert counts.parsed_counts == Counter()
+    assert counts.encoded_count == 0
+
+
+def test_enable_replaces_sink(counts):
+    other = metrics.Counters()
+    metrics.enable(other)
+    ResourceId(VALUE)
+    assert counts.parsed_counts == Counter()
+    assert other.parsed_counts == Counter({"int": 1})
+
+
+def test_sample_every_must_be_non_negative():
+    with pytest.raises(ValueError):
+        metrics.enable(metrics.Counters(), sample_every=-1)
@@ -0,0 +1,112 @@
+from uuid import uuid4
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from resource_id import ResourceId, ResourceIdList  # noqa: E402
+from resource_id.msgspec import (  # noqa: E402
+    dec_hook,
+    enc_hook,
+    is_resource_id_list_type,
+    is_resource_id_type,
+)
+
+
+class Widget(msgspec.Struct):
+    id: ResourceId
+    name: str
+
+
+class SubId(ResourceId): ...
+
+
+ENCODER = msgspec.json.Encoder(enc_hook=enc_hook)
+DECODER = msgspec.json.Decoder(Widget, dec_hook=dec_hook)
+
+
+def test_struct_round_trip():
+    widget = Widget(ResourceId(255), "sprocket")
+    encoded = ENCODER.encode(widget)
+    assert encoded == b'{"id":"47","name":"sprocket"}'
+    assert DECODER.decode(encoded) == widget
+
+
+def test_decode_accepts_uuid_str_and_int():
+    value = uuid4()
+    widget = DECODER.decode(f'{{"id": "{value}", "name": ""}}'.encode())
+    assert widget.id == ResourceId(value)
+    widget = DECODER.decode(f'{{"id": {value.int}, "name": ""}}'.encode())
+    assert widget.id == ResourceId(value)
+
+
+def test_decode_msgpack_bytes():
+    rid = ResourceId(uuid4())
+    packed = msgspec.msgpack.encode({"id": rid.to_bytes(), "name": ""})
+    widget = msgspec.msgpack.decode(packed, type=Widget, dec_hook=dec_hook)
+    assert widget.id == rid
+
+
+def test_decode_subclass():
+    decoded = msgspec.json.decode(b'["47"]', type=list[SubId], dec_hook=dec_hook)
+    assert decoded == [SubId(255)]
+    assert type(decoded[0]) is SubId
+
+
+@pytest.mark.parametrize(
+    "value", ['"oops!"', '""', "-1", str(1 << 128), "1.5", "true", "null", "[]"]
+)
+def test_decode_invalid_is_a_validation_error(value: str):
+    with pytest.raises(msgspec.ValidationError, match=r"\$\.id"):
+        DECODER.decode(f'{{"id": {value}, "name": ""}}'.encode())
+
+
+def test_encode_list():
+    ids = [ResourceId(n) for n in range(3)]
+    assert ENCODER.encode(ids) == b'["0","1","2"]'
+
+
+def test_unsupported_types_are_passed_on():
+    with pytest.raises(NotImplementedError):
+        enc_hook(object())
+    with pytest.raises(NotImplementedError):
+        dec_hook(int, "1")
+
+
+def test_is_resource_id_type():
+    assert is_resource_id_type(ResourceId)
+    assert is_resource_id_type(SubId)
+    assert not is_resource_id_type(str)
+    assert not is_resource_id_type(list[ResourceId])
+
+
+class BatchIds(ResourceIdList):
+    max_count = 3
+    dedupe = True
+
+
+class Batch(msgspec.Struct):
+    ids: BatchIds
+
+
+def test_id_list_round_trip():
+    decoder = msgspec.json.Decoder(Batch, dec_hook=dec_hook)
+    batch = decoder.decode(b'{"ids": "47,1,47"}')
+    assert batch.ids == BatchIds([255, 1])
+    assert type(batch.ids) is BatchIds
+    assert ENCODER.encode(batch) == b'{"ids":"47,1"}'
+    assert decoder.decode(b'{"ids": ["47", 1]}') == batch
+
+
+@pytest.mark.parametrize("value", ['"1,!"', '"1,2,3,4"', "42"])
+def test_id_list_invalid_is_a_validation_error(value: str):
+    decoder = msgspec.json.Decoder(Batch, dec_hook=dec_hook)
+    with pytest.raises(msgspec.ValidationError, match=r"\$\.ids"):
+        decoder.decode(f'{{"ids": {value}}}'.encode())
+
+
+def test_is_resource_id_list_type():
+    assert is_resource_id_list_type(ResourceIdList)
+    assert is_resource_id_list_type(BatchIds)
+    assert not is_resource_id_list_type(ResourceId)
+    assert not is_resource_id_list_type(list)
@@ -1,20 +1,66 @@
+import copy
+import itertools
+import pickle
+import random
+import subprocess
+import sys
 from decimal import Decimal
 from fractions import Fraction
-from typing import Any, Union
+from typing import Any, Iterator, Union
 from uuid import UUID
 
 import jsonschema
 import pydantic
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from resource_id.resource_id import (
+    ALPHABET,
+    ResourceId,
+    b62decode,
+    b62encode,
+    jump_hash,
+)
+
 
-from resource_id.resource_id import ResourceId, b62decode, b62encode
+def _b62encode_digitwise(value: int) -> str:
+    # Reference implementation: one digit per iteration.
+    digits = ""
+    while value:
+        value, digit = divmod(value, 62)
+        digits = ALPHABET[digit] + digits
+    return digits or "0"
 
 
-@pytest.mark.parametrize("src, expected", [(1, "1"), (62, "10")])
+@pytest.mark.parametrize(
+    "src, expected",
+    [
+        (0, "0"),
+        (1, "1"),
+        (61, "Z"),
+        (62, "10"),
+        (62**10 - 1, "Z" * 10),
+        (62**10, "1" + "0" * 10),
+        (62**20, "1" + "0" * 20),
+        ((1 << 128) - 1, "7N42dgm5tFLK9N8MT7fHC7"),
+    ],
+)
 def test_b62encode(src: int, expected: str):
     assert b62encode(src) == expected
 
 
+@given(st.integers(min_value=0, max_value=(1 << 128) - 1))
+def test_b62encode_matches_digitwise(value: int):
+    assert b62encode(value) == _b62encode_digitwise(value)
+
+
+@given(st.integers(min_value=1 << 128, max_value=1 << 512))
+def test_b62encode_beyond_uuid_range(value: int):
+    # Values wider than a UUID take the general multi-limb path.
+    assert b62encode(value) == _b62encode_digitwise(value)
+
+
 def test_b62encode_fail():
     with pytest.raises(ValueError):
         b62encode(-1)
@@ -25,7 +71,7 @@ def test_b62decode(src: str, expected: int):
     assert b62decode(src) == expected
 
 
-@pytest.mark.parametrize("src", ["*", "", "-1"])
+@pytest.mark.parametrize("src", ["*", "", "-1", "a b", "\u00e9", "\u0661", "\uff11"])
 def test_b62decode_fail(src: str):
     with pytest.raises(ValueError):
         b62decode(src)
@@ -41,6 +87,27 @@ def test_init_default():
     assert rid.value >= 0
 
 
+@pytest.mark.parametrize("count", [0, 1, 5000])
+def test_generate_many(count: int):
+    ids = ResourceId.generate_many(count)
+    assert len(ids) == len(set(ids)) == count
+    assert all(type(rid) is ResourceId for rid in ids)
+    assert {rid.uuid.version for rid in ids} <= {4}
+    assert {rid.uuid.variant for rid in ids} <= {"specified in RFC 4122"}
+
+
+def test_iter_generate():
+    assert len(list(ResourceId.iter_generate(5000))) == 5000
+    ids = list(itertools.islice(ResourceId.iter_generate(), 10_000))
+    assert len(set(ids)) == 10_000
+    assert {rid.uuid.version for rid in ids} == {4}
+
+
+def test_generate_rejects_negative_count():
+    with pytest.raises(ValueError):
+        ResourceId.generate_many(-1)
+
+
 def test_init_from_resource_id():
     rid = ResourceId("test")
     assert ResourceId(rid) == rid
@@ -74,6 +141,54 @@ def test_init_rejects_truncating_types(bad: Any):
         ResourceId(bad)
 
 
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_init_from_bytes(wrap: Any):
+    value = UUID(int=1728)
+    assert ResourceId(wrap(value.bytes)).value == 1728
+
+
+@pytest.mark.parametrize("data", [b"", bytes(15), bytes(17)])
+def test_init_rejects_wrong_length_bytes(data: bytes):
+    with pytest.raises(ValueError):
+        ResourceId(data)
+
+
+def test_to_bytes():
+    value = UUID(int=(1 << 128) - 2)
+    assert ResourceId(value).to_bytes() == value.bytes
+
+
+def test_from_bytes():
+    data = UUID(int=1728).bytes
+    assert ResourceId.from_bytes(data) == ResourceId(1728)
+    with pytest.raises(ValueError):
+        ResourceId.from_bytes(data[1:])
+
+
+def test_pickle_round_trip():
+    rid = ResourceId((1 << 128) - 1)
+    assert pickle.loads(pickle.dumps(rid)) == rid
+
+
+def test_pickle_is_compact():
+    ids = [ResourceId((1 << 127) + n) for n in range(100)]
+    # The class and reconstructor are memoized; each id then costs little
+    # more than its 17-byte int, against ~48 bytes for the default slot state.
+    assert len(pickle.dumps(ids)) < 28 * len(ids)
+
+
+def test_pickle_subclass():
+    rid = _PickledSub(5)
+    assert type(pickle.loads(pickle.dumps(rid))) is _PickledSub
+
+
+def test_copy_returns_self():
+    rid = ResourceId(5)
+    assert copy.copy(rid) is rid
+    assert copy.deepcopy(rid) is rid
+    assert copy.deepcopy([rid])[0] is rid
+
+
 def test_uuid():
     value = UUID(int=123)
     assert ResourceId(value).uuid == value
@@ -91,12 +206,85 @@ def test_uuid_hex_str(value: UUID):
     assert ResourceId(value.hex).uuid == value
 
 
+@given(st.uuids())
+def test_uuid_str_forms(value: UUID):
+    for text in (str(value), value.hex, str(value).upper(), f"{{{value}}}"):
+        assert ResourceId(text).uuid == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "+" + "f" * 31,
+        "f" * 16 + "_" + "f" * 15,
+        " " + "f" * 31,
+        f"urn:uuid:{UUID(int=666)}",
+    ],
+)
+def test_uuid_str_accepts_what_uuid_accepts(value: str):
+    assert ResourceId.is_valid(value)
+    assert ResourceId(value).value == UUID(value).int
+
+
 def test_long_base62_str_with_leading_zeros():
     # A string longer than a UUID's hex form is not a valid UUID, so it falls
     # back to base62 decoding; leading zeros are insignificant.
     assert ResourceId("0" * 33 + "1").value == 1
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0",
+        "test",
+        "7N42dgm5tFLK9N8MT7fHC7",
+        "0" * 33 + "1",
+        str(UUID(int=666)),
+        UUID(int=(1 << 128) - 1).hex,
+    ],
+)
+def test_is_valid(value: str):
+    assert ResourceId.is_valid(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "oops!",
+        "\u0661",
+        "7N42dgm5tFLK9N8MT7fHC8",
+        "ZZZZZZZZZZZZZZZZZZZZZZ",
+        "1" + "0" * 22,
+        "../../etc/passwd",
+        1,
+        None,
+    ],
+)
+def test_is_valid_rejects(value: Any):
+    assert not ResourceId.is_valid(value)
+
+
+def _accepts(value: str) -> bool:
+    try:
+        ResourceId(value)
+    except ValueError:
+        return False
+    return True
+
+
+@given(st.text(alphabet="".join(ALPHABET) + "-!\u00e9", min_size=0, max_size=24))
+def test_is_valid_agrees_with_constructor(value: str):
+    assert ResourceId.is_valid(value) == _accepts(value)
+
+
+@given(st.integers(min_value=0, max_value=(1 << 129)))
+def test_is_valid_agrees_with_constructor_near_range(value: int):
+    # Encodings of values around 2**128 exercise the range comparison.
+    encoded = b62encode(value)
+    assert ResourceId.is_valid(encoded) == _accepts(encoded)
+
+
 def test_bad_str():
     with pytest.raises(ValueError):
         ResourceId("oops!")
@@ -112,6 +300,172 @@ def test_str():
     assert str(ResourceId(arg)) == "1"
 
 
+def test_str_is_memoized():
+    rid = ResourceId(12345)
+    assert str(rid) is str(rid)
+
+
+def test_str_reuses_canonical_input():
+    value = "deadbeef"
+    assert str(ResourceId(value)) is value
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("007", "7"), ("0", "0"), (str(UUID(int=62)), "10")]
+)
+def test_str_of_non_canonical_input(value: str, expected: str):
+    assert str(ResourceId(value)) == expected
+
+
+def test_str_shared_by_copy():
+    rid = ResourceId(12345)
+    encoded = str(rid)
+    assert str(ResourceId(rid)) is encoded
+
+
+@pytest.fixture
+def parse_cache() -> Iterator[None]:
+    ResourceId.set_parse_cache_size(2)
+    yield
+    ResourceId.set_parse_cache_size(4096)
+
+
+def test_from_str_cached_shares_instances(parse_cache: None):
+    rid = ResourceId.from_str_cached("deadbeef")
+    assert rid == ResourceId("deadbeef")
+    assert ResourceId.from_str_cached("deadbeef") is rid
+    info = ResourceId.parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_from_str_cached_evicts_least_recently_used(parse_cache: None):
+    first = ResourceId.from_str_cached("a")
+    ResourceId.from_str_cached("b")
+    ResourceId.from_str_cached("c")
+    assert ResourceId.from_str_cached("a") is not first
+    assert ResourceId.parse_cache_info().currsize == 2
+
+
+def test_from_str_cached_disabled(parse_cache: None):
+    ResourceId.set_parse_cache_size(0)
+    assert ResourceId.from_str_cached("a") is not ResourceId.from_str_cached("a")
+    assert ResourceId.parse_cache_info().misses == 2
+
+
+def test_from_str_cached_keys_on_class(parse_cache: None):
+    class Sub(ResourceId): ...
+
+    assert type(ResourceId.from_str_cached("a")) is ResourceId
+    assert type(Sub.from_str_cached("a")) is Sub
+
+
+def test_from_str_cached_rejects_invalid(parse_cache: None):
+    with pytest.raises(ValueError):
+        ResourceId.from_str_cached("oops!")
+    assert ResourceId.parse_cache_info().currsize == 0
+
+
+def test_from_str_cached_requires_str():
+    with pytest.raises(TypeError):
+        ResourceId.from_str_cached(1)  # type: ignore
+
+
+def test_set_parse_cache_size_rejects_negative():
+    with pytest.raises(ValueError):
+        ResourceId.set_parse_cache_size(-1)
+
+
+@given(st.integers(min_value=0, max_value=(1 << 128) - 1))
+def test_specialized_constructors_match_constructor(value: int):
+    rid = ResourceId(value)
+    uuid = UUID(int=value)
+    assert ResourceId.from_int(value) == rid
+    assert ResourceId.from_trusted_int(value) == rid
+    assert ResourceId.from_uuid(uuid) == rid
+    assert ResourceId.from_str(str(rid)) == rid
+    assert ResourceId.from_str(str(uuid)) == rid
+    assert ResourceId.from_str(uuid.hex) == rid
+    assert ResourceId.from_base62(str(rid)) == rid
+
+
+def test_constructors_use_overridden_from_trusted_int():
+    class TaggedId(ResourceId):
+        built: list[int] = []
+
+        @classmethod
+        def from_trusted_int(cls, value: int) -> "TaggedId":
+            cls.built.append(value)
+            return super().from_trusted_int(value)
+
+    TaggedId.from_int(1)
+    TaggedId.from_uuid(UUID(int=2))
+    TaggedId.from_bytes((3).to_bytes(16, "big"))
+    TaggedId.from_str(str(ResourceId(4)))
+    assert TaggedId.built == [1, 2, 3, 4]
+
+
+def test_from_str_reuses_canonical_input():
+    value = str(ResourceId(1 << 100))
+    assert str(ResourceId.from_str(value)) is value
+    assert str(ResourceId.from_base62(value)) is value
+
+
+@pytest.mark.parametrize("value", [-1, 1 << 128])
+def test_from_int_rejects_out_of_range(value: int):
+    with pytest.raises(ValueError):
+        ResourceId.from_int(value)
+
+
+@pytest.mark.parametrize("value", ["1", 1.5, -1.0, True, None])
+def test_from_int_rejects_non_ints(value: Any):
+    with pytest.raises(TypeError):
+        ResourceId.from_int(value)
+
+
+def test_from_int_rejects_numpy_ints():
+    np = pytest.importorskip("numpy")
+    for value in (np.int64(5), np.uint64(5)):
+        with pytest.raises(TypeError):
+            ResourceId.from_int(value)
+
+
+def test_from_int_stores_int_subclasses_as_int():
+    class Number(int): ...
+
+    rid = ResourceId.from_int(Number(5))
+    assert type(rid.value) is int
+    assert rid.to_bytes() == (5).to_bytes(16, "big")
+
+
+@pytest.mark.parametrize("value", [str(UUID(int=1)), 1, None])
+def test_from_uuid_rejects_non_uuids(value: Any):
+    with pytest.raises(TypeError):
+        ResourceId.from_uuid(value)
+
+
+@pytest.mark.parametrize("value", ["", "oops!", "1" + "0" * 22, "xé"])
+def test_from_str_rejects(value: str):
+    with pytest.raises(ValueError):
+        ResourceId.from_str(value)
+    with pytest.raises(ValueError):
+        ResourceId.from_base62(value)
+
+
+@pytest.mark.parametrize("value", [1, b"1", None])
+def test_from_str_requires_str(value: Any):
+    with pytest.raises(TypeError):
+        ResourceId.from_str(value)
+    with pytest.raises(TypeError):
+        ResourceId.from_base62(value)
+
+
+def test_from_base62_rejects_uuid_strings():
+    uuid = UUID(int=1 << 100)
+    for value in (str(uuid), uuid.hex):
+        with pytest.raises(ValueError):
+            ResourceId.from_base62(value)
+
+
 def test_eq():
     assert ResourceId(1) == ResourceId(1)
 
@@ -165,6 +519,58 @@ def test_validate():
     assert t.validate_json('"test"') == ResourceId("test")
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("test", ResourceId("test")),
+        (str(UUID(int=666)), ResourceId(666)),
+        (63, ResourceId(63)),
+        ((1 << 128) - 1, ResourceId((1 << 128) - 1)),
+        (UUID(int=1728), ResourceId(1728)),
+        (UUID(int=1728).bytes, ResourceId(1728)),
+    ],
+)
+def test_validate_python(value: Any, expected: ResourceId):
+    assert pydantic.TypeAdapter(ResourceId).validate_python(value) == expected
+
+
+def test_validate_python_passes_instances_through():
+    rid = ResourceId(5)
+    assert pydantic.TypeAdapter(ResourceId).validate_python(rid) is rid
+
+
+@pytest.mark.parametrize(
+    "data, expected", [('"test"', ResourceId("test")), ("63", ResourceId(63))]
+)
+def test_validate_json_str_or_int(data: str, expected: ResourceId):
+    assert pydantic.TypeAdapter(ResourceId).validate_json(data) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["oops!", -1, 1 << 128, 3.0, True, None, b"short", {}]
+)
+def test_validate_rejects(value: Any):
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        pydantic.TypeAdapter(ResourceId).validate_python(value)
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "resource_id"
+    assert error["msg"] == "Input should be a valid ResourceId"
+
+
+def test_validate_json_rejects_float():
+    with pytest.raises(pydantic.ValidationError):
+        pydantic.TypeAdapter(ResourceId).validate_json("3.5")
+
+
+def test_serialization_python_mode():
+    assert pydantic.TypeAdapter(ResourceId).dump_python(ResourceId(62)) == "10"
+
+
+def test_serialization_list():
+    V = pydantic.TypeAdapter(list[ResourceId])
+    assert V.dump_json(V.validate_python(["a", 62])) == b'["a","10"]'
+
+
 def test_serialization():
     V = pydantic.TypeAdapter(ResourceId)
     id = ResourceId("test")
@@ -181,3 +587,94 @@ def test_model_json_schema():
 
 def test_json_schema():
     assert jsonschema.validate("test", ResourceId._json_schema()) is None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.parametrize(
+    "key, n, expected",
+    # Published test vectors for jump consistent hash.
+    [
+        (1, 1, 0),
+        (42, 57, 43),
+        (0xDEAD10CC, 1, 0),
+        (0xDEAD10CC, 666, 361),
+        (256, 1024, 520),
+    ],
+)
+def test_jump_hash(key: int, n: int, expected: int):
+    assert jump_hash(key, n) == expected
+
+
+def test_shard_key_folds_halves():
+    value = 0xDEAD10CC << 64 | 0xDEAD10CC ^ 42
+    assert ResourceId(value).shard(57) == jump_hash(42, 57)
+
+
+@given(st.integers(min_value=0, max_value=(1 << 128) - 1), st.integers(1, 5000))
+def test_shard_in_range(value: int, n: int):
+    assert 0 <= ResourceId(value).shard(n) < n
+
+
+# Fixed ids keep the statistical tests below deterministic.
+_rng = random.Random(19)
+SHARD_IDS = [ResourceId(_rng.getrandbits(128)) for _ in range(20000)]
+
+
+def test_shard_growth_moves_only_to_new_shard():
+    ids = SHARD_IDS
+    for n in (1, 10, 100):
+        before = ResourceId.shard_many(ids, n)
+        after = ResourceId.shard_many(ids, n + 1)
+        moved = [new for old, new in zip(before, after) if old != new]
+        assert set(moved) <= {n}
+        assert len(moved) == pytest.approx(len(ids) / (n + 1), rel=0.2)
+
+
+def test_shards_are_balanced():
+    counts = [0] * 8
+    for shard in ResourceId.shard_many(SHARD_IDS, 8):
+        counts[shard] += 1
+    assert min(counts) > 2000 and max(counts) < 3000
+
+
+def test_shard_many_accepts_any_resource_id_value():
+    values = [ResourceId(5), 5, "5", UUID(int=5), (5).to_bytes(16, "big")]
+    assert ResourceId.shard_many(values, 1000) == [ResourceId(5).shard(1000)] * 5
+
+
+@pytest.mark.parametrize(
+    "n, error",
+    [(0, ValueError), (1 << 31, ValueError), (2.0, TypeError), (True, TypeError)],
+)
+def test_shard_rejects_bad_n(n: Any, error: type[Exception]):
+    with pytest.raises(error):
+        ResourceId(1).shard(n)
+    with pytest.raises(error):
+        ResourceId.shard_many([1], n)
+
+
+# Run with pydantic made unimportable: None in sys.modules makes import raise.
+_WITHOUT_PYDANTIC = """
+import sys
+sys.modules["pydantic"] = sys.modules["pydantic_core"] = None
+import resource_id
+import resource_id.__main__, resource_id.msgspec, resource_id.sortable
+from resource_id import ResourceId, ResourceIdList, SortableResourceId
+assert ResourceId(ResourceId("deadbeef").uuid) == ResourceId("deadbeef")
+assert str(ResourceIdList.parse("1,2")) == "1,2"
+assert SortableResourceId(1000).value == 1000
+"""
+
+
+def test_import_without_pydantic():
+    subprocess.run([sys.executable, "-c", _WITHOUT_PYDANTIC], check=True)
+
+
+def test_import_does_not_import_pydantic():
+    code = "import sys, resource_id; print(sorted(m for m in sys.modules if 'pydantic' in m))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+class _PickledSub(ResourceId): ...
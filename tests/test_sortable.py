@@ -0,0 +1,161 @@
+import pickle
+from uuid import UUID
+
+import pydantic
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from resource_id import ResourceId, SortableResourceId
+from resource_id.resource_id import (
+    ORDERED_ALPHABET,
+    b62decode_ordered,
+    b62encode_ordered,
+)
+
+MAX_ID = (1 << 128) - 1
+ids = st.integers(min_value=0, max_value=MAX_ID)
+
+
+@given(ids)
+def test_round_trip(value: int):
+    encoded = b62encode_ordered(value)
+    assert len(encoded) == 22
+    assert b62decode_ordered(encoded) == value
+    rid = SortableResourceId(value)
+    assert str(rid) == encoded
+    assert SortableResourceId(encoded) == rid
+    assert SortableResourceId(str(rid.uuid)) == rid
+    assert SortableResourceId(rid.uuid.hex) == rid
+
+
+@given(ids, ids)
+def test_string_order_is_numeric_order(a: int, b: int):
+    assert (b62encode_ordered(a) < b62encode_ordered(b)) == (a < b)
+    assert (b62encode_ordered(a).encode() < b62encode_ordered(b).encode()) == (a < b)
+
+
+@given(st.lists(ids, max_size=50))
+def test_sorted_strings_match_sorted_ids(values: list[int]):
+    rids = [SortableResourceId(value) for value in values]
+    assert sorted(map(str, rids)) == [str(rid) for rid in sorted(rids)]
+
+
+def test_alphabet_is_ascii_ordered():
+    assert list(ORDERED_ALPHABET) == sorted(ORDERED_ALPHABET)
+    assert len(set(ORDERED_ALPHABET)) == 62
+
+
+def test_bounds():
+    assert b62encode_ordered(0) == "0" * 22
+    assert b62encode_ordered(MAX_ID) == "7n42DGM5Tflk9n8mt7Fhc7"
+    with pytest.raises(ValueError):
+        b62encode_ordered(MAX_ID + 1)
+    with pytest.raises(ValueError):
+        b62encode_ordered(-1)
+
+
+def test_uuid_input():
+    value = UUID("8e2a4b5c-0d1e-4f2a-9b3c-4d5e6f708192")
+    assert b62encode_ordered(value) == str(SortableResourceId(value))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "47",  # a default-encoded id: too short to be unambiguous
+        "0" * 21,
+        "0" * 23,
+        "0" * 21 + "!",
+        "z" * 22,  # out of range
+    ],
+)
+def test_rejects(value: str):
+    assert not SortableResourceId.is_valid(value)
+    with pytest.raises(ValueError):
+        SortableResourceId(value)
+
+
+@given(st.text(alphabet="".join(ORDERED_ALPHABET) + "-!", max_size=23))
+def test_is_valid_agrees_with_constructor(value: str):
+    try:
+        SortableResourceId(value)
+    except ValueError:
+        accepted = False
+    else:
+        accepted = True
+    assert SortableResourceId.is_valid(value) == accepted
+
+
+def test_b62decode_ordered_rejects():
+    with pytest.raises(ValueError):
+        b62decode_ordered("47")
+    with pytest.raises(ValueError):
+        b62decode_ordered("0" * 21 + "-")
+
+
+def test_conversion_between_encodings():
+    value = 1000
+    rid = ResourceId(value)
+    sortable = SortableResourceId(rid)
+    assert str(rid) == "g8"
+    assert str(sortable) == "00000000000000000000G8"
+    # Neither copies the other's cached string.
+    assert str(ResourceId(sortable)) == "g8"
+    assert str(SortableResourceId(ResourceId("g8"))) == "00000000000000000000G8"
+    assert sortable == rid
+
+
+def test_str_input_is_reused():
+    encoded = b62encode_ordered(1000)
+    assert str(SortableResourceId(encoded)) is encoded
+
+
+def test_specialized_constructors():
+    rid = SortableResourceId(1000)
+    assert SortableResourceId.from_base62(str(rid)) == rid
+    assert SortableResourceId.from_str(str(rid.uuid)) == rid
+    assert type(SortableResourceId.from_int(1000)) is SortableResourceId
+    with pytest.raises(ValueError):
+        SortableResourceId.from_base62(str(ResourceId(1000)))
+    with pytest.raises(ValueError):
+        SortableResourceId.from_base62(str(rid.uuid))
+
+
+def test_from_str_cached_is_per_class():
+    encoded = b62encode_ordered(1000)
+    cached = SortableResourceId.from_str_cached(encoded)
+    assert type(cached) is SortableResourceId
+    assert SortableResourceId.from_str_cached(encoded) is cached
+
+
+def test_pickle():
+    rid = SortableResourceId(1000)
+    restored = pickle.loads(pickle.dumps(rid))
+    assert type(restored) is SortableResourceId
+    assert str(restored) == str(rid)
+
+
+def test_pydantic():
+    adapter = pydantic.TypeAdapter(SortableResourceId)
+    rid = SortableResourceId(1000)
+    assert adapter.validate_python(str(rid)) == rid
+    assert adapter.validate_json(f'"{rid}"') == rid
+    assert adapter.validate_json("1000") == rid
+    assert adapter.dump_json(rid) == f'"{rid}"'.encode()
+    with pytest.raises(pydantic.ValidationError):
+        adapter.validate_python("g8")
+    assert adapter.json_schema()["format"] == "sortable-resource-id"
+
+
+def test_pydantic_converts_other_encodings():
+    # A field keeps its own encoding, so dumped ids validate back to the value.
+    adapter = pydantic.TypeAdapter(ResourceId)
+    validated = adapter.validate_python(SortableResourceId(10))
+    assert type(validated) is ResourceId
+    assert adapter.validate_json(adapter.dump_json(validated)).value == 10
+    sortable = pydantic.TypeAdapter(SortableResourceId)
+    validated = sortable.validate_python(ResourceId(10))
+    assert type(validated) is SortableResourceId
+    assert validated == SortableResourceId(ResourceId(10))
@@ -0,0 +1,148 @@
+from uuid import UUID
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    select,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite  # noqa: E402
+from sqlalchemy.orm import (  # noqa: E402
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+)
+from sqlalchemy.schema import CreateTable  # noqa: E402
+
+from resource_id import ResourceId, SortableResourceId  # noqa: E402
+from resource_id.sqlalchemy import ResourceIdType  # noqa: E402
+
+metadata = MetaData()
+widget = Table(
+    "widget",
+    metadata,
+    Column("id", ResourceIdType, primary_key=True),
+    Column("parent_id", ResourceIdType, nullable=True),
+    Column("sortable_id", ResourceIdType(SortableResourceId), nullable=True),
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "dialect, column_type",
+    [
+        (postgresql.dialect(), "UUID"),
+        (mysql.dialect(), "BINARY(16)"),
+        (sqlite.dialect(), "BLOB"),
+    ],
+)
+def test_ddl(dialect, column_type: str):
+    ddl = str(CreateTable(widget).compile(dialect=dialect))
+    assert f"id {column_type} NOT NULL" in ddl
+
+
+def test_binary_bind_and_result():
+    rid = ResourceId(0xDEADBEEF)
+    column_type = ResourceIdType()
+    dialect = sqlite.dialect()
+    bind = column_type.bind_processor(dialect)
+    result = column_type.result_processor(dialect, None)
+    assert bind(rid) == rid.to_bytes()
+    assert result(rid.to_bytes()) == rid
+    assert bind(None) is None
+
+
+def test_native_bind_and_result():
+    rid = ResourceId(0xDEADBEEF)
+    column_type = ResourceIdType()
+    dialect = postgresql.dialect()
+    assert column_type.process_bind_param(rid, dialect) == rid.uuid
+    assert column_type.process_result_value(rid.uuid, dialect) == rid
+
+
+def test_round_trip(engine):
+    ids = ResourceId.generate_many(10)
+    with engine.begin() as conn:
+        conn.execute(widget.insert(), [{"id": rid} for rid in ids])
+        rows = conn.execute(select(widget.c.id).order_by(widget.c.id)).scalars()
+        assert list(rows) == sorted(ids)
+
+
+def test_accepts_resource_id_values(engine):
+    rid = ResourceId(0xDEADBEEF)
+    with engine.begin() as conn:
+        conn.execute(widget.insert(), {"id": rid.uuid, "parent_id": str(rid)})
+        for value in (rid, str(rid), rid.uuid, rid.value):
+            query = select(widget.c.parent_id).where(widget.c.id == value)
+            assert conn.execute(query).scalar_one() == rid
+
+
+def test_null(engine):
+    with engine.begin() as conn:
+        conn.execute(widget.insert(), {"id": ResourceId(1), "parent_id": None})
+        assert conn.execute(select(widget.c.parent_id)).scalar_one() is None
+
+
+def test_id_class(engine):
+    rid = SortableResourceId(0xDEADBEEF)
+    with engine.begin() as conn:
+        conn.execute(widget.insert(), {"id": rid, "sortable_id": str(rid)})
+        stored = conn.execute(select(widget.c.sortable_id)).scalar_one()
+    assert type(stored) is SortableResourceId
+    assert stored == rid
+    assert ResourceIdType(SortableResourceId).python_type is SortableResourceId
+
+
+def test_invalid_value(engine):
+    with engine.begin() as conn, pytest.raises(sqlalchemy.exc.StatementError):
+        conn.execute(widget.insert(), {"id": "oops!"})
+
+
+def test_binary_column_sorts_as_ids(engine):
+    values = [0, 1, 255, 256, 1 << 64, (1 << 128) - 1]
+    with engine.begin() as conn:
+        conn.execute(widget.insert(), [{"id": value} for value in reversed(values)])
+        query = select(widget.c.id).where(widget.c.id > 1).order_by(widget.c.id)
+        assert [rid.value for rid in conn.execute(query).scalars()] == values[2:]
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Gadget(Base):
+    __tablename__ = "gadget"
+
+    id: Mapped[ResourceId] = mapped_column(
+        ResourceIdType, primary_key=True, default=ResourceId
+    )
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+def test_orm():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        gadget = Gadget()
+        session.add(gadget)
+        session.commit()
+        rid = gadget.id
+        assert isinstance(rid, ResourceId)
+    with Session(engine) as session:
+        assert session.get(Gadget, rid).id == rid
+        assert session.get(Gadget, UUID(int=rid.value)).id == rid
+    engine.dispose()
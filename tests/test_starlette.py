@@ -0,0 +1,105 @@
+import re
+from uuid import UUID, uuid4
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+pytest.importorskip("starlette")
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import PlainTextResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from resource_id import ResourceId  # noqa: E402
+from resource_id.resource_id import ALPHABET, b62encode  # noqa: E402
+from resource_id.starlette import ResourceIdConvertor  # noqa: E402
+
+PATTERN = re.compile(ResourceIdConvertor.regex)
+MAX_ID = (1 << 128) - 1
+
+
+def _matches(value: str) -> bool:
+    return PATTERN.fullmatch(value) is not None
+
+
+@given(st.integers(min_value=0, max_value=MAX_ID))
+def test_regex_matches_every_id(value: int):
+    assert _matches(b62encode(value))
+    assert _matches(str(UUID(int=value)))
+    assert _matches(UUID(int=value).hex)
+
+
+@given(st.text(alphabet="".join(ALPHABET) + "-!/", min_size=0, max_size=23))
+def test_regex_agrees_with_is_valid(value: str):
+    assert _matches(value) == ResourceId.is_valid(value)
+
+
+def test_regex_range_boundary():
+    top = b62encode(MAX_ID)
+    assert _matches(top)
+    assert _matches(b62encode(MAX_ID - 1))
+    assert not _matches(b62encode(MAX_ID + 1))
+    assert not _matches(b62encode(1 << 129))
+    assert not _matches(top[:-1] + ALPHABET[ALPHABET.index(top[-1]) + 1])
+    # A leading zero keeps a full-width string in range.
+    assert _matches("0" + "Z" * 21)
+    assert not _matches("Z" * 22)
+
+
+@pytest.mark.parametrize("value", ["", "oops!", "a-b", "0" * 23, "g" * 32, "é"])
+def test_regex_rejects(value: str):
+    assert not _matches(value)
+
+
+def test_convert_and_to_string():
+    convertor = ResourceIdConvertor()
+    value = uuid4()
+    assert convertor.convert(str(value)) == ResourceId(value)
+    assert convertor.convert(value.hex) == ResourceId(value)
+    assert convertor.convert("47") == ResourceId(255)
+    assert convertor.to_string(ResourceId(255)) == "47"
+    assert convertor.to_string(value) == str(ResourceId(value))
+
+
+def _app() -> Starlette:
+    async def get_widget(request: Request) -> PlainTextResponse:
+        rid = request.path_params["rid"]
+        assert type(rid) is ResourceId
+        return PlainTextResponse(str(rid))
+
+    return Starlette(routes=[Route("/r/{rid:resourceid}", get_widget, name="widget")])
+
+
+def test_routing():
+    value = uuid4()
+    with TestClient(_app()) as client:
+        assert client.get("/r/47").text == "47"
+        assert client.get(f"/r/{value}").text == str(ResourceId(value))
+        assert client.get(f"/r/{value.hex}").text == str(ResourceId(value))
+
+
+@pytest.mark.parametrize("path", ["/r/oops!", "/r/a-b", f"/r/{b62encode(1 << 128)}"])
+def test_routing_rejects_at_the_router(path: str):
+    with TestClient(_app()) as client:
+        assert client.get(path).status_code == 404
+
+
+def test_url_path_for():
+    assert _app().url_path_for("widget", rid=ResourceId(255)) == "/r/47"
+
+
+def test_fastapi_path_param():
+    fastapi = pytest.importorskip("fastapi")
+    app = fastapi.FastAPI()
+
+    @app.get("/r/{rid:resourceid}")
+    async def get_widget(rid: ResourceId) -> str:
+        assert type(rid) is ResourceId
+        return str(rid)
+
+    with TestClient(app) as client:
+        assert client.get("/r/47").json() == "47"
+        assert client.get("/r/oops!").status_code == 404
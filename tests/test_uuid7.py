@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from resource_id import ResourceId, SortableResourceId
+from resource_id import uuid7 as uuid7_module
+from resource_id.uuid7 import uuid7
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[int]]:
+    now = [1_700_000_000_000 * 1_000_000]
+    monkeypatch.setattr(time, "time_ns", lambda: now[0])
+    uuid7_module._reset()  # pyright: ignore[reportPrivateUsage]
+    yield now
+    uuid7_module._reset()  # pyright: ignore[reportPrivateUsage]
+
+
+def test_layout():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after
+
+
+def test_monotonic():
+    values = [uuid7().int for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_monotonic_when_clock_stalls_or_steps_back(frozen_clock: list[int]):
+    first = uuid7()
+    second = uuid7()
+    frozen_clock[0] -= 5_000_000_000
+    third = uuid7()
+    assert first.int < second.int < third.int
+    assert first.int >> 80 == third.int >> 80
+
+
+def test_counter_overflow_advances_timestamp(frozen_clock: list[int]):
+    first = uuid7()
+    uuid7_module._counter = (1 << 42) - 1  # pyright: ignore[reportPrivateUsage]
+    second = uuid7()
+    assert second.int >> 80 == (first.int >> 80) + 1
+    assert second.version == 7
+
+
+def test_thread_safe():
+    results: list[list[int]] = [[] for _ in range(4)]
+
+    def generate(out: list[int]):
+        for _ in range(2_000):
+            out.append(uuid7().int)
+
+    threads = [threading.Thread(target=generate, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(out == sorted(out) for out in results)
+    merged = [value for out in results for value in out]
+    assert len(set(merged)) == len(merged)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_fork_does_not_repeat_ids(frozen_clock: list[int]):
+    uuid7()  # fill the randomness pool and set the counter
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        os.close(read_fd)
+        os.write(write_fd, uuid7().bytes)
+        os._exit(0)
+    os.close(write_fd)
+    child = UUID(bytes=os.read(read_fd, 16))
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert child != uuid7()
+
+
+def test_new_ordered():
+    ids = [ResourceId.new_ordered() for _ in range(100)]
+    assert all(type(rid) is ResourceId for rid in ids)
+    assert ids == sorted(ids)
+    assert ids[0].uuid.version == 7
+
+
+def test_uuid_gen_override():
+    class OrderedId(ResourceId):
+        uuid_gen = staticmethod(uuid7)
+
+    first, second = OrderedId(), OrderedId()
+    assert first.uuid.version == 7
+    assert first < second
+
+
+def _uuid6(ticks: int, clock_seq_and_node: int) -> UUID:
+    # RFC 9562 version 6: the 60-bit timestamp, high bits first.
+    return UUID(
+        int=(ticks >> 12) << 80
+        | 0x6 << 76
+        | (ticks & 0xFFF) << 64
+        | 0b10 << 62
+        | clock_seq_and_node & ((1 << 62) - 1)
+    )
+
+
+GREGORIAN_TICKS_AT_UNIX_EPOCH = 0x01B21DD213814000
+NOW = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+MS = timedelta(milliseconds=1)
+
+
+def test_time_bounds_contain_ids_of_their_millisecond(frozen_clock: list[int]):
+    frozen_clock[0] = int(NOW.timestamp()) * 10**9 + 123_456_000
+    ids = [ResourceId.new_ordered() for _ in range(100)]
+    low, high = ResourceId.min_for_time(NOW), ResourceId.max_for_time(NOW)
+    assert all(low <= rid <= high for rid in ids)
+    assert ResourceId.max_for_time(NOW - MS) < low
+    assert high < ResourceId.min_for_time(NOW + MS)
+
+
+def test_time_bounds_are_tight_v7():
+    low, high = ResourceId.min_for_time(NOW), ResourceId.max_for_time(NOW)
+    assert low.uuid.version == high.uuid.version == 7
+    assert low.uuid.variant == high.uuid.variant == "specified in RFC 4122"
+    assert low.value >> 80 == high.value >> 80 == 1714979289123
+    assert high.value - low.value == (0xFFF << 64) | ((1 << 62) - 1)
+
+
+def test_time_bounds_v6():
+    ticks = (
+        GREGORIAN_TICKS_AT_UNIX_EPOCH
+        + (NOW - datetime(1970, 1, 1, tzinfo=timezone.utc))
+        // timedelta(microseconds=1)
+        * 10
+    )
+    low = ResourceId.min_for_time(NOW, version=6)
+    high = ResourceId.max_for_time(NOW, version=6)
+    assert low == ResourceId(_uuid6(ticks, 0))
+    assert high == ResourceId(_uuid6(ticks, (1 << 62) - 1))
+    for node in (0, 12345, (1 << 62) - 1):
+        assert ResourceId(_uuid6(ticks - 1, node)) < low
+        assert low <= ResourceId(_uuid6(ticks, node)) <= high
+        assert high < ResourceId(_uuid6(ticks + 1, node))
+
+
+def test_time_bounds_accept_posix_seconds():
+    seconds = NOW.timestamp()
+    assert ResourceId.min_for_time(seconds) == ResourceId.min_for_time(NOW)
+    assert ResourceId.min_for_time(0).value == 0x7 << 76 | 0b10 << 62
+
+
+@pytest.mark.parametrize("seconds, ms", [(1.001, 1001), (0.3, 300), (2.675, 2675)])
+def test_time_bounds_float_seconds_on_a_millisecond(seconds: float, ms: int):
+    # Each float is a hair below its decimal value.
+    low = ResourceId.min_for_time(seconds)
+    assert low.value >> 80 == ms
+    assert ResourceId.max_for_time(seconds).value >> 80 == ms
+    assert low == ResourceId.min_for_time(datetime.fromtimestamp(seconds, timezone.utc))
+
+
+def test_time_bounds_v6_reject_float_seconds():
+    whole = NOW.replace(microsecond=0)
+    seconds = int(whole.timestamp())
+    assert ResourceId.min_for_time(seconds, version=6) == ResourceId.min_for_time(
+        whole, version=6
+    )
+    with pytest.raises(TypeError):
+        ResourceId.min_for_time(NOW.timestamp(), version=6)
+    with pytest.raises(TypeError):
+        ResourceId.max_for_time(float(seconds), version=6)
+
+
+@pytest.mark.parametrize(
+    "ts, version",
+    [
+        (datetime(2024, 1, 1), 7),  # naive
+        (NOW, 4),
+        (NOW, 1),
+        (-1.0, 7),
+        (datetime(1500, 1, 1, tzinfo=timezone.utc), 6),
+    ],
+)
+def test_time_bounds_reject(ts: Any, version: int):
+    with pytest.raises(ValueError):
+        ResourceId.min_for_time(ts, version=version)
+
+
+def test_time_bounds_keep_subclass_and_sort_as_strings():
+    low = SortableResourceId.min_for_time(NOW)
+    high = SortableResourceId.max_for_time(NOW)
+    assert type(low) is SortableResourceId
+    rid = SortableResourceId(ResourceId.min_for_time(NOW).value + 1)
+    assert str(low) < str(rid) < str(high)
+
+
+def test_timestamp():
+    rid = ResourceId.min_for_time(NOW)
+    assert rid.timestamp == NOW.replace(microsecond=123000)
+    assert ResourceId.new_ordered().timestamp.tzinfo is timezone.utc  # type: ignore[union-attr]
+    v6 = ResourceId.min_for_time(NOW, version=6)
+    assert v6.timestamp == NOW
+
+
+def test_timestamp_v1():
+    value = uuid.uuid1()
+    expected = datetime(1582, 10, 15, tzinfo=timezone.utc) + timedelta(
+        microseconds=value.time // 10
+    )
+    assert ResourceId(value).timestamp == expected
+
+
+def test_timestamp_absent():
+    assert ResourceId().timestamp is None
+    assert ResourceId(0).timestamp is None
+    # Version 7 nibble without the RFC variant bits.
+    assert ResourceId(0x7 << 76).timestamp is None
+    # A timestamp past datetime.max.
+    assert ResourceId(((1 << 48) - 1) << 80 | 0x7 << 76 | 0b10 << 62).timestamp is None